@@ -16,7 +16,18 @@ def _resolve_version() -> str:
         return _LOCAL_VERSION_FALLBACK
 
 
-__version__ = _resolve_version()
+def __getattr__(name: str) -> str:
+    """Resolve ``__version__`` on first access (PEP 562).
+
+    Reading distribution metadata is comparatively slow, so plain
+    ``import mcp_tap`` does not pay for it. The value is cached in the module
+    globals, so later lookups bypass this hook.
+    """
+    if name == "__version__":
+        resolved = _resolve_version()
+        globals()["__version__"] = resolved
+        return resolved
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
@@ -0,0 +1,42 @@
+"""Cached PATH lookups shared by installers, the healing fixer and the connection tester."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+
+# (command, PATH) -> resolved path, kept for the process lifetime. Only hits
+# are cached: a miss may be fixed mid-session by an install, and must not stick.
+_which_cache: dict[tuple[str, str | None], str] = {}
+
+
+def which(command: str, path: str | None = None) -> str | None:
+    """shutil.which() with a per-PATH cache of successful lookups.
+
+    *path* overrides the search path, as for shutil.which(); by default the
+    process PATH is searched.
+    """
+    key = (command, path if path is not None else os.environ.get("PATH"))
+    resolved = _which_cache.get(key)
+    if resolved is None:
+        resolved = shutil.which(command) if path is None else shutil.which(command, path=path)
+        if resolved is not None:
+            _which_cache[key] = resolved
+    return resolved
+
+
+async def which_async(command: str) -> str | None:
+    """Like which(), but a cache miss scans PATH in a worker thread."""
+    key = (command, os.environ.get("PATH"))
+    resolved = _which_cache.get(key)
+    if resolved is None:
+        resolved = await asyncio.to_thread(shutil.which, command)
+        if resolved is not None:
+            _which_cache[key] = resolved
+    return resolved
+
+
+def clear_which_cache() -> None:
+    """Forget every cached lookup."""
+    _which_cache.clear()
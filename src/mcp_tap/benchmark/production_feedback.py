@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
-import re
-import uuid
+import time
+from collections import Counter
 from collections.abc import Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
@@ -14,7 +15,7 @@ from hashlib import sha256
 from itertools import pairwise
 from pathlib import Path
 
-from mcp_tap import __version__
+import mcp_tap
 
 _OPT_IN_ENV = "MCP_TAP_TELEMETRY_OPT_IN"
 _FILE_ENV = "MCP_TAP_TELEMETRY_FILE"
@@ -27,6 +28,16 @@ _EVENT_IGNORED = "recommendation_ignored"
 _DECISION_EVENTS = frozenset({_EVENT_ACCEPTED, _EVENT_REJECTED, _EVENT_IGNORED})
 _ALL_EVENTS = frozenset({_EVENT_SHOWN, *_DECISION_EVENTS})
 
+# json.dumps() builds a fresh encoder whenever non-default options are passed;
+# reuse one compact encoder for every JSONL line instead.
+_JSONL_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Map every version separator to "." so one str.split() yields the parts.
+_VERSION_SEPARATORS = str.maketrans("-+", "..")
+
+# (unix second, "YYYY-MM-DDTHH:MM:SS") for the most recent timestamp formatted.
+_now_second_cache: tuple[int, str] = (-1, "")
+
 
 @dataclass(frozen=True, slots=True)
 class ShownRecommendation:
@@ -99,8 +110,13 @@ def default_events_path(env: Mapping[str, str] | None = None) -> Path:
     return Path.home() / ".mcp-tap" / "telemetry" / "recommendation_feedback.jsonl"
 
 
+@functools.lru_cache(maxsize=512)
 def project_fingerprint(project_path: str) -> str:
-    """Return a privacy-safe project fingerprint (no raw paths in telemetry)."""
+    """Return a privacy-safe project fingerprint (no raw paths in telemetry).
+
+    Memoized per input path: a session emits many events for the same project,
+    and resolving the path costs several filesystem syscalls.
+    """
     try:
         normalized = str(Path(project_path).expanduser().resolve())
     except Exception:
@@ -109,11 +125,23 @@ def project_fingerprint(project_path: str) -> str:
 
 
 def _now_iso() -> str:
-    return datetime.now(UTC).isoformat()
+    """Return the current UTC time as ISO 8601 with microseconds.
+
+    Events are emitted in bursts within the same second, so the date/time
+    prefix is formatted once per second and only the fraction changes.
+    """
+    global _now_second_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _now_second_cache
+    if seconds != cached_second:
+        prefix = datetime.fromtimestamp(seconds, UTC).strftime("%Y-%m-%dT%H:%M:%S")
+        _now_second_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}+00:00"
 
 
 def _new_id() -> str:
-    return uuid.uuid4().hex
+    # Same 32-hex-char shape as uuid4().hex, without building a UUID object.
+    return os.urandom(16).hex()
 
 
 def validate_event(event: FeedbackEvent) -> None:
@@ -134,6 +162,15 @@ def validate_event(event: FeedbackEvent) -> None:
     if event.event_type == _EVENT_SHOWN:
         if not event.recommendations:
             raise ValueError("recommendations_shown event requires recommendations.")
+        # Fast path: emitters number recommendations 1..N in order.
+        expected_rank = 1
+        for rec in event.recommendations:
+            if rec.rank != expected_rank:
+                break
+            expected_rank += 1
+        else:
+            return
+
         ranks = [rec.rank for rec in event.recommendations]
         if any(rank <= 0 for rank in ranks):
             raise ValueError("Recommendation rank must be > 0.")
@@ -186,17 +223,63 @@ def event_from_dict(data: dict[str, object]) -> FeedbackEvent:
     return event
 
 
+def _event_to_dict(event: FeedbackEvent) -> dict[str, object]:
+    """Build the JSON payload for one event.
+
+    Serializes to the same JSON as ``asdict(event)`` but skips its recursive
+    deep copy of every nested recommendation and the metadata dict.
+    """
+    return {
+        "event_type": event.event_type,
+        "event_id": event.event_id,
+        "timestamp": event.timestamp,
+        "release_version": event.release_version,
+        "query_id": event.query_id,
+        "project_fingerprint": event.project_fingerprint,
+        "client": event.client,
+        "server_name": event.server_name,
+        "rank": event.rank,
+        "off_intent": event.off_intent,
+        "recommendations": [
+            {
+                "server_name": rec.server_name,
+                "rank": rec.rank,
+                "source": rec.source,
+                "intent_gate_applied": rec.intent_gate_applied,
+            }
+            for rec in event.recommendations
+        ],
+        "metadata": event.metadata,
+    }
+
+
 def append_event(event: FeedbackEvent, *, env: Mapping[str, str] | None = None) -> bool:
     """Append one validated event to JSONL storage if telemetry is enabled."""
-    validate_event(event)
-    if not telemetry_enabled(env):
-        return False
+    return append_events((event,), env=env) == 1
+
+
+def append_events(
+    events: Sequence[FeedbackEvent],
+    *,
+    env: Mapping[str, str] | None = None,
+) -> int:
+    """Append validated events to JSONL storage with a single write.
 
+    All events are validated before anything is written, so one invalid event
+    leaves the file untouched. Returns the number of events persisted (0 when
+    telemetry is disabled).
+    """
+    for event in events:
+        validate_event(event)
+    if not events or not telemetry_enabled(env):
+        return 0
+
+    payload = "".join(_JSONL_ENCODER.encode(_event_to_dict(event)) + "\n" for event in events)
     path = default_events_path(env)
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(asdict(event), separators=(",", ":")) + "\n")
-    return True
+        handle.write(payload)
+    return len(events)
 
 
 def emit_recommendations_shown(
@@ -205,7 +288,7 @@ def emit_recommendations_shown(
     client: str,
     recommendations: Sequence[dict[str, object]],
     query_id: str = "",
-    release_version: str = __version__,
+    release_version: str = "",
     metadata: Mapping[str, str] | None = None,
     env: Mapping[str, str] | None = None,
 ) -> str:
@@ -235,7 +318,7 @@ def emit_recommendations_shown(
         event_type=_EVENT_SHOWN,
         event_id=_new_id(),
         timestamp=_now_iso(),
-        release_version=release_version,
+        release_version=release_version or mcp_tap.__version__,
         query_id=resolved_query_id,
         project_fingerprint=project_fingerprint(project_path),
         client=client,
@@ -256,7 +339,7 @@ def emit_recommendation_decision(
     client: str = "",
     rank: int | None = None,
     off_intent: bool = False,
-    release_version: str = __version__,
+    release_version: str = "",
     metadata: Mapping[str, str] | None = None,
     env: Mapping[str, str] | None = None,
 ) -> bool:
@@ -273,7 +356,7 @@ def emit_recommendation_decision(
         event_type=decision_type,
         event_id=_new_id(),
         timestamp=_now_iso(),
-        release_version=release_version,
+        release_version=release_version or mcp_tap.__version__,
         query_id=query_id or _new_id(),
         project_fingerprint=project_fingerprint(project_path or "unknown"),
         client=client or "unknown",
@@ -291,67 +374,64 @@ def load_feedback_events(path: Path, *, strict: bool = True) -> list[FeedbackEve
         return []
 
     events: list[FeedbackEvent] = []
-    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        if not line.strip():
-            continue
-        try:
-            payload = json.loads(line)
-            if not isinstance(payload, dict):
-                raise ValueError("event payload must be a JSON object.")
-            events.append(event_from_dict(payload))
-        except Exception as exc:
-            if strict:
-                raise ValueError(f"Invalid event at line {line_number}: {exc}") from exc
+    # Iterate the file lazily so large telemetry logs are never held in memory
+    # as one string, and strict mode stops reading at the first bad line.
+    with path.open("rb") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+                if not isinstance(payload, dict):
+                    raise ValueError("event payload must be a JSON object.")
+                events.append(event_from_dict(payload))
+            except Exception as exc:
+                if strict:
+                    raise ValueError(f"Invalid event at line {line_number}: {exc}") from exc
     return events
 
 
-def _metrics_for_queries(
-    shown_events: Sequence[FeedbackEvent],
-    decisions_by_query: Mapping[str, Sequence[FeedbackEvent]],
+def _score_shown(
+    shown: FeedbackEvent,
+    accepted_by_query: Mapping[str, set[str]],
     *,
     top_k: int,
-) -> tuple[float, float, float]:
-    if not shown_events:
+) -> tuple[int, int]:
+    """Score one shown query: (acceptance_hit, top_1_hit)."""
+    accepted_servers = accepted_by_query.get(shown.query_id)
+    if not accepted_servers:
+        return 0, 0
+
+    # Shown lists are short (~top_k items): one scan over them is cheaper than
+    # building a server -> rank dict per event.
+    acceptance_hit = 0
+    top_1_hit = 0
+    for item in shown.recommendations:
+        if item.server_name not in accepted_servers:
+            continue
+        if item.rank <= top_k:
+            acceptance_hit = 1
+        if item.rank == 1:
+            top_1_hit = 1
+            break
+    return acceptance_hit, top_1_hit
+
+
+def _rates_from_counts(counts: Sequence[int]) -> tuple[float, float, float]:
+    """Turn accumulated [queries, acceptance, top_1, rejected, off_intent] counts into rates."""
+    query_count, acceptance_hits, top_1_hits, rejected_total, off_intent_rejected = counts
+    if not query_count:
         return 0.0, 0.0, 0.0
 
-    acceptance_hits = 0
-    top_1_hits = 0
-    rejected_total = 0
-    off_intent_rejected = 0
-
-    for shown in shown_events:
-        rank_by_server = {item.server_name: item.rank for item in shown.recommendations}
-        decisions = list(decisions_by_query.get(shown.query_id, ()))
-
-        accepted_servers = {
-            decision.server_name
-            for decision in decisions
-            if decision.event_type == _EVENT_ACCEPTED and decision.server_name
-        }
-        if any(
-            rank_by_server.get(server_name, top_k + 1) <= top_k for server_name in accepted_servers
-        ):
-            acceptance_hits += 1
-
-        top_1_server = next(
-            (item.server_name for item in shown.recommendations if item.rank == 1),
-            "",
-        )
-        if top_1_server and top_1_server in accepted_servers:
-            top_1_hits += 1
-
-        rejected = [d for d in decisions if d.event_type == _EVENT_REJECTED]
-        rejected_total += len(rejected)
-        off_intent_rejected += sum(1 for d in rejected if d.off_intent)
-
-    acceptance = acceptance_hits / len(shown_events)
-    top_1 = top_1_hits / len(shown_events)
+    acceptance = acceptance_hits / query_count
+    top_1 = top_1_hits / query_count
     off_intent_rate = off_intent_rejected / rejected_total if rejected_total else 0.0
     return round(acceptance, 4), round(top_1, 4), round(off_intent_rate, 4)
 
 
+@functools.lru_cache(maxsize=256)
 def _version_sort_key(version: str) -> tuple[object, ...]:
-    parts = re.split(r"[.\-+]", version)
+    parts = version.translate(_VERSION_SEPARATORS).split(".")
     key: list[object] = []
     for part in parts:
         if part.isdigit():
@@ -373,32 +453,47 @@ def build_production_report(
         raise ValueError("top_k must be > 0.")
 
     shown_events = [event for event in events if event.event_type == _EVENT_SHOWN]
-    decisions_by_query: dict[str, list[FeedbackEvent]] = {}
+    # Decisions are the same for every release that shows a query, so reduce
+    # them to per-query lookups once instead of refiltering per shown event.
+    accepted_by_query: dict[str, set[str]] = {}
+    rejected_by_query: Counter[str] = Counter()
+    off_intent_by_query: Counter[str] = Counter()
     for event in events:
-        if event.event_type in _DECISION_EVENTS:
-            decisions_by_query.setdefault(event.query_id, []).append(event)
-
-    acceptance, top_1, off_intent = _metrics_for_queries(
-        shown_events,
-        decisions_by_query,
-        top_k=top_k,
-    )
-
-    by_version: dict[str, list[FeedbackEvent]] = {}
+        if event.event_type == _EVENT_ACCEPTED:
+            if event.server_name:
+                accepted_by_query.setdefault(event.query_id, set()).add(event.server_name)
+        elif event.event_type == _EVENT_REJECTED:
+            rejected_by_query[event.query_id] += 1
+            if event.off_intent:
+                off_intent_by_query[event.query_id] += 1
+
+    # Every shown event belongs to exactly one release, so accumulate per
+    # version only and derive the global totals from those buckets.
+    counts_by_version: dict[str, list[int]] = {}
     for shown in shown_events:
-        by_version.setdefault(shown.release_version, []).append(shown)
+        acceptance_hit, top_1_hit = _score_shown(shown, accepted_by_query, top_k=top_k)
+        counts = counts_by_version.get(shown.release_version)
+        if counts is None:
+            counts = counts_by_version[shown.release_version] = [0, 0, 0, 0, 0]
+        counts[0] += 1
+        counts[1] += acceptance_hit
+        counts[2] += top_1_hit
+        counts[3] += rejected_by_query[shown.query_id]
+        counts[4] += off_intent_by_query[shown.query_id]
+
+    totals = [0, 0, 0, 0, 0]
+    for counts in counts_by_version.values():
+        for index, value in enumerate(counts):
+            totals[index] += value
+    acceptance, top_1, off_intent = _rates_from_counts(totals)
 
     trends: list[VersionTrend] = []
-    for version, version_shown in by_version.items():
-        v_acceptance, v_top_1, v_off_intent = _metrics_for_queries(
-            version_shown,
-            decisions_by_query,
-            top_k=top_k,
-        )
+    for version, version_counts in counts_by_version.items():
+        v_acceptance, v_top_1, v_off_intent = _rates_from_counts(version_counts)
         trends.append(
             VersionTrend(
                 release_version=version,
-                query_count=len(version_shown),
+                query_count=version_counts[0],
                 acceptance_at_k=v_acceptance,
                 top_1_conversion=v_top_1,
                 off_intent_rejection_rate=v_off_intent,
@@ -469,13 +564,13 @@ def _format_report_text(report: ProductionQualityReport) -> str:
         f"status: {report.status.upper()}",
         "release trends:",
     ]
-    for trend in report.release_trends:
-        lines.append(
-            f"- {trend.release_version}: queries={trend.query_count}, "
-            f"acceptance={trend.acceptance_at_k:.3f}, "
-            f"top_1={trend.top_1_conversion:.3f}, "
-            f"off_intent_rejection={trend.off_intent_rejection_rate:.3f}"
-        )
+    lines.extend(
+        f"- {trend.release_version}: queries={trend.query_count}, "
+        f"acceptance={trend.acceptance_at_k:.3f}, "
+        f"top_1={trend.top_1_conversion:.3f}, "
+        f"off_intent_rejection={trend.off_intent_rejection_rate:.3f}"
+        for trend in report.release_trends
+    )
 
     if report.warnings:
         lines.append("warnings:")
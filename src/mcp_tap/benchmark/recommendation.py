@@ -5,15 +5,17 @@ from __future__ import annotations
 import argparse
 import asyncio
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from importlib.resources import files
 from pathlib import Path
-from statistics import mean
+from statistics import fmean
 
-from mcp_tap.models import MCPClient
+from mcp_tap.models import MCPClient, ProjectProfile
 from mcp_tap.scanner.detector import scan_project
 
 _DEFAULT_DATASET = "recommendation_dataset_v1.json"
+_MAX_CONCURRENT_SCANS = 8
+_ACCEPTED_LABELS: dict[bool | None, str] = {None: "n/a", True: "yes", False: "no"}
 
 
 @dataclass(frozen=True, slots=True)
@@ -25,6 +27,11 @@ class BenchmarkCase:
     client: MCPClient
     expected_servers: tuple[str, ...]
     top_k: int
+    expected_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Built once per case so evaluate_case does not rebuild it on every run.
+        object.__setattr__(self, "expected_set", frozenset(self.expected_servers))
 
 
 @dataclass(frozen=True, slots=True)
@@ -103,7 +110,7 @@ def load_cases(dataset_path: Path | None = None) -> tuple[str, list[BenchmarkCas
 def evaluate_case(actual_servers: list[str], case: BenchmarkCase) -> CaseResult:
     """Compute precision/acceptance for one benchmark case."""
     actual_top_k = tuple(actual_servers[: case.top_k])
-    expected_set = set(case.expected_servers)
+    expected_set = case.expected_set
 
     if not expected_set:
         precision = 1.0 if not actual_top_k else 0.0
@@ -138,15 +145,18 @@ def build_report(
     if not case_results:
         raise ValueError("Cannot build report with no case results.")
 
-    precision = mean(c.precision_at_k for c in case_results)
-
-    acceptance_inputs = [c.accepted_top_1 for c in case_results if c.accepted_top_1 is not None]
-    acceptance = mean(1.0 if v else 0.0 for v in acceptance_inputs) if acceptance_inputs else 1.0
+    precision = fmean(c.precision_at_k for c in case_results)
 
-    coverage_inputs = [c for c in case_results if c.expected_servers]
-    coverage = (
-        mean(1.0 if c.hit_count > 0 else 0.0 for c in coverage_inputs) if coverage_inputs else 1.0
-    )
+    accepted = judged = covered = with_expected = 0
+    for c in case_results:
+        if c.accepted_top_1 is not None:
+            judged += 1
+            accepted += c.accepted_top_1
+        if c.expected_servers:
+            with_expected += 1
+            covered += c.hit_count > 0
+    acceptance = accepted / judged if judged else 1.0
+    coverage = covered / with_expected if with_expected else 1.0
 
     failures: list[str] = []
     if precision < min_precision:
@@ -179,13 +189,29 @@ async def run_benchmark(
     dataset_name, cases = load_cases(dataset_path)
     root = (project_root or Path.cwd()).resolve()
 
-    case_results: list[CaseResult] = []
-    for case in cases:
+    # Scans are filesystem-bound and independent, so overlap them; gather()
+    # preserves dataset order in the results.
+    sem = asyncio.Semaphore(_MAX_CONCURRENT_SCANS)
+    # Cases that vary only expectations or top_k share one scan per
+    # (project, client) instead of rescanning the same fixture.
+    scans: dict[tuple[str, MCPClient], asyncio.Task[ProjectProfile]] = {}
+
+    async def _scan(project_path: str, client: MCPClient) -> ProjectProfile:
+        async with sem:
+            return await scan_project(project_path, client=client)
+
+    async def _run_case(case: BenchmarkCase) -> CaseResult:
         case_path = Path(case.project_path)
-        resolved_path = case_path if case_path.is_absolute() else root / case_path
-        profile = await scan_project(str(resolved_path), client=case.client)
+        resolved_path = str(case_path if case_path.is_absolute() else root / case_path)
+        key = (resolved_path, case.client)
+        scan = scans.get(key)
+        if scan is None:
+            scan = scans[key] = asyncio.create_task(_scan(resolved_path, case.client))
+        profile = await scan
         actual = [rec.server_name for rec in profile.recommendations]
-        case_results.append(evaluate_case(actual, case))
+        return evaluate_case(actual, case)
+
+    case_results = list(await asyncio.gather(*(_run_case(case) for case in cases)))
 
     return build_report(
         dataset=dataset_name,
@@ -210,14 +236,12 @@ def _format_report_text(report: BenchmarkReport) -> str:
         lines.extend(f"- {failure}" for failure in report.failures)
 
     lines.append("case details:")
-    for case in report.cases:
-        accepted = (
-            "n/a" if case.accepted_top_1 is None else ("yes" if case.accepted_top_1 else "no")
-        )
-        lines.append(
-            f"- {case.name}: precision={case.precision_at_k:.3f}, "
-            f"accepted_top_1={accepted}, top_k={list(case.actual_top_k)}"
-        )
+    lines.extend(
+        f"- {case.name}: precision={case.precision_at_k:.3f}, "
+        f"accepted_top_1={_ACCEPTED_LABELS[case.accepted_top_1]}, "
+        f"top_k={list(case.actual_top_k)}"
+        for case in report.cases
+    )
 
     return "\n".join(lines)
 
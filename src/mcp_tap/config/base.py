@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Protocol
 
@@ -66,6 +67,16 @@ class ConfigWriterPort(Protocol):
         """Add or update a server entry in the config file atomically."""
         ...
 
+    def write_servers_batch(
+        self,
+        config_path: Path | str,
+        entries: Mapping[str, ServerConfig],
+        *,
+        overwrite_existing: bool = False,
+    ) -> None:
+        """Add or update several server entries with a single atomic write."""
+        ...
+
     def remove_server_config(
         self,
         config_path: Path | str,
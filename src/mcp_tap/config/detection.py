@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
+import time
+from collections.abc import Callable, Mapping
 from pathlib import Path
 
 from mcp_tap.errors import ClientNotFoundError
 from mcp_tap.models import HTTP_NATIVE_CLIENTS, ConfigLocation, MCPClient
 
 # ─── User-scoped config paths ───────────────────────────────────
+# Home directory and platform env vars (XDG_CONFIG_HOME, APPDATA) do not change
+# during a process lifetime, so each path is computed once and memoized.
 
 
+@functools.cache
 def _claude_desktop_config() -> Path | None:
     home = Path.home()
     match sys.platform:
@@ -28,24 +34,29 @@ def _claude_desktop_config() -> Path | None:
     return None
 
 
+@functools.cache
 def _claude_code_user_config() -> Path:
     return Path.home() / ".claude.json"
 
 
+@functools.cache
 def _cursor_user_config() -> Path:
     return Path.home() / ".cursor" / "mcp.json"
 
 
+@functools.cache
 def _windsurf_user_config() -> Path:
     return Path.home() / ".codeium" / "windsurf" / "mcp_config.json"
 
 
-_CLIENT_CONFIGS: list[tuple[MCPClient, str, callable]] = [
-    (MCPClient.CLAUDE_DESKTOP, "user", _claude_desktop_config),
-    (MCPClient.CLAUDE_CODE, "user", _claude_code_user_config),
-    (MCPClient.CURSOR, "user", _cursor_user_config),
-    (MCPClient.WINDSURF, "user", _windsurf_user_config),
-]
+# Single lookup table shared by detection, per-client resolution, and "all";
+# insertion order is the auto-detect preference order.
+_USER_PATH_FNS: dict[MCPClient, Callable[[], Path | None]] = {
+    MCPClient.CLAUDE_DESKTOP: _claude_desktop_config,
+    MCPClient.CLAUDE_CODE: _claude_code_user_config,
+    MCPClient.CURSOR: _cursor_user_config,
+    MCPClient.WINDSURF: _windsurf_user_config,
+}
 
 # ─── Project-scoped config paths ────────────────────────────────
 
@@ -58,6 +69,56 @@ _PROJECT_CONFIGS: dict[MCPClient, str] = {
 }
 
 
+# ─── Existence cache ────────────────────────────────────────────
+# Detection runs on nearly every tool call; a short TTL keeps repeat lookups
+# from re-stat'ing the same handful of config files, including the project
+# configs that are usually absent. Writers invalidate entries via
+# invalidate_exists_cache() so a fresh write is observed immediately.
+# MCP_TAP_STAT_TTL overrides the TTL in seconds; 0 disables the cache.
+
+_STAT_TTL_ENV = "MCP_TAP_STAT_TTL"
+_DEFAULT_STAT_TTL_SECONDS = 2.0
+
+
+def _stat_ttl_from_env(env: Mapping[str, str] | None = None) -> float:
+    """Return the existence-cache TTL, falling back to the default on bad input."""
+    source = env if env is not None else os.environ
+    raw = source.get(_STAT_TTL_ENV, "").strip()
+    if not raw:
+        return _DEFAULT_STAT_TTL_SECONDS
+    try:
+        ttl = float(raw)
+    except ValueError:
+        return _DEFAULT_STAT_TTL_SECONDS
+    return ttl if ttl >= 0 else _DEFAULT_STAT_TTL_SECONDS
+
+
+_STAT_TTL_SECONDS = _stat_ttl_from_env()
+_stat_cache: dict[str, tuple[float, bool]] = {}
+
+
+def _cached_exists(path: Path) -> bool:
+    """Return ``path.exists()``, reusing a result younger than the TTL."""
+    if _STAT_TTL_SECONDS <= 0:
+        return path.exists()
+    key = str(path)
+    now = time.monotonic()
+    cached = _stat_cache.get(key)
+    if cached is not None and now - cached[0] < _STAT_TTL_SECONDS:
+        return cached[1]
+    exists = path.exists()
+    _stat_cache[key] = (now, exists)
+    return exists
+
+
+def invalidate_exists_cache(path: Path | str | None = None) -> None:
+    """Drop the cached existence result for *path*, or every entry if omitted."""
+    if path is None:
+        _stat_cache.clear()
+    else:
+        _stat_cache.pop(str(path), None)
+
+
 # ─── Public API ─────────────────────────────────────────────────
 
 
@@ -67,20 +128,7 @@ def detect_clients() -> list[ConfigLocation]:
     Returns:
         List of ConfigLocation entries for clients whose config files exist.
     """
-    found: list[ConfigLocation] = []
-    for client, scope, path_fn in _CLIENT_CONFIGS:
-        path = path_fn()
-        if path is not None:
-            exists = path.exists()
-            found.append(
-                ConfigLocation(
-                    client=client,
-                    path=str(path),
-                    scope=scope,
-                    exists=exists,
-                )
-            )
-    return [loc for loc in found if loc.exists]
+    return [loc for loc in _all_user_configs() if loc.exists]
 
 
 def resolve_config_path(
@@ -98,31 +146,13 @@ def resolve_config_path(
 
     Returns ConfigLocation even if the file doesn't exist yet (for first-time setup).
     """
-    client_enum = MCPClient(client) if isinstance(client, str) else client
-
-    if scope == "project":
-        return _resolve_project_config(client_enum, project_path)
-
-    path_map: dict[MCPClient, callable] = {
-        MCPClient.CLAUDE_DESKTOP: _claude_desktop_config,
-        MCPClient.CLAUDE_CODE: _claude_code_user_config,
-        MCPClient.CURSOR: _cursor_user_config,
-        MCPClient.WINDSURF: _windsurf_user_config,
-    }
-
-    path_fn = path_map.get(client_enum)
-    if path_fn is None:
-        raise ClientNotFoundError(f"Unknown MCP client: {client}")
-
-    path = path_fn()
-    if path is None:
-        raise ClientNotFoundError(f"{client_enum.value} is not supported on {sys.platform}")
-
+    is_project = scope == "project"
+    client_enum, path = _resolve_path(client, is_project, project_path if is_project else "")
     return ConfigLocation(
         client=client_enum,
         path=str(path),
-        scope="user",
-        exists=path.exists(),
+        scope="project" if is_project else "user",
+        exists=_cached_exists(path),
     )
 
 
@@ -161,7 +191,32 @@ def resolve_config_locations(
 # ─── Private helpers ────────────────────────────────────────────
 
 
-def _resolve_project_config(client: MCPClient, project_path: str) -> ConfigLocation:
+@functools.lru_cache(maxsize=128)
+def _resolve_path(
+    client: MCPClient | str, is_project: bool, project_path: str
+) -> tuple[MCPClient, Path]:
+    """Map (client, scope, project) to its config path.
+
+    Memoized because agents resolve the same few targets over and over. Only the
+    path is cached; existence is re-checked by the caller through _cached_exists.
+    Errors are raised, so they are never cached.
+    """
+    client_enum = MCPClient(client) if isinstance(client, str) else client
+
+    if is_project:
+        return client_enum, _project_config_path(client_enum, project_path)
+
+    path_fn = _USER_PATH_FNS.get(client_enum)
+    if path_fn is None:
+        raise ClientNotFoundError(f"Unknown MCP client: {client}")
+
+    path = path_fn()
+    if path is None:
+        raise ClientNotFoundError(f"{client_enum.value} is not supported on {sys.platform}")
+    return client_enum, path
+
+
+def _project_config_path(client: MCPClient, project_path: str) -> Path:
     """Resolve a project-scoped config path for a client."""
     if not project_path:
         raise ClientNotFoundError(
@@ -175,30 +230,29 @@ def _resolve_project_config(client: MCPClient, project_path: str) -> ConfigLocat
             f"{client.value} does not support project-scoped config. Use scope='user' instead."
         )
 
-    path = Path(project_path) / rel
-    return ConfigLocation(
-        client=client,
-        path=str(path),
-        scope="project",
-        exists=path.exists(),
-    )
+    return Path(project_path) / rel
 
 
 def _all_user_configs() -> list[ConfigLocation]:
     """Return user-scoped config locations for all known clients."""
-    locations: list[ConfigLocation] = []
-    for client, _scope, path_fn in _CLIENT_CONFIGS:
-        path = path_fn()
-        if path is not None:
-            locations.append(
-                ConfigLocation(
-                    client=client,
-                    path=str(path),
-                    scope="user",
-                    exists=path.exists(),
-                )
-            )
-    return locations
+    return [
+        ConfigLocation(client=client, path=path_str, scope="user", exists=_cached_exists(path))
+        for client, path, path_str in _user_config_paths()
+    ]
+
+
+@functools.cache
+def _user_config_paths() -> tuple[tuple[MCPClient, Path, str], ...]:
+    """Flatten _USER_PATH_FNS into (client, path, str(path)) for supported clients.
+
+    Built on first use rather than at import so Path.home() failures surface from
+    the tool call, not from importing the package.
+    """
+    return tuple(
+        (client, path, str(path))
+        for client, path_fn in _USER_PATH_FNS.items()
+        if (path := path_fn()) is not None
+    )
 
 
 def _all_project_configs(project_path: str) -> list[ConfigLocation]:
@@ -216,7 +270,7 @@ def _all_project_configs(project_path: str) -> list[ConfigLocation]:
                 client=client,
                 path=str(path),
                 scope="project",
-                exists=path.exists(),
+                exists=_cached_exists(path),
             )
         )
     return locations
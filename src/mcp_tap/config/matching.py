@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 
 from mcp_tap.models import HttpServerConfig, InstalledServer, LockedServer
 
@@ -17,8 +18,9 @@ def is_http_package_identifier(package_identifier: str) -> bool:
 def extract_http_url(args: Iterable[str]) -> str | None:
     """Return the first HTTP URL found in args."""
     for arg in args:
-        if str(arg).startswith(_HTTP_URL_PREFIXES):
-            return str(arg)
+        text = str(arg)
+        if text.startswith(_HTTP_URL_PREFIXES):
+            return text
     return None
 
 
@@ -62,63 +64,155 @@ def installed_matches_package_identifier(
     return installed.config.command == pkg_id or pkg_id in installed.config.args
 
 
+@dataclass(frozen=True, slots=True)
+class InstalledIndex:
+    """Lookup tables over installed servers, each bucket in original list order."""
+
+    by_name: dict[str, InstalledServer] = field(default_factory=dict)
+    by_identity: dict[str, list[InstalledServer]] = field(default_factory=dict)
+    by_url: dict[str, list[InstalledServer]] = field(default_factory=dict)
+
+
+def build_installed_index(installed_servers: list[InstalledServer]) -> InstalledIndex:
+    """Index installed servers by name, runtime identity tokens, and HTTP URL in one pass.
+
+    Identity tokens mirror installed_matches_package_identifier for non-URL
+    identifiers: the URL of an HTTP server, or the command and args of a stdio one.
+    """
+    index = InstalledIndex()
+    for server in installed_servers:
+        index.by_name.setdefault(server.name, server)
+
+        for token in _identity_tokens(server):
+            index.by_identity.setdefault(token, []).append(server)
+
+        url = installed_http_url(server)
+        if url is not None:
+            index.by_url.setdefault(url, []).append(server)
+    return index
+
+
+def _identity_tokens(server: InstalledServer) -> set[str]:
+    """Values a non-URL package identifier may equal to match *server*."""
+    if isinstance(server.config, HttpServerConfig):
+        return {server.config.url}
+    tokens = {server.config.command}
+    tokens.update(arg for arg in server.config.args if isinstance(arg, str))
+    return tokens
+
+
+def _first_unused(
+    candidates: list[InstalledServer] | None, used: set[str]
+) -> InstalledServer | None:
+    if candidates:
+        for server in candidates:
+            if server.name not in used:
+                return server
+    return None
+
+
 def find_matching_installed_server(
     locked_name: str,
     locked: LockedServer,
-    installed_servers: list[InstalledServer],
+    installed_servers: list[InstalledServer] | InstalledIndex,
     used_installed_names: set[str] | None = None,
 ) -> InstalledServer | None:
-    """Find installed server matching a lockfile entry by name, then canonical identity."""
-    used = used_installed_names or set()
+    """Find installed server matching a lockfile entry by name, then canonical identity.
 
-    by_name = next(
-        (s for s in installed_servers if s.name == locked_name and s.name not in used),
-        None,
+    Pass an InstalledIndex from build_installed_index() when matching many
+    lockfile entries against the same installed servers.
+    """
+    used = used_installed_names or set()
+    index = (
+        installed_servers
+        if isinstance(installed_servers, InstalledIndex)
+        else build_installed_index(installed_servers)
     )
-    if by_name is not None:
-        return by_name
+
+    if locked_name not in used:
+        by_name = index.by_name.get(locked_name)
+        if by_name is not None:
+            return by_name
 
     pkg_id = locked.package_identifier.strip()
     if pkg_id:
-        by_pkg = next(
-            (
-                s
-                for s in installed_servers
-                if s.name not in used and installed_matches_package_identifier(s, pkg_id)
-            ),
-            None,
-        )
+        table = index.by_url if is_http_package_identifier(pkg_id) else index.by_identity
+        by_pkg = _first_unused(table.get(pkg_id), used)
         if by_pkg is not None:
             return by_pkg
 
     url = locked_http_url(locked)
     if url:
-        return next(
-            (s for s in installed_servers if s.name not in used and installed_http_url(s) == url),
-            None,
-        )
+        return _first_unused(index.by_url.get(url), used)
 
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class LockedIndex:
+    """Lookup tables over lockfile entries; buckets hold (position, name, entry)."""
+
+    servers: dict[str, LockedServer]
+    by_package_identifier: dict[str, list[tuple[int, str, LockedServer]]] = field(
+        default_factory=dict
+    )
+    by_url: dict[str, list[tuple[int, str, LockedServer]]] = field(default_factory=dict)
+
+
+def build_locked_index(locked_servers: dict[str, LockedServer]) -> LockedIndex:
+    """Index lockfile entries by package identifier and HTTP URL in one pass."""
+    index = LockedIndex(servers=locked_servers)
+    for position, (name, locked) in enumerate(locked_servers.items()):
+        entry = (position, name, locked)
+        pkg_id = locked.package_identifier.strip()
+        if pkg_id:
+            index.by_package_identifier.setdefault(pkg_id, []).append(entry)
+        url = locked_http_url(locked)
+        if url:
+            index.by_url.setdefault(url, []).append(entry)
+    return index
+
+
 def find_matching_locked_server(
     installed: InstalledServer,
-    locked_servers: dict[str, LockedServer],
+    locked_servers: dict[str, LockedServer] | LockedIndex,
     used_locked_names: set[str] | None = None,
 ) -> tuple[str, LockedServer] | None:
-    """Find lockfile entry matching an installed server by name, then canonical identity."""
-    used = used_locked_names or set()
+    """Find lockfile entry matching an installed server by name, then canonical identity.
 
-    if installed.name in locked_servers and installed.name not in used:
-        return installed.name, locked_servers[installed.name]
-
-    for locked_name, locked in locked_servers.items():
-        if locked_name in used:
-            continue
-        if installed_matches_package_identifier(installed, locked.package_identifier):
-            return locked_name, locked
-        url = locked_http_url(locked)
-        if url and installed_http_url(installed) == url:
-            return locked_name, locked
+    Pass a LockedIndex from build_locked_index() when matching many installed
+    servers against the same lockfile.
+    """
+    used = used_locked_names or set()
+    index = (
+        locked_servers
+        if isinstance(locked_servers, LockedIndex)
+        else build_locked_index(locked_servers)
+    )
 
-    return None
+    if installed.name in index.servers and installed.name not in used:
+        return installed.name, index.servers[installed.name]
+
+    # URL-shaped identifiers only match the installed server's canonical URL,
+    # everything else matches its command/args (or URL for HTTP configs).
+    installed_url = installed_http_url(installed)
+    keys = {t for t in _identity_tokens(installed) if not t.startswith(_HTTP_URL_PREFIXES)}
+    if installed_url:
+        keys.add(installed_url)
+
+    buckets = [index.by_package_identifier.get(key) for key in keys]
+    if installed_url:
+        buckets.append(index.by_url.get(installed_url))
+
+    # Earliest lockfile entry wins, as in a front-to-back scan.
+    best: tuple[int, str, LockedServer] | None = None
+    for bucket in buckets:
+        for entry in bucket or ():
+            if entry[1] not in used:
+                if best is None or entry[0] < best[0]:
+                    best = entry
+                break
+
+    if best is None:
+        return None
+    return best[1], best[2]
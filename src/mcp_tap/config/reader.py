@@ -20,18 +20,28 @@ def read_config(config_path: Path | str) -> dict[str, object]:
     Returns the raw dict so the writer can round-trip unknown keys.
     Creates an empty {"mcpServers": {}} if the file doesn't exist.
     """
-    path = Path(config_path)
-    if not path.exists():
-        return {"mcpServers": {}}
+    return read_config_with_source(config_path)[0]
+
+
+def read_config_with_source(config_path: Path | str) -> tuple[dict[str, object], bytes]:
+    """Like read_config(), but also return the file bytes it parsed.
 
+    The bytes are empty when the file does not exist. The writer reuses them
+    to splice large files instead of reading the file a second time.
+    """
+    path = Path(config_path)
     try:
-        text = path.read_text(encoding="utf-8")
-        if not text.strip():
-            return {"mcpServers": {}}
-        data = json.loads(text)
+        # json.loads decodes bytes itself; isspace() stops at the first
+        # non-blank byte instead of copying the whole file like strip().
+        raw = path.read_bytes()
+        if not raw or raw.isspace():
+            return {"mcpServers": {}}, raw
+        data = json.loads(raw)
         if "mcpServers" not in data:
             data["mcpServers"] = {}
-        return data
+        return data, raw
+    except FileNotFoundError:
+        return {"mcpServers": {}}, b""
     except json.JSONDecodeError as exc:
         raise ConfigReadError(
             f"Invalid JSON in {path}: {exc}. Fix the JSON syntax or delete the file to start fresh."
@@ -54,23 +64,30 @@ def parse_servers(
     if not isinstance(servers_dict, dict):
         return []
 
+    # The raw dict comes straight from json.loads and is not shared, so JSON
+    # objects/arrays of the expected type are referenced rather than copied.
     result: list[InstalledServer] = []
     for name, entry in servers_dict.items():
         if not isinstance(entry, dict):
             continue
 
+        env = entry.get("env", {})
+        if type(env) is not dict:
+            env = dict(env)
+
         entry_type = str(entry.get("type", "stdio"))
         if "url" in entry and entry_type in ("http", "sse", "streamable-http"):
             config: ServerConfig | HttpServerConfig = HttpServerConfig(
                 url=str(entry["url"]),
                 transport_type="sse" if entry_type == "sse" else "http",
-                env=dict(entry.get("env", {})),
+                env=env,
             )
         else:
+            args = entry.get("args", [])
             config = ServerConfig(
                 command=str(entry.get("command", "")),
-                args=list(entry.get("args", [])),
-                env=dict(entry.get("env", {})),
+                args=args if type(args) is list else list(args),
+                env=env,
             )
         result.append(InstalledServer(name=name, config=config, source_file=source_file))
 
@@ -2,36 +2,54 @@
 
 Invariants:
   1. Existing server entries are NEVER modified or removed by configure.
-  2. Writes are atomic: write to unique temp file, then os.replace().
-  3. The full config dict is round-tripped -- unknown keys are preserved.
-  4. Concurrent writes are safe via threading.Lock (in-process) + fcntl.flock (cross-process).
+  2. Writes are atomic: write and fsync a unique temp file, then os.replace().
+  3. The full config dict is round-tripped -- unknown keys are preserved. Large files
+     keep their original text for every key except "mcpServers", which is spliced in.
+  4. Concurrent writes are safe via threading.Lock (in-process) + fcntl.flock on the
+     config's directory (cross-process), so no .lock sidecar file is left behind.
 """
 
 from __future__ import annotations
 
 import contextlib
-import fcntl
+import itertools
 import json
 import os
-import tempfile
+import re
 import threading
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 
-from mcp_tap.config.reader import read_config
+from mcp_tap.config.detection import invalidate_exists_cache
+from mcp_tap.config.reader import read_config_with_source
 from mcp_tap.errors import ConfigWriteError
 from mcp_tap.models import HttpServerConfig, ServerConfig
 
+# Below this size a full re-serialization is cheap; above it (Claude Code's
+# .claude.json grows with project history) only the mcpServers value is rewritten.
+_SPLICE_MIN_BYTES = 64 * 1024
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+_json_decoder = json.JSONDecoder()
+
+_tmp_counter = itertools.count()
+# Parent directories already created (or found) by this process.
+_ensured_dirs: set[str] = set()
+
 _path_locks: dict[str, threading.Lock] = {}
-_path_locks_guard = threading.Lock()
 
 
 def _get_path_lock(path: Path) -> threading.Lock:
-    """Get or create an in-process threading.Lock for *path*."""
-    key = str(path.resolve())
-    with _path_locks_guard:
-        if key not in _path_locks:
-            _path_locks[key] = threading.Lock()
-        return _path_locks[key]
+    """Get or create an in-process threading.Lock for *path*.
+
+    Keyed on the normalized absolute path: string work only, no resolve() syscalls.
+    """
+    key = os.path.normcase(os.path.abspath(path))
+    lock = _path_locks.get(key)
+    if lock is None:
+        # dict.setdefault is atomic under the GIL: racing threads may each build
+        # a Lock, but all of them get back the one that was stored first.
+        lock = _path_locks.setdefault(key, threading.Lock())
+    return lock
 
 
 def write_server_config(
@@ -42,41 +60,54 @@ def write_server_config(
     overwrite_existing: bool = False,
 ) -> None:
     """Add a server entry to the config file atomically."""
+    write_servers_batch(
+        config_path, {server_name: server_config}, overwrite_existing=overwrite_existing
+    )
+
+
+def write_servers_batch(
+    config_path: Path | str,
+    entries: Mapping[str, ServerConfig | HttpServerConfig],
+    *,
+    overwrite_existing: bool = False,
+) -> None:
+    """Add several server entries with one read-modify-write of the config file.
+
+    All-or-nothing: if any name already exists (and overwrite_existing is False),
+    nothing is written.
+    """
+    if not entries:
+        return
     path = Path(config_path)
     lock = _get_path_lock(path)
 
     with lock:
-        _locked_write(path, server_name, server_config, overwrite_existing=overwrite_existing)
+        _locked_write(path, entries, overwrite_existing=overwrite_existing)
 
 
 def _locked_write(
     path: Path,
-    server_name: str,
-    server_config: ServerConfig | HttpServerConfig,
+    entries: Mapping[str, ServerConfig | HttpServerConfig],
     *,
     overwrite_existing: bool = False,
 ) -> None:
-    """Read-modify-write under an inter-process file lock."""
-    lock_path = path.with_suffix(".lock")
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(lock_path, "w") as lock_fd:
-        fcntl.flock(lock_fd, fcntl.LOCK_EX)
-        try:
-            raw = read_config(path)
-            servers = raw.get("mcpServers", {})
+    """Read-modify-write under an inter-process directory lock."""
+    with _directory_lock(path):
+        raw, source = read_config_with_source(path)
+        servers = raw.get("mcpServers", {})
 
-            if server_name in servers and not overwrite_existing:
-                raise ConfigWriteError(
-                    f"Server '{server_name}' already exists in {path}. "
-                    "Use remove_server first, then configure again."
-                )
+        if not overwrite_existing:
+            for server_name in entries:
+                if server_name in servers:
+                    raise ConfigWriteError(
+                        f"Server '{server_name}' already exists in {path}. "
+                        "Use remove_server first, then configure again."
+                    )
 
+        for server_name, server_config in entries.items():
             servers[server_name] = server_config.to_dict()
-            raw["mcpServers"] = servers
-            _atomic_write(path, raw)
-        finally:
-            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        raw["mcpServers"] = servers
+        _atomic_write(path, raw, content=_render_servers_update(source, raw))
 
 
 def remove_server_config(
@@ -92,47 +123,147 @@ def remove_server_config(
 
 
 def _locked_remove(path: Path, server_name: str) -> dict[str, object] | None:
-    """Remove under an inter-process file lock."""
-    lock_path = path.with_suffix(".lock")
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    """Remove under an inter-process directory lock."""
+    with _directory_lock(path):
+        raw, source = read_config_with_source(path)
+        servers = raw.get("mcpServers", {})
+
+        removed = servers.pop(server_name, None)
+        if removed is not None:
+            raw["mcpServers"] = servers
+            _atomic_write(path, raw, content=_render_servers_update(source, raw))
+
+        return removed
 
-    with open(lock_path, "w") as lock_fd:
-        fcntl.flock(lock_fd, fcntl.LOCK_EX)
-        try:
-            raw = read_config(path)
-            servers = raw.get("mcpServers", {})
 
-            removed = servers.pop(server_name, None)
-            if removed is not None:
-                raw["mcpServers"] = servers
-                _atomic_write(path, raw)
+def _render_servers_update(source: bytes, data: dict[str, object]) -> str | None:
+    """Render *data* by splicing its mcpServers into *source*, the bytes it was parsed from.
+
+    Only valid when nothing but "mcpServers" changed. Returns None (full
+    re-serialization) for small or unusual files.
+    """
+    if len(source) < _SPLICE_MIN_BYTES:
+        return None
+    try:
+        text = source.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return _splice_mcp_servers(text, data.get("mcpServers", {}))
 
-            return removed
+
+def _splice_mcp_servers(text: str, servers: object) -> str | None:
+    """Replace the top-level "mcpServers" value in *text*, leaving siblings untouched.
+
+    Walks only the top-level keys (sibling values are skipped with the C
+    decoder), so a nested "mcpServers" such as Claude Code's per-project
+    entries is never matched. Returns None if the key is missing, duplicated,
+    or the document is not a single JSON object.
+    """
+    ws = _JSON_WS.match
+    span: tuple[int, int] | None = None
+    try:
+        idx = ws(text, 0).end()
+        if text[idx : idx + 1] != "{":
+            return None
+        idx = ws(text, idx + 1).end()
+        while text[idx : idx + 1] == '"':
+            key, idx = json.decoder.scanstring(text, idx + 1)
+            idx = ws(text, idx).end()
+            if text[idx : idx + 1] != ":":
+                return None
+            start = ws(text, idx + 1).end()
+            _value, end = _json_decoder.raw_decode(text, start)
+            if key == "mcpServers":
+                if span is not None:
+                    return None
+                span = (start, end)
+            idx = ws(text, end).end()
+            if text[idx : idx + 1] != ",":
+                break
+            idx = ws(text, idx + 1).end()
+    except json.JSONDecodeError:
+        return None
+    if span is None or text[idx : idx + 1] != "}" or text[idx + 1 :].strip():
+        return None
+
+    # JSON strings cannot contain raw newlines, so re-indenting line starts is safe.
+    rendered = json.dumps(servers, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+    return text[: span[0]] + rendered + text[span[1] :]
+
+
+def _ensure_parent(path: Path) -> None:
+    """Create *path*'s parent directory, skipping the mkdir once it is known to exist."""
+    key = str(path.parent)
+    if key not in _ensured_dirs:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+
+
+@contextlib.contextmanager
+def _directory_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive flock on *path*'s directory for a read-modify-write.
+
+    Locking the directory fd instead of a sidecar file saves an open/create per
+    write and leaves nothing behind next to the config.
+    """
+    import fcntl  # deferred: list/inspect-only processes never write configs
+
+    _ensure_parent(path)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except FileNotFoundError:
+        # Directory removed since it was cached as ensured; recreate once.
+        _ensured_dirs.discard(str(path.parent))
+        _ensure_parent(path)
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        fcntl.flock(dir_fd, fcntl.LOCK_EX)
+        try:
+            yield
         finally:
-            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            fcntl.flock(dir_fd, fcntl.LOCK_UN)
+    finally:
+        os.close(dir_fd)
+
+
+def _open_temp_file(path: Path) -> tuple[int, str]:
+    """Exclusively create a unique temp file next to *path*.
+
+    pid + a process-wide counter gives a unique name without mkstemp's
+    random-name generation; O_EXCL still guards against stale leftovers.
+    """
+    while True:
+        tmp_path = str(path.parent / f".{path.stem}_{os.getpid()}_{next(_tmp_counter)}.tmp")
+        try:
+            return os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), tmp_path
+        except FileExistsError:
+            continue
 
 
-def _atomic_write(path: Path, data: dict[str, object]) -> None:
-    """Write JSON atomically: write to unique temp file then rename."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+def _atomic_write(path: Path, data: dict[str, object], *, content: str | None = None) -> None:
+    """Write JSON atomically: write to unique temp file then rename.
+
+    *content*, when given, is written verbatim instead of serializing *data*.
+    """
+    _ensure_parent(path)
+    if content is None:
+        content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
 
     fd = None
     tmp_path: str | None = None
     try:
-        fd, tmp_path = tempfile.mkstemp(
-            dir=str(path.parent),
-            suffix=".tmp",
-            prefix=f".{path.stem}_",
-        )
-        content = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+        fd, tmp_path = _open_temp_file(path)
         os.write(fd, content.encode("utf-8"))
+        os.fsync(fd)
         os.close(fd)
         fd = None
         os.replace(tmp_path, str(path))
         tmp_path = None
+        invalidate_exists_cache(path)
     except PermissionError as exc:
         raise ConfigWriteError(f"Permission denied writing to {path}: {exc}") from exc
     except OSError as exc:
+        _ensured_dirs.discard(str(path.parent))
         raise ConfigWriteError(f"Failed to write {path}: {exc}") from exc
     finally:
         if fd is not None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Protocol
 
 from mcp_tap.models import ConnectionTestResult, ServerConfig
@@ -16,8 +17,23 @@ class ConnectionTesterPort(Protocol):
         config: ServerConfig,
         *,
         timeout_seconds: int = 15,
+        discover_tools: bool = True,
     ) -> ConnectionTestResult:
-        """Spawn an MCP server, connect via stdio, and call list_tools()."""
+        """Spawn an MCP server, connect via stdio, and call list_tools().
+
+        With discover_tools=False a cheaper ping is used and no tools are reported.
+        """
+        ...
+
+    async def test_server_connections(
+        self,
+        items: Sequence[tuple[str, ServerConfig]],
+        *,
+        concurrency: int = 5,
+        timeout_seconds: int = 15,
+        discover_tools: bool = True,
+    ) -> list[ConnectionTestResult]:
+        """Test several servers with bounded concurrency; results in input order."""
         ...
 
 
@@ -31,3 +47,11 @@ class HttpReachabilityPort(Protocol):
         *,
         timeout_seconds: int = 10,
     ) -> ConnectionTestResult: ...
+
+    async def check_many(
+        self,
+        items: Sequence[tuple[str, str]],
+        *,
+        concurrency: int = 10,
+        timeout_seconds: int = 10,
+    ) -> list[ConnectionTestResult]: ...
@@ -4,40 +4,105 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+from collections.abc import Sequence
 
 import httpx
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.shared.exceptions import McpError
 
+from mcp_tap._paths import which
 from mcp_tap.models import ConnectionTestResult, ServerConfig
 
 logger = logging.getLogger(__name__)
 
+# Each test spawns a server process; cap how many run at once in a batch.
+_MAX_CONCURRENT_TESTS = 5
+# HEAD probes are cheap; allow more in flight than process spawns.
+_MAX_CONCURRENT_HTTP_CHECKS = 10
+
 
 async def test_server_connection(
     server_name: str,
     config: ServerConfig,
     *,
     timeout_seconds: int = 15,
+    discover_tools: bool = True,
 ) -> ConnectionTestResult:
     """Spawn an MCP server, connect, call list_tools(), and shut down.
 
     This is the definitive test: if this passes, the server will work
     when the real MCP client runs it.
 
-    Uses ``asyncio.wait_for`` so that on timeout the inner coroutine
-    receives ``CancelledError``, triggering ``stdio_client.__aexit__``
-    cleanup of the spawned server process.
+    With ``discover_tools=False`` the liveness probe is an MCP ``ping``
+    instead of ``list_tools()`` (whose schemas can be tens of KB), and
+    ``tools_discovered`` is always empty -- even when a server without
+    ping support forces the ``list_tools()`` fallback.
     """
-    params = StdioServerParameters(
+    prepared = _prepare_params(server_name, config, timeout_seconds)
+    if isinstance(prepared, ConnectionTestResult):
+        return prepared
+    return await test_server_params(
+        server_name,
+        prepared,
+        timeout_seconds=timeout_seconds,
+        discover_tools=discover_tools,
+    )
+
+
+def _prepare_params(
+    server_name: str,
+    config: ServerConfig,
+    timeout_seconds: int,
+) -> StdioServerParameters | ConnectionTestResult:
+    """Validate *config* and build its spawn parameters, or return the failure."""
+    # Cheap rejections first: no timer, process, or PATH lookup for configs
+    # that cannot possibly connect.
+    if timeout_seconds <= 0:
+        return ConnectionTestResult(
+            success=False,
+            server_name=server_name,
+            error=f"timeout_seconds must be > 0 (got {timeout_seconds}).",
+        )
+    if not isinstance(config.command, str) or not config.command.strip():
+        return ConnectionTestResult(
+            success=False,
+            server_name=server_name,
+            error="Server config has no command to run. Set 'command' in the server config.",
+        )
+    if not _command_on_path(config):
+        return ConnectionTestResult(
+            success=False,
+            server_name=server_name,
+            error=f"Command not found: {config.command}. Is the package installed?",
+        )
+
+    return StdioServerParameters(
         command=config.command,
         args=config.args,
         env=config.env or None,
     )
 
+
+async def test_server_params(
+    server_name: str,
+    params: StdioServerParameters,
+    *,
+    timeout_seconds: int = 15,
+    discover_tools: bool = True,
+) -> ConnectionTestResult:
+    """Probe a server from prebuilt spawn parameters; the low-level entry point.
+
+    Performs no validation or PATH pre-flight -- test_server_connection does.
+
+    Uses ``asyncio.wait_for`` so that on timeout the inner coroutine
+    receives ``CancelledError``, triggering ``stdio_client.__aexit__``
+    cleanup of the spawned server process.
+    """
     try:
         return await asyncio.wait_for(
-            _run_connection_test(server_name, params),
+            _run_connection_test(server_name, params, discover_tools=discover_tools),
             timeout=timeout_seconds,
         )
     except TimeoutError:
@@ -70,6 +135,44 @@ async def test_server_connection(
         )
 
 
+def _command_on_path(config: ServerConfig) -> bool:
+    """Cheap pre-flight so a missing binary fails without spawning a process."""
+    search_path = (config.env or {}).get("PATH") or os.environ.get("PATH")
+    return which(config.command, path=search_path) is not None
+
+
+async def test_server_connections(
+    items: Sequence[tuple[str, ServerConfig]],
+    *,
+    concurrency: int = _MAX_CONCURRENT_TESTS,
+    timeout_seconds: int = 15,
+    discover_tools: bool = True,
+) -> list[ConnectionTestResult]:
+    """Test several servers concurrently, at most *concurrency* processes at a time.
+
+    Results are returned in input order. test_server_params never raises,
+    so one failing server does not affect the others. All configs are
+    validated up front, so pre-flight failures never wait for a slot.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+    prepared = [(name, _prepare_params(name, config, timeout_seconds)) for name, config in items]
+
+    async def _one(
+        server_name: str, params: StdioServerParameters | ConnectionTestResult
+    ) -> ConnectionTestResult:
+        if isinstance(params, ConnectionTestResult):
+            return params
+        async with sem:
+            return await test_server_params(
+                server_name,
+                params,
+                timeout_seconds=timeout_seconds,
+                discover_tools=discover_tools,
+            )
+
+    return list(await asyncio.gather(*(_one(name, params) for name, params in prepared)))
+
+
 class DefaultConnectionTester:
     """Adapter for ConnectionTesterPort."""
 
@@ -79,14 +182,38 @@ class DefaultConnectionTester:
         config: ServerConfig,
         *,
         timeout_seconds: int = 15,
+        discover_tools: bool = True,
     ) -> ConnectionTestResult:
         """Spawn an MCP server, connect via stdio, and call list_tools()."""
-        return await test_server_connection(server_name, config, timeout_seconds=timeout_seconds)
+        return await test_server_connection(
+            server_name,
+            config,
+            timeout_seconds=timeout_seconds,
+            discover_tools=discover_tools,
+        )
+
+    async def test_server_connections(
+        self,
+        items: Sequence[tuple[str, ServerConfig]],
+        *,
+        concurrency: int = _MAX_CONCURRENT_TESTS,
+        timeout_seconds: int = 15,
+        discover_tools: bool = True,
+    ) -> list[ConnectionTestResult]:
+        """Test several servers concurrently; results are in input order."""
+        return await test_server_connections(
+            items,
+            concurrency=concurrency,
+            timeout_seconds=timeout_seconds,
+            discover_tools=discover_tools,
+        )
 
 
 async def _run_connection_test(
     server_name: str,
     params: StdioServerParameters,
+    *,
+    discover_tools: bool = True,
 ) -> ConnectionTestResult:
     """Run the actual connection test inside ``stdio_client`` context.
 
@@ -98,7 +225,17 @@ async def _run_connection_test(
         ClientSession(read_stream, write_stream) as session,
     ):
         await session.initialize()
+        if not discover_tools:
+            try:
+                await session.send_ping()
+            except McpError:
+                logger.debug("'%s' rejected ping; probing with list_tools()", server_name)
+            else:
+                return ConnectionTestResult(success=True, server_name=server_name)
         tools_result = await session.list_tools()
+        if not discover_tools:
+            # list_tools() only stood in for ping; skip building the name list.
+            return ConnectionTestResult(success=True, server_name=server_name)
         tool_names = [t.name for t in tools_result.tools]
         return ConnectionTestResult(
             success=True,
@@ -118,6 +255,28 @@ class HttpReachabilityChecker:
     def __init__(self, http_client: httpx.AsyncClient) -> None:
         self._http = http_client
 
+    async def check_many(
+        self,
+        items: Sequence[tuple[str, str]],
+        *,
+        concurrency: int = _MAX_CONCURRENT_HTTP_CHECKS,
+        timeout_seconds: int = 10,
+    ) -> list[ConnectionTestResult]:
+        """Check several (server_name, url) pairs concurrently; results in input order.
+
+        Probes share the client's keep-alive pool, so repeated hosts skip the
+        TCP/TLS handshake.
+        """
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(server_name: str, url: str) -> ConnectionTestResult:
+            async with sem:
+                return await self.check_reachability(
+                    server_name, url, timeout_seconds=timeout_seconds
+                )
+
+        return list(await asyncio.gather(*(_one(name, url) for name, url in items)))
+
     async def check_reachability(
         self,
         server_name: str,
@@ -126,7 +285,11 @@ class HttpReachabilityChecker:
         timeout_seconds: int = 10,
     ) -> ConnectionTestResult:
         try:
-            resp = await self._http.head(url, timeout=float(timeout_seconds))
+            # Any status < 500 (3xx included) proves reachability, so following a
+            # redirect would only add a round-trip.
+            resp = await self._http.head(
+                url, timeout=float(timeout_seconds), follow_redirects=False
+            )
             reachable = resp.status_code < 500
             if reachable:
                 return ConnectionTestResult(
@@ -24,3 +24,10 @@ class GitHubMetadataPort(Protocol):
     ) -> MaturitySignals | None:
         """Fetch repository signals from GitHub's public API."""
         ...
+
+    async def fetch_repos_metadata(
+        self,
+        repository_urls: list[str],
+    ) -> dict[str, MaturitySignals | None]:
+        """Fetch signals for many repositories, keyed by input URL."""
+        ...
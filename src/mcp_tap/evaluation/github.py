@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import json
 import logging
 import os
 import re
 import subprocess
 import time
+import weakref
+from collections import OrderedDict
+from pathlib import Path
 
 import httpx
 
@@ -17,8 +24,16 @@ logger = logging.getLogger(__name__)
 
 # ─── In-memory LRU cache with TTL ──────────────────────────
 
-_cache: dict[str, tuple[float, MaturitySignals]] = {}
+_cache: OrderedDict[str, tuple[float, MaturitySignals]] = OrderedDict()
 _CACHE_TTL = 900  # 15 minutes
+_CACHE_MAXSIZE = 1024
+
+# Failed lookups (404, other errors) are remembered briefly so a dead or
+# moved repo is not re-probed on every search. Rate-limit responses are
+# transient and never cached here.
+_neg_cache: OrderedDict[str, float] = OrderedDict()
+_NEG_TTL = 300  # 5 minutes
+_RATE_LIMIT_STATUSES = frozenset({403, 429})
 
 # ─── Runtime state ─────────────────────────────────────────
 
@@ -30,23 +45,197 @@ _resolved_token_source: str = "none"  # env | gh_cli | none
 _logged_no_token_hint: bool = False
 _logged_gh_cli_auth_hint: bool = False
 _logged_rate_limit_hint: bool = False
+_cached_headers: dict[str, str] | None = None
+_cached_headers_token: str | None = None
+# "owner/repo" -> future for a fetch currently in progress
+_inflight: dict[str, asyncio.Future[MaturitySignals | None]] = {}
 
 
 def _cache_get(key: str) -> MaturitySignals | None:
     if key in _cache:
         ts, signals = _cache[key]
         if time.monotonic() - ts < _CACHE_TTL:
+            _cache.move_to_end(key)
             return signals
         del _cache[key]
     return None
 
 
 def _cache_set(key: str, signals: MaturitySignals) -> None:
-    _cache[key] = (time.monotonic(), signals)
+    _neg_cache.pop(key, None)
+    _memory_set(key, signals, time.monotonic())
+
+
+def _neg_cache_hit(key: str) -> bool:
+    ts = _neg_cache.get(key)
+    if ts is None:
+        return False
+    if time.monotonic() - ts < _NEG_TTL:
+        _neg_cache.move_to_end(key)
+        return True
+    del _neg_cache[key]
+    return False
+
+
+def _neg_cache_add(key: str) -> None:
+    _neg_cache[key] = time.monotonic()
+    _neg_cache.move_to_end(key)
+    while len(_neg_cache) > _CACHE_MAXSIZE:
+        _neg_cache.popitem(last=False)
+
+
+def _remember_failure(keys: list[str], status_code: int | None = None) -> None:
+    """Negative-cache *keys* unless the failure was a rate-limit response."""
+    if status_code in _RATE_LIMIT_STATUSES:
+        return
+    for key in keys:
+        _neg_cache_add(key)
+
+
+def _memory_set(key: str, signals: MaturitySignals, ts: float) -> None:
+    _cache[key] = (ts, signals)
+    _cache.move_to_end(key)
+    while len(_cache) > _CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+
+
+# ─── Persistent disk tier ──────────────────────────────────
+# Survives process restarts, so repeated CLI runs do not start cold against
+# the unauthenticated rate limit. One small JSON file per repo, stamped with
+# wall-clock time (monotonic clocks do not carry across processes). The fetch
+# path reads and writes it off the event loop, one worker-thread call per batch.
+# Expired and unreadable files are deleted when read, and every write prunes
+# the rest, so the directory never grows past one TTL's worth of repos.
+# The location is resolved once at import: a later XDG_CACHE_HOME change
+# does not move it.
+
+
+def _default_disk_cache_dir() -> Path | None:
+    try:
+        base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    except RuntimeError:  # no resolvable home directory
+        return None
+    return Path(base) / "mcp-tap" / "github"
+
+
+_DISK_CACHE_DIR: Path | None = _default_disk_cache_dir()
+
+
+def _disk_cache_path(key: str) -> Path | None:
+    if _DISK_CACHE_DIR is None:
+        return None
+    # Hashed so URL-derived owner/repo segments can never escape the directory.
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return _DISK_CACHE_DIR / f"{digest}.json"
+
+
+def _disk_get_many(keys: list[str]) -> dict[str, tuple[float, MaturitySignals]]:
+    """Return {key: (age_seconds, signals)} for the fresh on-disk entries among *keys*."""
+    found: dict[str, tuple[float, MaturitySignals]] = {}
+    now = time.time()
+    for key in keys:
+        path = _disk_cache_path(key)
+        if path is None:
+            break
+        try:
+            entry = json.loads(path.read_bytes())
+            age = now - float(entry["ts"])
+            if age >= _CACHE_TTL:
+                _disk_unlink(path)
+            elif age >= 0 and entry.get("key") == key:
+                found[key] = (age, MaturitySignals(**entry["signals"]))
+        except OSError:
+            continue
+        except (ValueError, KeyError, TypeError):
+            _disk_unlink(path)
+    return found
+
+
+def _disk_unlink(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        logger.debug("Could not remove GitHub cache entry %s", path, exc_info=True)
+
+
+def _disk_prune(cache_dir: Path, now: float) -> None:
+    """Delete entries written more than one TTL ago, including never-reread ones."""
+    try:
+        paths = list(cache_dir.glob("*.json"))
+    except OSError:
+        return
+    for path in paths:
+        try:
+            expired = now - path.stat().st_mtime >= _CACHE_TTL
+        except OSError:
+            continue
+        if expired:
+            _disk_unlink(path)
+
+
+def _disk_set_many(entries: dict[str, MaturitySignals]) -> None:
+    """Best-effort write-through; a read-only or full disk only loses persistence."""
+    if _DISK_CACHE_DIR is None or not entries:
+        return
+    try:
+        _DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        logger.debug("Could not create GitHub cache dir %s", _DISK_CACHE_DIR, exc_info=True)
+        return
+    now = time.time()
+    for key, signals in entries.items():
+        path = _disk_cache_path(key)
+        if path is None:
+            return
+        entry = {"key": key, "ts": now, "signals": dataclasses.asdict(signals)}
+        tmp = path.with_name(f".{path.stem}_{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            logger.debug("Could not persist GitHub cache entry for %s", key, exc_info=True)
+            tmp.unlink(missing_ok=True)
+    _disk_prune(_DISK_CACHE_DIR, now)
+
+
+async def _disk_load(keys: list[str]) -> dict[str, MaturitySignals]:
+    """Read *keys* from the disk tier in one worker-thread call and promote the hits."""
+    if _DISK_CACHE_DIR is None or not keys:
+        return {}
+    hits = await asyncio.to_thread(_disk_get_many, keys)
+    now = time.monotonic()
+    for key, (age, signals) in hits.items():
+        # Promote with the entry's real age so the disk TTL is not extended.
+        _memory_set(key, signals, now - age)
+    return {key: signals for key, (_age, signals) in hits.items()}
+
+
+async def _disk_store(entries: dict[str, MaturitySignals]) -> None:
+    """Persist freshly fetched *entries* in one worker-thread call."""
+    if _DISK_CACHE_DIR is None or not entries:
+        return
+    await asyncio.to_thread(_disk_set_many, entries)
+
+
+def clear_disk_cache() -> None:
+    """Delete every persisted GitHub metadata entry from the on-disk cache."""
+    if _DISK_CACHE_DIR is None:
+        return
+    try:
+        entries = list(_DISK_CACHE_DIR.glob("*.json"))
+    except OSError:
+        return
+    for entry in entries:
+        entry.unlink(missing_ok=True)
 
 
 def clear_cache() -> None:
-    """Clear in-memory cache plus auth/rate-limit runtime state (primarily for tests)."""
+    """Clear the in-memory caches plus auth/rate-limit runtime state (primarily for tests).
+
+    Persisted entries are left alone; clear_disk_cache() removes those.
+    """
+    global _cached_headers
+    global _cached_headers_token
     global _logged_gh_cli_auth_hint
     global _logged_no_token_hint
     global _logged_rate_limit_hint
@@ -56,6 +245,8 @@ def clear_cache() -> None:
     global _token_resolved
 
     _cache.clear()
+    _neg_cache.clear()
+    _inflight.clear()
     _rate_limit_reset = 0.0
     _token_resolved = False
     _resolved_token = None
@@ -63,6 +254,8 @@ def clear_cache() -> None:
     _logged_no_token_hint = False
     _logged_gh_cli_auth_hint = False
     _logged_rate_limit_hint = False
+    _cached_headers = None
+    _cached_headers_token = None
 
 
 # ─── Rate limit detection ──────────────────────────────────
@@ -77,22 +270,18 @@ def _check_rate_limit(resp: httpx.Response) -> None:
     global _logged_rate_limit_hint
     global _rate_limit_reset
 
+    # isdecimal() gates keep missing or malformed headers off the exception path.
     remaining = resp.headers.get("X-RateLimit-Remaining")
-    if remaining is None:
-        return
-    try:
-        remaining_value = int(remaining)
-    except ValueError:
-        return
-    if remaining_value != 0:
+    if remaining is None or not remaining.isdecimal() or int(remaining) != 0:
         return
 
-    reset_epoch = int(resp.headers.get("X-RateLimit-Reset", "0"))
+    reset_header = resp.headers.get("X-RateLimit-Reset", "0")
+    reset_epoch = int(reset_header) if reset_header.isdecimal() else 0
     _rate_limit_reset = time.monotonic() + max(0, reset_epoch - time.time())
 
     if _logged_rate_limit_hint:
         return
-    _, source = _resolve_github_token()
+    _, source = _known_github_token()
     source_hint = (
         "env GITHUB_TOKEN"
         if source == "env"
@@ -111,17 +300,25 @@ def _check_rate_limit(resp: httpx.Response) -> None:
 
 
 def _github_headers() -> dict[str, str]:
-    headers = {"Accept": "application/vnd.github+json"}
+    """Return request headers, rebuilt only when the resolved token changes.
+
+    The dict is shared between requests; httpx copies it, callers must not mutate it.
+    """
+    global _cached_headers
+    global _cached_headers_token
+
     token, _ = _resolve_github_token()
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    return headers
+    if _cached_headers is None or token != _cached_headers_token:
+        headers = {"Accept": "application/vnd.github+json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        _cached_headers = headers
+        _cached_headers_token = token
+    return _cached_headers
 
 
 def _resolve_github_token() -> tuple[str | None, str]:
     """Resolve auth token: env first, then `gh auth token` fallback."""
-    global _logged_gh_cli_auth_hint
-    global _logged_no_token_hint
     global _resolved_token
     global _resolved_token_source
     global _token_resolved
@@ -136,8 +333,30 @@ def _resolve_github_token() -> tuple[str | None, str]:
     if _token_resolved:
         return _resolved_token, _resolved_token_source
 
+    return _record_gh_cli_token(_resolve_gh_cli_token())
+
+
+def _known_github_token() -> tuple[str | None, str]:
+    """Return the env token or the memoized lookup, never spawning `gh`.
+
+    Before the first async resolution this reports no token; callers on the
+    event loop use it instead of _resolve_github_token, whose fallback blocks.
+    """
+    env_token = os.environ.get("GITHUB_TOKEN", "").strip()
+    if env_token:
+        return env_token, "env"
+    return _resolved_token, _resolved_token_source
+
+
+def _record_gh_cli_token(gh_token: str | None) -> tuple[str | None, str]:
+    """Memoize the `gh auth token` lookup result (hit or miss) and log once."""
+    global _logged_gh_cli_auth_hint
+    global _logged_no_token_hint
+    global _resolved_token
+    global _resolved_token_source
+    global _token_resolved
+
     _token_resolved = True
-    gh_token = _resolve_gh_cli_token()
     if gh_token:
         _resolved_token = gh_token
         _resolved_token_source = "gh_cli"
@@ -157,6 +376,48 @@ def _resolve_github_token() -> tuple[str | None, str]:
     return None, "none"
 
 
+async def _ensure_token_resolved() -> None:
+    """Resolve the auth token without blocking the event loop.
+
+    The first resolution may spawn `gh auth token`; it runs as an asyncio
+    subprocess so concurrent fetches keep making progress. Afterwards (hit or
+    miss) the result is memoized and _resolve_github_token stays cheap for
+    sync callers.
+    """
+    if _token_resolved or os.environ.get("GITHUB_TOKEN", "").strip():
+        return
+    async with _get_token_lock():
+        if not _token_resolved:
+            _record_gh_cli_token(await _resolve_gh_cli_token_async())
+
+
+async def _resolve_gh_cli_token_async() -> str | None:
+    """Async variant of _resolve_gh_cli_token for the fetch path."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "gh",
+            "auth",
+            "token",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=2)
+    except TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+        return None
+
+    if proc.returncode != 0:
+        return None
+    token = stdout.decode("utf-8", errors="replace").strip()
+    return token or None
+
+
 def _resolve_gh_cli_token() -> str | None:
     """Try to read a token from local GitHub CLI auth context."""
     try:
@@ -176,9 +437,13 @@ def _resolve_gh_cli_token() -> str | None:
     return token or None
 
 
-def github_runtime_status() -> dict[str, object]:
-    """Return auth/rate-limit runtime state for search result annotations."""
-    token, source = _resolve_github_token()
+async def github_runtime_status() -> dict[str, object]:
+    """Return auth/rate-limit runtime state for search result annotations.
+
+    The auth token is resolved off the event loop first if no fetch has done so yet.
+    """
+    await _ensure_token_resolved()
+    token, source = _known_github_token()
     rate_limited = _is_rate_limited()
     reset_seconds = int(max(0.0, _rate_limit_reset - time.monotonic())) if rate_limited else 0
     return {
@@ -190,25 +455,172 @@ def github_runtime_status() -> dict[str, object]:
 
 
 # ─── Concurrency control ──────────────────────────────────
+# asyncio primitives bind to the loop that first waits on them, so one
+# module-level instance breaks (or stops limiting) once a second loop runs,
+# e.g. repeated asyncio.run() calls. Each running loop gets its own.
+
+_MAX_CONCURRENT_REQUESTS = 5
 
-_github_semaphore = asyncio.Semaphore(5)
+_github_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+_token_locks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_github_semaphore() -> asyncio.Semaphore:
+    """Return the request semaphore for the running loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    sem = _github_semaphores.get(loop)
+    if sem is None:
+        sem = _github_semaphores[loop] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return sem
+
+
+def _get_token_lock() -> asyncio.Lock:
+    """Return the token-resolution lock for the running loop."""
+    loop = asyncio.get_running_loop()
+    lock = _token_locks.get(loop)
+    if lock is None:
+        lock = _token_locks[loop] = asyncio.Lock()
+    return lock
 
 
 # ─── URL parsing ───────────────────────────────────────────
 
+_GITHUB_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/.*)?$")
+
 
 def _parse_github_url(repository_url: str) -> tuple[str, str] | None:
     """Extract (owner, repo) from a GitHub URL.
 
     Returns None if the URL is not a GitHub repo.
     """
-    m = re.match(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/.*)?$", repository_url)
+    m = _GITHUB_URL_RE.match(repository_url)
     if m:
         return m.group(1), m.group(2)
     return None
 
 
-# ─── Main fetch function ──────────────────────────────────
+# ─── GraphQL batching ──────────────────────────────────────
+
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_GRAPHQL_BATCH_SIZE = 100  # stay well under GitHub's per-query node limit
+
+_REPO_FIELDS = """
+fragment RepoFields on Repository {
+  stargazerCount
+  forkCount
+  issues(states: OPEN) { totalCount }
+  pullRequests(states: OPEN) { totalCount }
+  pushedAt
+  isArchived
+  licenseInfo { spdxId }
+}
+"""
+
+
+def _build_graphql_query(repos: list[tuple[str, str]]) -> tuple[str, dict[str, str]]:
+    """Build one aliased query (r0, r1, ...) covering *repos*.
+
+    Owner/name are passed as variables, never interpolated into the query text.
+    """
+    params: list[str] = []
+    selections: list[str] = []
+    variables: dict[str, str] = {}
+    for i, (owner, repo) in enumerate(repos):
+        params.append(f"$o{i}: String!, $n{i}: String!")
+        selections.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoFields }}")
+        variables[f"o{i}"] = owner
+        variables[f"n{i}"] = repo
+    query = f"query({', '.join(params)}) {{\n  " + "\n  ".join(selections) + "\n}\n"
+    return query + _REPO_FIELDS, variables
+
+
+def _signals_from_graphql(node: dict[str, object]) -> MaturitySignals:
+    """Map a GraphQL Repository node to signals matching the REST shape.
+
+    REST open_issues_count includes open pull requests, so both are summed.
+    """
+    issues = (node.get("issues") or {}).get("totalCount")
+    pulls = (node.get("pullRequests") or {}).get("totalCount")
+    open_issues = None if issues is None else issues + (pulls or 0)
+    return MaturitySignals(
+        stars=node.get("stargazerCount"),
+        forks=node.get("forkCount"),
+        open_issues=open_issues,
+        last_commit_date=node.get("pushedAt"),
+        last_release_date=None,
+        is_official=False,  # Set by caller from registry data
+        is_archived=bool(node.get("isArchived", False)),
+        license=(node.get("licenseInfo") or {}).get("spdxId"),
+    )
+
+
+async def _fetch_graphql_batch(
+    repos: list[tuple[str, str]],
+    http_client: httpx.AsyncClient,
+) -> dict[str, MaturitySignals | None]:
+    """Fetch up to _GRAPHQL_BATCH_SIZE repos in one POST. Keys are "owner/repo"."""
+    results: dict[str, MaturitySignals | None] = {f"{o}/{r}": None for o, r in repos}
+    keys = list(results)
+    query, variables = _build_graphql_query(repos)
+
+    async with _get_github_semaphore():
+        try:
+            resp = await http_client.post(
+                _GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+                headers=_github_headers(),
+            )
+            _check_rate_limit(resp)
+            if resp.status_code != 200:
+                _remember_failure(keys, resp.status_code)
+                return results
+            payload = resp.json()
+        except (httpx.HTTPError, ValueError):
+            _remember_failure(keys)
+            return results
+
+    # Rate-limited lookups say nothing about the repos, so none are negative-cached.
+    rate_limited = _graphql_rate_limited(resp, payload)
+    data = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(data, dict):
+        # A 200 whose body is not a GraphQL result object (e.g. a proxy page
+        # or a bare list) carries nothing usable for any repo in the batch.
+        if not rate_limited:
+            _remember_failure(keys)
+        return results
+
+    # A missing/private repo yields null for its alias plus an "errors" entry;
+    # the rest of the batch is still valid.
+    for i, (owner, repo) in enumerate(repos):
+        node = data.get(f"r{i}")
+        cache_key = f"{owner}/{repo}"
+        if isinstance(node, dict):
+            signals = _signals_from_graphql(node)
+            _cache_set(cache_key, signals)
+            results[cache_key] = signals
+        elif not rate_limited:
+            _remember_failure([cache_key])
+    return results
+
+
+def _graphql_rate_limited(resp: httpx.Response, payload: object) -> bool:
+    """Whether a 200 GraphQL response was (partly) refused by the rate limiter.
+
+    GitHub reports this as a RATE_LIMITED entry in "errors", not as a 403.
+    """
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        return True
+    errors = payload.get("errors") if isinstance(payload, dict) else None
+    if not isinstance(errors, list):
+        return False
+    return any(isinstance(err, dict) and err.get("type") == "RATE_LIMITED" for err in errors)
+
+
+# ─── Main fetch functions ─────────────────────────────────
 
 
 class DefaultGitHubMetadata:
@@ -221,6 +633,12 @@ class DefaultGitHubMetadata:
         """Fetch repository metadata from GitHub's public API."""
         return await fetch_repo_metadata(repository_url, self._http)
 
+    async def fetch_repos_metadata(
+        self, repository_urls: list[str]
+    ) -> dict[str, MaturitySignals | None]:
+        """Fetch metadata for many repositories, batching API round-trips."""
+        return await fetch_repos_metadata(repository_urls, self._http)
+
 
 async def fetch_repo_metadata(
     repository_url: str,
@@ -233,43 +651,134 @@ async def fetch_repo_metadata(
     concurrency limiting (5 concurrent requests).
     Returns None if the URL is not a GitHub repo or the API fails.
     """
-    parsed = _parse_github_url(repository_url)
-    if not parsed:
-        return None
+    results = await fetch_repos_metadata([repository_url], http_client)
+    return results.get(repository_url)
 
-    owner, repo = parsed
-    cache_key = f"{owner}/{repo}"
 
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached
+async def fetch_repos_metadata(
+    repository_urls: list[str],
+    http_client: httpx.AsyncClient,
+) -> dict[str, MaturitySignals | None]:
+    """Fetch metadata for several repository URLs.
 
-    if _is_rate_limited():
-        return None
+    Cache hits are served locally. With an auth token, two or more misses are
+    fetched via GraphQL in batches of 100 (one round-trip per batch); GraphQL
+    requires auth, so without a token each miss falls back to a REST request.
+    Returns a mapping of every input URL to its signals (None when unavailable).
+    """
+    results: dict[str, MaturitySignals | None] = {}
+    misses: dict[str, list[str]] = {}  # "owner/repo" -> input URLs
+    for url in repository_urls:
+        if url in results:
+            continue
+        parsed = _parse_github_url(url)
+        if not parsed:
+            results[url] = None
+            continue
+        cache_key = f"{parsed[0]}/{parsed[1]}"
+        cached = _cache_get(cache_key)
+        results[url] = cached
+        if cached is None and not _neg_cache_hit(cache_key):
+            misses.setdefault(cache_key, []).append(url)
+
+    for cache_key, signals in (await _disk_load(list(misses))).items():
+        for url in misses.pop(cache_key):
+            results[url] = signals
+
+    if not misses or _is_rate_limited():
+        return results
+
+    await _ensure_token_resolved()
+
+    # Coalesce with fetches already in flight for the same repo, so concurrent
+    # callers share one request instead of racing on the cache miss.
+    loop = asyncio.get_running_loop()
+    waiting = {key: _inflight[key] for key in misses if key in _inflight}
+    owned = {key: loop.create_future() for key in misses if key not in waiting}
+    _inflight.update(owned)
+
+    fetched: dict[str, MaturitySignals | None] = {}
+    try:
+        if owned:
+            fetched = await _fetch_uncached(list(owned), http_client)
+    finally:
+        for key, fut in owned.items():
+            if _inflight.get(key) is fut:
+                del _inflight[key]
+            if not fut.done():
+                fut.set_result(fetched.get(key))
+    await _disk_store({key: sig for key in owned if (sig := fetched.get(key)) is not None})
+    for key, fut in waiting.items():
+        fetched[key] = await asyncio.shield(fut)
+
+    for cache_key, urls in misses.items():
+        for url in urls:
+            results[url] = fetched.get(cache_key)
+    return results
+
+
+async def _fetch_uncached(
+    keys: list[str],
+    http_client: httpx.AsyncClient,
+) -> dict[str, MaturitySignals | None]:
+    """Fetch "owner/repo" *keys* via GraphQL batches (authenticated) or REST."""
+    repos = [tuple(key.split("/", 1)) for key in keys]
+    fetched: dict[str, MaturitySignals | None] = {}
+    if len(repos) > 1 and _resolve_github_token()[0]:
+        batches = [
+            repos[i : i + _GRAPHQL_BATCH_SIZE] for i in range(0, len(repos), _GRAPHQL_BATCH_SIZE)
+        ]
+        for batch_result in await asyncio.gather(
+            *(_fetch_graphql_batch(batch, http_client) for batch in batches)
+        ):
+            fetched.update(batch_result)
+    else:
+        signals_list = await asyncio.gather(
+            *(_fetch_repo_rest(owner, repo, http_client) for owner, repo in repos)
+        )
+        fetched = {f"{o}/{r}": sig for (o, r), sig in zip(repos, signals_list, strict=True)}
+    return fetched
 
+
+async def _fetch_repo_rest(
+    owner: str,
+    repo: str,
+    http_client: httpx.AsyncClient,
+) -> MaturitySignals | None:
+    """Fetch one repository via REST ``GET /repos/{owner}/{repo}``."""
     api_url = f"https://api.github.com/repos/{owner}/{repo}"
 
-    async with _github_semaphore:
+    cache_key = f"{owner}/{repo}"
+    async with _get_github_semaphore():
         try:
             resp = await http_client.get(api_url, headers=_github_headers())
             _check_rate_limit(resp)
 
             if resp.status_code != 200:
+                _remember_failure([cache_key], resp.status_code)
                 return None
 
             data = resp.json()
-            signals = MaturitySignals(
-                stars=data.get("stargazers_count"),
-                forks=data.get("forks_count"),
-                open_issues=data.get("open_issues_count"),
-                last_commit_date=data.get("pushed_at"),
-                last_release_date=None,  # Would need a separate API call
-                is_official=False,  # Set by caller from registry data
-                is_archived=data.get("archived", False),
-                license=(data.get("license") or {}).get("spdx_id"),
-            )
-
-            _cache_set(cache_key, signals)
-            return signals
-        except httpx.HTTPError:
+        except (httpx.HTTPError, ValueError):
+            _remember_failure([cache_key])
             return None
+
+    if not isinstance(data, dict):
+        # Same as a GraphQL batch: a 200 that is not a repository object only
+        # fails this repo, never the rest of the search.
+        _remember_failure([cache_key])
+        return None
+    license_info = data.get("license")
+    signals = MaturitySignals(
+        stars=data.get("stargazers_count"),
+        forks=data.get("forks_count"),
+        open_issues=data.get("open_issues_count"),
+        last_commit_date=data.get("pushed_at"),
+        last_release_date=None,  # Would need a separate API call
+        is_official=False,  # Set by caller from registry data
+        is_archived=data.get("archived", False),
+        license=license_info.get("spdx_id") if isinstance(license_info, dict) else None,
+    )
+
+    _cache_set(cache_key, signals)
+    return signals
@@ -8,28 +8,19 @@ from datetime import UTC, datetime
 from mcp_tap.models import MaturityScore, MaturitySignals
 
 
-def _days_since(iso_date: str | None) -> int | None:
-    """Calculate days since an ISO 8601 date string. Returns None on failure."""
+def _days_since(iso_date: str | None, now: datetime) -> int | None:
+    """Calculate days from an ISO 8601 date string to *now*. Returns None on failure."""
     if not iso_date:
         return None
     try:
         dt = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
-        return (datetime.now(tz=UTC) - dt).days
+        return (now - dt).days
     except (ValueError, TypeError):
         return None
 
 
-def _star_score(stars: int | None) -> float:
-    """Score based on star count (log scale, max 0.2)."""
-    if not stars or stars <= 0:
-        return 0.0
-    # log10(1)=0, log10(100)=2, log10(1000)=3, log10(5000)≈3.7
-    return min(math.log10(stars) / 18.5, 0.2)
-
-
-def _activity_score(last_commit_date: str | None) -> float:
-    """Score based on recency of last commit (max 0.3)."""
-    days = _days_since(last_commit_date)
+def _activity_score(days: int | None) -> float:
+    """Score based on days since the last commit (max 0.3)."""
     if days is None:
         return 0.0
     if days <= 30:
@@ -66,19 +57,18 @@ def score_maturity(signals: MaturitySignals) -> MaturityScore:
         score += 0.3
         reasons.append("Official MCP server")
 
-    # Stars
-    star_pts = _star_score(signals.stars)
-    score += star_pts
-    if signals.stars and signals.stars > 0:
-        if signals.stars >= 1000:
-            reasons.append(f"{signals.stars / 1000:.1f}k stars")
+    # Stars (log scale, max 0.2): log10(100)=2, log10(1000)=3, log10(5000)≈3.7
+    stars = signals.stars
+    if stars and stars > 0:
+        score += min(math.log10(stars) / 18.5, 0.2)
+        if stars >= 1000:
+            reasons.append(f"{stars / 1000:.1f}k stars")
         else:
-            reasons.append(f"{signals.stars} stars")
+            reasons.append(f"{stars} stars")
 
-    # Activity
-    activity_pts = _activity_score(signals.last_commit_date)
-    score += activity_pts
-    days = _days_since(signals.last_commit_date)
+    # Activity -- the commit date is parsed once for both points and reason
+    days = _days_since(signals.last_commit_date, datetime.now(tz=UTC))
+    score += _activity_score(days)
     if days is not None:
         if days <= 30:
             reasons.append(f"Active development (last commit {days}d ago)")
@@ -21,9 +21,10 @@ def classify_error(error: ConnectionTestResult) -> DiagnosisResult:
     """
     text = error.error
     lower = text.lower()
+    category = _keyword_category(lower)
 
     # ── Command not found ────────────────────────────────────
-    if _matches_any(lower, ("command not found", "filenotfounderror", "enoent")):
+    if category is ErrorCategory.COMMAND_NOT_FOUND:
         command = _extract_command(text)
         return DiagnosisResult(
             category=ErrorCategory.COMMAND_NOT_FOUND,
@@ -40,7 +41,7 @@ def classify_error(error: ConnectionTestResult) -> DiagnosisResult:
         )
 
     # ── Permission denied ────────────────────────────────────
-    if _matches_any(lower, ("permission denied", "eacces")):
+    if category is ErrorCategory.PERMISSION_DENIED:
         return DiagnosisResult(
             category=ErrorCategory.PERMISSION_DENIED,
             original_error=text,
@@ -58,7 +59,7 @@ def classify_error(error: ConnectionTestResult) -> DiagnosisResult:
         )
 
     # ── Connection refused ───────────────────────────────────
-    if _matches_any(lower, ("connection refused", "econnrefused")):
+    if category is ErrorCategory.CONNECTION_REFUSED:
         return DiagnosisResult(
             category=ErrorCategory.CONNECTION_REFUSED,
             original_error=text,
@@ -76,7 +77,7 @@ def classify_error(error: ConnectionTestResult) -> DiagnosisResult:
         )
 
     # ── Timeout ──────────────────────────────────────────────
-    if _matches_any(lower, ("did not respond within", "timeouterror")):
+    if category is ErrorCategory.TIMEOUT:
         return DiagnosisResult(
             category=ErrorCategory.TIMEOUT,
             original_error=text,
@@ -90,7 +91,7 @@ def classify_error(error: ConnectionTestResult) -> DiagnosisResult:
         )
 
     # ── Auth failed ──────────────────────────────────────────
-    if _matches_any(lower, ("401", "403", "authentication", "unauthorized", "auth")):
+    if category is ErrorCategory.AUTH_FAILED:
         return DiagnosisResult(
             category=ErrorCategory.AUTH_FAILED,
             original_error=text,
@@ -107,8 +108,8 @@ def classify_error(error: ConnectionTestResult) -> DiagnosisResult:
         )
 
     # ── Missing env var ──────────────────────────────────────
-    if _looks_like_env_var_error(text, lower):
-        var_name = _extract_env_var(text)
+    var_name = _missing_env_var(text, lower)
+    if var_name is not None:
         hint = f" ({var_name})" if var_name else ""
         return DiagnosisResult(
             category=ErrorCategory.MISSING_ENV_VAR,
@@ -138,6 +139,31 @@ def classify_error(error: ConnectionTestResult) -> DiagnosisResult:
 
 # ─── Helpers ─────────────────────────────────────────────────
 
+# Keyword -> category, flattened in priority order: every keyword of an earlier
+# category is tried before any of a later one, so the first hit decides.
+_KEYWORD_CATEGORIES: tuple[tuple[str, ErrorCategory], ...] = tuple(
+    (keyword, category)
+    for category, keywords in (
+        (ErrorCategory.COMMAND_NOT_FOUND, ("command not found", "filenotfounderror", "enoent")),
+        (ErrorCategory.PERMISSION_DENIED, ("permission denied", "eacces")),
+        (ErrorCategory.CONNECTION_REFUSED, ("connection refused", "econnrefused")),
+        (ErrorCategory.TIMEOUT, ("did not respond within", "timeouterror")),
+        (
+            ErrorCategory.AUTH_FAILED,
+            ("401", "403", "authentication", "unauthorized", "auth"),
+        ),
+    )
+    for keyword in keywords
+)
+
+
+def _keyword_category(lower: str) -> ErrorCategory | None:
+    """Return the highest-priority category whose keyword appears in *lower*."""
+    for keyword, category in _KEYWORD_CATEGORIES:
+        if keyword in lower:
+            return category
+    return None
+
 
 def _matches_any(text: str, patterns: tuple[str, ...]) -> bool:
     """Return True if any pattern appears in text."""
@@ -145,41 +171,38 @@ def _matches_any(text: str, patterns: tuple[str, ...]) -> bool:
 
 
 _ENV_VAR_RE = re.compile(r"[A-Z][A-Z0-9_]{2,}")
+_ENV_ERROR_KEYWORDS = ("not set", "missing", "required")
 
 
-def _has_env_var_pattern(text: str) -> bool:
-    """Return True if text contains something that looks like an env var name."""
-    return bool(_ENV_VAR_RE.search(text))
-
-
-def _looks_like_env_var_error(text: str, lower: str) -> bool:
-    """Return True if the error looks related to a missing env var.
+def _missing_env_var(text: str, lower: str) -> str | None:
+    """Return the env var name if the error looks like a missing env var, else None.
 
     Matches when keywords (not set / missing / required) are present AND
     either an explicit env var name exists or the phrase "environment variable"
-    appears in the message.
+    appears in the message. The name is "" when only the phrase matched; the
+    single regex search serves both the check and the extraction.
     """
-    keywords = ("not set", "missing", "required")
-    if not _matches_any(lower, keywords):
-        return False
-    return _has_env_var_pattern(text) or "environment variable" in lower
+    if not _matches_any(lower, _ENV_ERROR_KEYWORDS):
+        return None
+    match = _ENV_VAR_RE.search(text)
+    if match:
+        return match.group(0)
+    return "" if "environment variable" in lower else None
 
 
-def _extract_env_var(text: str) -> str:
-    """Extract the most likely env var name from an error message."""
-    match = _ENV_VAR_RE.search(text)
-    return match.group(0) if match else ""
+# One pass over the text; the leftmost of the three message shapes wins. The
+# quoted name excludes quotes: with \S+ a run of quotes backtracks cubically.
+_COMMAND_RE = re.compile(
+    r"Command not found:\s*(?P<cnf>\S+)"
+    r"|FileNotFoundError.*?'(?P<fnf>[^']+)'"
+    r"|'(?P<quoted>[^\s']+)'.*not found",
+    re.IGNORECASE,
+)
 
 
 def _extract_command(text: str) -> str:
     """Extract the command name from a 'not found' error message."""
-    # Pattern: "Command not found: <command>"
-    for pattern in (
-        r"Command not found:\s*(\S+)",
-        r"FileNotFoundError.*?'([^']+)'",
-        r"'(\S+)'.*not found",
-    ):
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1)
-    return "unknown"
+    match = _COMMAND_RE.search(text)
+    if match is None:
+        return "unknown"
+    return match.group("cnf") or match.group("fnf") or match.group("quoted")
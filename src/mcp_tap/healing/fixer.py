@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import shutil
+from collections.abc import Callable
 from dataclasses import replace
 
+from mcp_tap._paths import which as _which
 from mcp_tap.models import (
     CandidateFix,
     DiagnosisResult,
@@ -12,6 +13,9 @@ from mcp_tap.models import (
     ServerConfig,
 )
 
+# Runners and interpreters that are never wrapped in another runner.
+_RUNNER_COMMANDS = frozenset({"npx", "uvx", "node", "python", "python3"})
+
 
 def generate_fix(
     diagnosis: DiagnosisResult,
@@ -30,79 +34,18 @@ def generate_fix(
     Returns:
         A CandidateFix describing the proposed remedy.
     """
-    category = diagnosis.category
-
-    if category == ErrorCategory.COMMAND_NOT_FOUND:
-        return _fix_command_not_found(current_config)
-
-    if category == ErrorCategory.TIMEOUT:
-        return _fix_timeout(current_config)
-
-    if category == ErrorCategory.TRANSPORT_MISMATCH:
-        return _fix_transport_mismatch(current_config)
-
-    if category == ErrorCategory.CONNECTION_REFUSED:
-        return CandidateFix(
-            description=(
-                "The backing service is not reachable. Verify that the "
-                "service (database, API, etc.) is running and the port in "
-                "the server config matches the actual service port."
-            ),
-            requires_user_action=True,
-        )
-
-    if category == ErrorCategory.AUTH_FAILED:
-        return CandidateFix(
-            description=(
-                "Authentication failed. Check that all API keys and "
-                "credentials in the server's env vars are correct and "
-                "not expired."
-            ),
-            env_var_hint=(
-                "Review the env vars configured for this server. Ensure each key/token is valid."
-            ),
-            requires_user_action=True,
-        )
-
-    if category == ErrorCategory.MISSING_ENV_VAR:
-        return CandidateFix(
-            description=(
-                "A required environment variable is missing. Set it in "
-                "the server's env config or pass it via env_vars when "
-                "calling configure_server."
-            ),
-            env_var_hint=diagnosis.suggested_fix,
-            requires_user_action=True,
-        )
-
-    if category == ErrorCategory.PERMISSION_DENIED:
-        return CandidateFix(
-            description=(
-                "Permission denied. Check file permissions on the server "
-                "binary and ensure it is executable. For npm global packages, "
-                "consider using --prefix ~/.local."
-            ),
-            requires_user_action=True,
-        )
-
-    # UNKNOWN
-    return CandidateFix(
-        description=(
-            f"Unrecognized error: {diagnosis.original_error}. Manual investigation is needed."
-        ),
-        requires_user_action=True,
-    )
+    return _FIX_BUILDERS.get(diagnosis.category, _fix_unknown)(diagnosis, current_config)
 
 
 # ─── Auto-fix strategies ────────────────────────────────────
 
 
-def _fix_command_not_found(config: ServerConfig) -> CandidateFix:
+def _fix_command_not_found(_diagnosis: DiagnosisResult, config: ServerConfig) -> CandidateFix:
     """Try to resolve the command via full path lookup or alternative runner."""
     command = config.command
 
     # Try full path resolution
-    full_path = shutil.which(command)
+    full_path = _which(command)
     if full_path and full_path != command:
         new_config = replace(config, command=full_path)
         return CandidateFix(
@@ -111,9 +54,9 @@ def _fix_command_not_found(config: ServerConfig) -> CandidateFix:
         )
 
     # If the command is a direct binary name (not npx/uvx), try wrapping it
-    if command not in ("npx", "uvx", "node", "python", "python3"):
+    if command not in _RUNNER_COMMANDS:
         # Try npx wrapper
-        npx_path = shutil.which("npx")
+        npx_path = _which("npx")
         if npx_path:
             new_args = ["-y", command, *config.args]
             new_config = replace(config, command=npx_path, args=new_args)
@@ -123,7 +66,7 @@ def _fix_command_not_found(config: ServerConfig) -> CandidateFix:
             )
 
         # Try uvx wrapper
-        uvx_path = shutil.which("uvx")
+        uvx_path = _which("uvx")
         if uvx_path:
             new_args = [command, *config.args]
             new_config = replace(config, command=uvx_path, args=new_args)
@@ -143,7 +86,7 @@ def _fix_command_not_found(config: ServerConfig) -> CandidateFix:
     )
 
 
-def _fix_timeout(config: ServerConfig) -> CandidateFix:
+def _fix_timeout(_diagnosis: DiagnosisResult, config: ServerConfig) -> CandidateFix:
     """Suggest retrying with an increased timeout."""
     return CandidateFix(
         description=(
@@ -155,7 +98,7 @@ def _fix_timeout(config: ServerConfig) -> CandidateFix:
     )
 
 
-def _fix_transport_mismatch(config: ServerConfig) -> CandidateFix:
+def _fix_transport_mismatch(_diagnosis: DiagnosisResult, config: ServerConfig) -> CandidateFix:
     """Add --stdio flag if not present."""
     if "--stdio" not in config.args:
         new_args = [*config.args, "--stdio"]
@@ -172,3 +115,86 @@ def _fix_transport_mismatch(config: ServerConfig) -> CandidateFix:
         ),
         requires_user_action=True,
     )
+
+
+# ─── User-action guidance ───────────────────────────────────
+
+# Fixed guidance needs no per-call state, so each is built once at import.
+_CONNECTION_REFUSED_FIX = CandidateFix(
+    description=(
+        "The backing service is not reachable. Verify that the "
+        "service (database, API, etc.) is running and the port in "
+        "the server config matches the actual service port."
+    ),
+    requires_user_action=True,
+)
+
+_AUTH_FAILED_FIX = CandidateFix(
+    description=(
+        "Authentication failed. Check that all API keys and "
+        "credentials in the server's env vars are correct and "
+        "not expired."
+    ),
+    env_var_hint=(
+        "Review the env vars configured for this server. Ensure each key/token is valid."
+    ),
+    requires_user_action=True,
+)
+
+_PERMISSION_DENIED_FIX = CandidateFix(
+    description=(
+        "Permission denied. Check file permissions on the server "
+        "binary and ensure it is executable. For npm global packages, "
+        "consider using --prefix ~/.local."
+    ),
+    requires_user_action=True,
+)
+
+
+def _fix_connection_refused(_diagnosis: DiagnosisResult, _config: ServerConfig) -> CandidateFix:
+    """Ask the user to start or point at the backing service."""
+    return _CONNECTION_REFUSED_FIX
+
+
+def _fix_auth_failed(_diagnosis: DiagnosisResult, _config: ServerConfig) -> CandidateFix:
+    """Ask the user to check the server's credentials."""
+    return _AUTH_FAILED_FIX
+
+
+def _fix_permission_denied(_diagnosis: DiagnosisResult, _config: ServerConfig) -> CandidateFix:
+    """Ask the user to fix permissions on the server binary."""
+    return _PERMISSION_DENIED_FIX
+
+
+def _fix_missing_env_var(diagnosis: DiagnosisResult, _config: ServerConfig) -> CandidateFix:
+    """Ask the user to set the missing env var named in the diagnosis."""
+    return CandidateFix(
+        description=(
+            "A required environment variable is missing. Set it in "
+            "the server's env config or pass it via env_vars when "
+            "calling configure_server."
+        ),
+        env_var_hint=diagnosis.suggested_fix,
+        requires_user_action=True,
+    )
+
+
+def _fix_unknown(diagnosis: DiagnosisResult, _config: ServerConfig) -> CandidateFix:
+    """Fallback guidance for errors no strategy recognizes."""
+    return CandidateFix(
+        description=(
+            f"Unrecognized error: {diagnosis.original_error}. Manual investigation is needed."
+        ),
+        requires_user_action=True,
+    )
+
+
+_FIX_BUILDERS: dict[ErrorCategory, Callable[[DiagnosisResult, ServerConfig], CandidateFix]] = {
+    ErrorCategory.COMMAND_NOT_FOUND: _fix_command_not_found,
+    ErrorCategory.TIMEOUT: _fix_timeout,
+    ErrorCategory.TRANSPORT_MISMATCH: _fix_transport_mismatch,
+    ErrorCategory.CONNECTION_REFUSED: _fix_connection_refused,
+    ErrorCategory.AUTH_FAILED: _fix_auth_failed,
+    ErrorCategory.MISSING_ENV_VAR: _fix_missing_env_var,
+    ErrorCategory.PERMISSION_DENIED: _fix_permission_denied,
+}
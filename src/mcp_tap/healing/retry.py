@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Coroutine
-from typing import Any
+from typing import Protocol
 
 from mcp_tap.connection.base import ConnectionTesterPort
 from mcp_tap.connection.tester import test_server_connection
@@ -12,6 +11,7 @@ from mcp_tap.healing.classifier import classify_error
 from mcp_tap.healing.fixer import generate_fix
 from mcp_tap.models import (
     ConnectionTestResult,
+    ErrorCategory,
     HealingAttempt,
     HealingResult,
     ServerConfig,
@@ -22,8 +22,18 @@ logger = logging.getLogger(__name__)
 # Escalating timeouts for retry attempts
 _TIMEOUT_ESCALATION = (15, 30, 60)
 
-# Type alias for a connection tester callable
-TesterFn = Callable[..., Coroutine[Any, Any, ConnectionTestResult]]
+
+class TesterFn(Protocol):
+    """A connection tester callable, e.g. test_server_connection."""
+
+    async def __call__(
+        self,
+        server_name: str,
+        config: ServerConfig,
+        *,
+        timeout_seconds: int = 15,
+        discover_tools: bool = True,
+    ) -> ConnectionTestResult: ...
 
 
 async def _heal_loop(
@@ -90,13 +100,14 @@ async def _heal_loop(
             current_config = fix.new_config
 
         # Determine timeout: escalate for TIMEOUT category, else use provided
-        timeout = _resolve_timeout(diagnosis.category.value, attempt_num, timeout_seconds)
+        timeout = _resolve_timeout(diagnosis.category, attempt_num, timeout_seconds)
 
-        # 5. Re-validate
+        # 5. Re-validate (liveness only; callers re-test for tools once healed)
         result = await tester_fn(
             server_name,
             current_config,
             timeout_seconds=timeout,
+            discover_tools=False,
         )
 
         attempts.append(
@@ -196,9 +207,8 @@ class DefaultHealingOrchestrator:
         )
 
 
-def _resolve_timeout(category: str, attempt_number: int, base_timeout: int) -> int:
+def _resolve_timeout(category: ErrorCategory, attempt_number: int, base_timeout: int) -> int:
     """Pick a timeout value, escalating for timeout-class errors."""
-    if category == "timeout":
-        idx = min(attempt_number - 1, len(_TIMEOUT_ESCALATION) - 1)
-        return _TIMEOUT_ESCALATION[idx]
+    if category is ErrorCategory.TIMEOUT:
+        return _TIMEOUT_ESCALATION[min(attempt_number, len(_TIMEOUT_ESCALATION)) - 1]
     return base_timeout
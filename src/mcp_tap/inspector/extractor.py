@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import bisect
 import re
+from collections.abc import Iterator
 
 from mcp_tap.models import ConfigHints, EnvVarHint
 
@@ -10,12 +12,15 @@ from mcp_tap.models import ConfigHints, EnvVarHint
 
 _CODE_BLOCK_RE = re.compile(r"```[a-z]*\n(.*?)```", re.DOTALL)
 
-_ENV_VAR_RE = re.compile(r"\b([A-Z][A-Z0-9_]{2,})\b")
+# An env var looks like a whole uppercase word of 4+ chars with an underscore, so
+# acronyms such as API, HTTP or README never match. Possessive runs: when the
+# trailing \b fails (e.g. "FOO_BARbaz") no shorter run can succeed either.
+_ENV_VAR_RE = re.compile(r"\b(?=[A-Z0-9_]{4})([A-Z][A-Z0-9]*+_[A-Z0-9_]*+)\b")
 
+# Command patterns are lowercase literals run against lowered code blocks, which
+# keeps sre's literal-prefix search that re.IGNORECASE disables.
 _INSTALL_CMD_RE = re.compile(
-    r"(?:npm\s+install|npx\s+-y|pip\s+install|uvx|docker\s+run|docker\s+pull)"
-    r"[^\n]*",
-    re.IGNORECASE,
+    r"(?:npm\s+install|npx\s+-y|pip\s+install|uvx|docker\s+run|docker\s+pull)[^\n]*"
 )
 
 _TRANSPORT_RE = re.compile(
@@ -23,16 +28,10 @@ _TRANSPORT_RE = re.compile(
     re.IGNORECASE,
 )
 
-_SERVER_CMD_RE = re.compile(
-    r"(?:npx\s+-y|uvx|python\s+-m|node\s+)[^\n]+",
-    re.IGNORECASE,
-)
+_SERVER_CMD_RE = re.compile(r"(?:npx\s+-y|uvx|python\s+-m|node\s+)[^\n]+")
 
-# JSON config blocks that look like MCP config
-_JSON_CONFIG_RE = re.compile(
-    r'\{[^}]*"command"[^}]*\}',
-    re.DOTALL,
-)
+# Prose lines that make an uppercase name worth reporting
+_ENV_KEYWORD_RE = re.compile(r"env|variable|token|key", re.IGNORECASE)
 
 # Words that suggest an env var is required
 _REQUIRED_KEYWORDS = re.compile(
@@ -40,112 +39,91 @@ _REQUIRED_KEYWORDS = re.compile(
     re.IGNORECASE,
 )
 
-# Common non-env-var uppercase words to filter out
-_IGNORE_VARS = frozenset(
-    {
-        "README",
-        "MCP",
-        "API",
-        "URL",
-        "JSON",
-        "HTTP",
-        "HTTPS",
-        "SSH",
-        "GET",
-        "POST",
-        "PUT",
-        "DELETE",
-        "HEAD",
-        "OPTIONS",
-        "PATCH",
-        "TRUE",
-        "FALSE",
-        "NULL",
-        "ENV",
-        "VAR",
-        "CLI",
-        "SDK",
-        "NPM",
-        "NPX",
-        "PIP",
-        "UVX",
-        "DOCKER",
-        "GIT",
-        "SQL",
-        "MIT",
-        "BSD",
-        "ISC",
-        "AGPL",
-        "GPL",
-        "LGPL",
-        "TODO",
-        "NOTE",
-        "WARNING",
-        "TIP",
-        "IMPORTANT",
-        "SSE",
-        "STDIO",
-        "TCP",
-        "UDP",
-    }
-)
-
-
-def _extract_code_blocks(readme: str) -> list[str]:
-    """Extract all fenced code blocks from markdown."""
-    return _CODE_BLOCK_RE.findall(readme)
 
+def _extract_env_vars(readme: str, block_spans: list[tuple[int, int]]) -> list[EnvVarHint]:
+    """Extract environment variable mentions from README in a single sweep.
 
-def _extract_env_vars(readme: str, code_blocks: list[str]) -> list[EnvVarHint]:
-    """Extract environment variable mentions from README."""
-    seen: set[str] = set()
-    hints: list[EnvVarHint] = []
+    *block_spans* are the (start, end) offsets of fenced code block bodies.
+    Names inside code blocks take priority; elsewhere a name only counts when
+    its line mentions env/environment/variable/token/key.
+    """
+    block_hints: list[EnvVarHint] = []
+    prose_hints: list[EnvVarHint] = []
+    seen_block: set[str] = set()
+    seen_prose: set[str] = set()
+    block_starts = [start for start, _ in block_spans]
+    # Bounds of the line holding the current match, found once per line and
+    # shared by every name on it; prose_line is its text once keyword-checked.
+    line_start = line_end = -1
+    prose_line: str | None = None
+
+    for match in _ENV_VAR_RE.finditer(readme):
+        name = match.group(1)
+        pos = match.start()
+        if not line_start <= pos < line_end:
+            line_start = readme.rfind("\n", 0, pos) + 1
+            line_end = readme.find("\n", pos)
+            if line_end == -1:
+                line_end = len(readme)
+            prose_line = None
 
-    # Prioritize env vars in code blocks
-    for block in code_blocks:
-        for match in _ENV_VAR_RE.finditer(block):
-            name = match.group(1)
-            if name in seen or name in _IGNORE_VARS or len(name) < 4:
+        idx = bisect.bisect_right(block_starts, pos) - 1
+        if idx >= 0 and pos < block_spans[idx][1]:
+            if name in seen_block:
                 continue
-            # Must look like an env var (has underscore or ends with KEY/TOKEN/URL/SECRET)
-            if "_" not in name:
-                continue
-            seen.add(name)
-            # Get surrounding context (the line containing the var)
-            line_start = block.rfind("\n", 0, match.start()) + 1
-            line_end = block.find("\n", match.end())
-            if line_end == -1:
-                line_end = len(block)
-            context = block[line_start:line_end].strip()
+            # Context is the line containing the var, clipped to the block body
+            lo, hi = block_spans[idx]
+            context = readme[max(line_start, lo) : min(line_end, hi)].strip()
+            seen_block.add(name)
             is_required = bool(_REQUIRED_KEYWORDS.search(context))
-            hints.append(EnvVarHint(name=name, context=context, is_required=is_required))
+            block_hints.append(EnvVarHint(name=name, context=context, is_required=is_required))
+            continue
 
-    # Also scan full text for env vars near keywords like "environment" or "env"
-    for line in readme.split("\n"):
-        if not any(kw in line.lower() for kw in ("env", "environment", "variable", "token", "key")):
+        if name in seen_prose:
             continue
-        for match in _ENV_VAR_RE.finditer(line):
-            name = match.group(1)
-            if name in seen or name in _IGNORE_VARS or len(name) < 4 or "_" not in name:
-                continue
-            seen.add(name)
-            is_required = bool(_REQUIRED_KEYWORDS.search(line))
-            hints.append(EnvVarHint(name=name, context=line.strip(), is_required=is_required))
+        if prose_line is None:
+            line = readme[line_start:line_end]
+            prose_line = line if _ENV_KEYWORD_RE.search(line) else ""
+        if not prose_line:
+            continue
+        seen_prose.add(name)
+        is_required = bool(_REQUIRED_KEYWORDS.search(prose_line))
+        prose_hints.append(
+            EnvVarHint(name=name, context=prose_line.strip(), is_required=is_required)
+        )
 
-    return hints
+    block_hints.extend(hint for hint in prose_hints if hint.name not in seen_block)
+    return block_hints
 
 
-def _extract_install_commands(code_blocks: list[str]) -> list[str]:
+def _extract_install_commands(
+    readme: str, lowered: str, block_spans: list[tuple[int, int]]
+) -> list[str]:
     """Extract install/run commands from code blocks."""
     commands: list[str] = []
-    for block in code_blocks:
-        for match in _INSTALL_CMD_RE.finditer(block):
-            cmd = match.group(0).strip()
-            if cmd and cmd not in commands:
+    seen: set[str] = set()
+    for start, end in block_spans:
+        for match in _INSTALL_CMD_RE.finditer(lowered, start, end):
+            cmd = readme[match.start() : match.end()].strip()
+            if cmd and cmd not in seen:
+                seen.add(cmd)
                 commands.append(cmd)
     return commands
 
 
+def _lower_aligned(text: str) -> str:
+    """Lowercase *text* keeping every character at its original offset.
+
+    Match spans found in the result can then be sliced from *text* itself.
+    Only U+0130 grows under str.lower(); text containing it is lowered
+    character by character, leaving that one as is.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(low if len(low := ch.lower()) == 1 else ch for ch in text)
+
+
 def _extract_transport_hints(readme: str) -> list[str]:
     """Extract transport type hints from the full README."""
     found: set[str] = set()
@@ -154,28 +132,47 @@ def _extract_transport_hints(readme: str) -> list[str]:
     return sorted(found)
 
 
-def _extract_command_patterns(code_blocks: list[str]) -> list[str]:
+def _extract_command_patterns(
+    readme: str, lowered: str, block_spans: list[tuple[int, int]]
+) -> list[str]:
     """Extract server invocation command patterns from code blocks."""
     patterns: list[str] = []
-    for block in code_blocks:
-        for match in _SERVER_CMD_RE.finditer(block):
-            cmd = match.group(0).strip()
-            if cmd and cmd not in patterns:
+    seen: set[str] = set()
+    for start, end in block_spans:
+        for match in _SERVER_CMD_RE.finditer(lowered, start, end):
+            cmd = readme[match.start() : match.end()].strip()
+            if cmd and cmd not in seen:
+                seen.add(cmd)
                 patterns.append(cmd)
     return patterns
 
 
-def _extract_json_configs(code_blocks: list[str]) -> list[str]:
+def _extract_json_configs(readme: str, block_spans: list[tuple[int, int]]) -> list[str]:
     """Extract JSON config blocks that look like MCP server config."""
     configs: list[str] = []
-    for block in code_blocks:
-        for match in _JSON_CONFIG_RE.finditer(block):
-            raw = match.group(0).strip()
-            if raw and raw not in configs:
+    seen: set[str] = set()
+    for start, end in block_spans:
+        for raw in _iter_json_configs(readme, start, end):
+            if raw not in seen:
+                seen.add(raw)
                 configs.append(raw)
     return configs
 
 
+def _iter_json_configs(text: str, start: int, end: int) -> Iterator[str]:
+    """Yield each ``{...}`` in ``text[start:end]`` that contains ``"command"`` and no ``}``.
+
+    Same spans as the regex ``\\{[^}]*"command"[^}]*\\}``, found with plain
+    ``str.find`` over the ``}``-delimited segments: each segment can only match
+    from its first ``{``, so unclosed braces cost one scan instead of one per ``{``.
+    """
+    while (close := text.find("}", start, end)) != -1:
+        open_ = text.find("{", start, close)
+        if open_ != -1 and text.find('"command"', open_ + 1, close) != -1:
+            yield text[open_ : close + 1]
+        start = close + 1
+
+
 def extract_config_hints(readme: str) -> ConfigHints:
     """Extract structured configuration hints from a README markdown text.
 
@@ -189,12 +186,14 @@ def extract_config_hints(readme: str) -> ConfigHints:
     Returns:
         ConfigHints with extracted data and a confidence score.
     """
-    code_blocks = _extract_code_blocks(readme)
-    env_vars = _extract_env_vars(readme, code_blocks)
-    install_commands = _extract_install_commands(code_blocks)
+    # Extractors scan the README itself within these spans; no block copies.
+    block_spans = [m.span(1) for m in _CODE_BLOCK_RE.finditer(readme)]
+    lowered = _lower_aligned(readme)
+    env_vars = _extract_env_vars(readme, block_spans)
+    install_commands = _extract_install_commands(readme, lowered, block_spans)
     transport_hints = _extract_transport_hints(readme)
-    command_patterns = _extract_command_patterns(code_blocks)
-    json_configs = _extract_json_configs(code_blocks)
+    command_patterns = _extract_command_patterns(readme, lowered, block_spans)
+    json_configs = _extract_json_configs(readme, block_spans)
 
     # Compute confidence based on how many patterns matched
     signals = sum(
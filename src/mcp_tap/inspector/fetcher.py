@@ -6,6 +6,14 @@ import re
 
 import httpx
 
+# Only this much of a README is downloaded; config hints live near the top.
+_MAX_README_BYTES = 256 * 1024
+
+# Monorepo path: /owner/repo/tree/branch/path
+_GITHUB_TREE_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)/tree/([^/]+)/(.+)")
+_GITHUB_REPO_RE = re.compile(r"https?://github\.com/([^/]+)/([^/]+)(?:/.*)?$")
+_GITLAB_REPO_RE = re.compile(r"https?://gitlab\.com/([^/]+)/([^/]+)(?:/.*)?$")
+
 
 def _github_raw_url(repo_url: str) -> str:
     """Convert a GitHub URL to a raw.githubusercontent.com README URL.
@@ -14,20 +22,15 @@ def _github_raw_url(repo_url: str) -> str:
     - https://github.com/owner/repo
     - https://github.com/owner/repo/tree/main/packages/server-foo
     """
-    # Monorepo path: /owner/repo/tree/branch/path
-    m = re.match(
-        r"https?://github\.com/([^/]+)/([^/]+)/tree/([^/]+)/(.+)",
-        repo_url,
-    )
+    m = _GITHUB_TREE_RE.match(repo_url)
     if m:
         owner, repo, branch, subpath = m.groups()
         return f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{subpath}/README.md"
 
     # Standard repo URL
-    m = re.match(r"https?://github\.com/([^/]+)/([^/]+)(?:/.*)?$", repo_url)
+    m = _GITHUB_REPO_RE.match(repo_url)
     if m:
         owner, repo = m.groups()
-        repo = repo.rstrip("/")
         return f"https://raw.githubusercontent.com/{owner}/{repo}/HEAD/README.md"
 
     return ""
@@ -35,10 +38,9 @@ def _github_raw_url(repo_url: str) -> str:
 
 def _gitlab_raw_url(repo_url: str) -> str:
     """Convert a GitLab URL to a raw README URL."""
-    m = re.match(r"https?://gitlab\.com/([^/]+)/([^/]+)(?:/.*)?$", repo_url)
+    m = _GITLAB_REPO_RE.match(repo_url)
     if m:
         owner, repo = m.groups()
-        repo = repo.rstrip("/")
         return f"https://gitlab.com/{owner}/{repo}/-/raw/main/README.md"
     return ""
 
@@ -63,7 +65,8 @@ async def fetch_readme(
     Supports GitHub and GitLab URLs. Falls back to direct fetch for
     unrecognized URLs.
 
-    Returns the raw markdown text, or None if not found/unreachable.
+    Returns the raw markdown text (at most the first 256 KiB), or None if
+    not found/unreachable.
     """
     raw_url = ""
 
@@ -79,9 +82,15 @@ async def fetch_readme(
         return None
 
     try:
-        resp = await http_client.get(raw_url, follow_redirects=True)
-        if resp.status_code == 200:
-            return resp.text
-        return None
+        async with http_client.stream("GET", raw_url, follow_redirects=True) as resp:
+            if resp.status_code != 200:
+                return None
+            body = bytearray()
+            async for chunk in resp.aiter_bytes():
+                body += chunk
+                if len(body) >= _MAX_README_BYTES:
+                    break
     except httpx.HTTPError:
         return None
+    # A cut mid-character decodes to U+FFFD, as resp.text does for bad bytes.
+    return body[:_MAX_README_BYTES].decode(resp.encoding or "utf-8", errors="replace")
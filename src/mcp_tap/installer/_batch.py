@@ -0,0 +1,47 @@
+"""Shared install_many() plumbing for the package installers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+
+from mcp_tap.models import InstallResult
+
+logger = logging.getLogger(__name__)
+
+
+async def install_each(
+    install: Callable[[str, str], Awaitable[InstallResult]],
+    specs: Sequence[tuple[str, str]],
+    *,
+    method: str,
+    concurrency: int,
+) -> list[InstallResult]:
+    """Run *install* for each (identifier, version) spec; results in input order.
+
+    At most *concurrency* installs run at once. An install that raises is
+    reported as a failed result for its own spec, so one broken package never
+    takes the rest of the batch down with it.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _one(identifier: str, version: str) -> InstallResult:
+        async with sem:
+            try:
+                return await install(identifier, version)
+            except Exception as exc:
+                logger.debug("Install of %s raised", identifier, exc_info=True)
+                return failed_result(identifier, method, exc)
+
+    return list(await asyncio.gather(*(_one(ident, ver) for ident, ver in specs)))
+
+
+def failed_result(identifier: str, method: str, exc: Exception) -> InstallResult:
+    """InstallResult for an install that raised instead of reporting failure."""
+    return InstallResult(
+        success=False,
+        package_identifier=identifier,
+        install_method=method,
+        message=f"Failed to install {identifier}: {type(exc).__name__}: {exc}",
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from typing import Protocol
 
 from mcp_tap.models import InstallResult, RegistryType
@@ -18,6 +19,14 @@ class PackageInstaller(Protocol):
         """Install/verify a package. Returns result even on failure (never raises)."""
         ...
 
+    async def install_many(self, specs: Sequence[tuple[str, str]]) -> list[InstallResult]:
+        """Install several (identifier, version) packages; results in input order.
+
+        Like install(), never raises: a package that cannot be installed gets
+        a failed result.
+        """
+        ...
+
     async def uninstall(self, identifier: str) -> InstallResult:
         """Uninstall a package."""
         ...
@@ -33,3 +42,9 @@ class InstallerResolverPort(Protocol):
     async def resolve_installer(self, registry_type: RegistryType | str) -> PackageInstaller:
         """Resolve and return a ready-to-use installer for the given registry type."""
         ...
+
+    async def resolve_installers(
+        self, registry_types: Iterable[RegistryType | str]
+    ) -> dict[RegistryType, PackageInstaller]:
+        """Resolve installers for several registry types; unavailable ones are omitted."""
+        ...
@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
-import shutil
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+from mcp_tap._paths import which_async
+from mcp_tap.installer._batch import install_each
 from mcp_tap.installer.subprocess import run_command
 from mcp_tap.models import InstallResult
 
+# Parallel pulls beyond this mostly contend for registry bandwidth.
+_MAX_CONCURRENT_PULLS = 4
+
 
 @dataclass(frozen=True, slots=True)
 class DockerInstaller:
     """Installs MCP servers packaged as Docker/OCI images."""
 
     async def is_available(self) -> bool:
-        return shutil.which("docker") is not None
+        return await which_async("docker") is not None
 
     async def install(self, identifier: str, version: str = "latest") -> InstallResult:
         tag = f"{identifier}:{version}"
@@ -38,6 +43,21 @@ class DockerInstaller:
             command_output=stderr or stdout,
         )
 
+    async def install_many(
+        self,
+        specs: Sequence[tuple[str, str]],
+        *,
+        concurrency: int = _MAX_CONCURRENT_PULLS,
+    ) -> list[InstallResult]:
+        """Pull several (identifier, version) images concurrently; results in input order.
+
+        Layer downloads and extraction of different images are independent, so
+        the batch takes about as long as its slowest pulls rather than their sum.
+        """
+        return await install_each(
+            self.install, specs, method="docker pull", concurrency=concurrency
+        )
+
     async def uninstall(self, identifier: str) -> InstallResult:
         returncode, _stdout, stderr = await run_command(
             ["docker", "rmi", identifier],
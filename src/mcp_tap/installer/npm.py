@@ -2,35 +2,60 @@
 
 from __future__ import annotations
 
-import shutil
+import hashlib
+import os
+import time
+from collections.abc import Sequence
 from dataclasses import dataclass
+from pathlib import Path
 
+from mcp_tap._paths import which_async
+from mcp_tap.installer._batch import install_each
 from mcp_tap.installer.subprocess import run_command
 from mcp_tap.models import InstallResult
 
+# (identifier, version) pairs npx fetched successfully in this process. They
+# stay in the npx cache, so verifying them again would only pay another Node
+# startup. Failures are not recorded: they may be transient.
+_verified: set[tuple[str, str]] = set()
+
+# npx fetches of different packages are independent; cap them like docker pulls.
+_MAX_CONCURRENT_NPX = 4
+
+# An npx cache entry younger than this is trusted without re-running npx.
+_NPX_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+def clear_verified_cache() -> None:
+    """Forget which packages were verified (the npx cache may have been wiped)."""
+    _verified.clear()
+
 
 @dataclass(frozen=True, slots=True)
 class NpmInstaller:
     """Installs npm packages. Uses npx (zero-install) for MCP servers."""
 
     async def is_available(self) -> bool:
-        return shutil.which("npx") is not None
+        return await which_async("npx") is not None
 
     async def install(self, identifier: str, version: str = "latest") -> InstallResult:
         """Verify the npm package exists and is downloadable via npx."""
+        if (identifier, version) in _verified:
+            return _verified_result(identifier)
+
         pkg = f"{identifier}@{version}" if version != "latest" else identifier
+        if _in_npx_cache(identifier, pkg):
+            _verified.add((identifier, version))
+            return _verified_result(identifier)
+
         returncode, stdout, stderr = await run_command(
             ["npx", "-y", "--package", pkg, "--", "--help"],
             timeout=60.0,
         )
 
         if returncode == 0:
-            return InstallResult(
-                success=True,
-                package_identifier=identifier,
-                install_method="npx",
-                message=f"Package {identifier} verified and cached by npx.",
-            )
+            _verified.add((identifier, version))
+            return _verified_result(identifier)
         return InstallResult(
             success=False,
             package_identifier=identifier,
@@ -39,7 +64,14 @@ class NpmInstaller:
             command_output=stderr or stdout,
         )
 
+    async def install_many(self, specs: Sequence[tuple[str, str]]) -> list[InstallResult]:
+        """Verify several (identifier, version) packages concurrently; results in input order."""
+        return await install_each(
+            self.install, specs, method="npx", concurrency=_MAX_CONCURRENT_NPX
+        )
+
     async def uninstall(self, identifier: str) -> InstallResult:
+        clear_verified_cache()
         returncode, _stdout, stderr = await run_command(
             ["npm", "cache", "clean", "--force"],
             timeout=30.0,
@@ -53,3 +85,34 @@ class NpmInstaller:
 
     def build_server_command(self, identifier: str) -> tuple[str, list[str]]:
         return ("npx", ["-y", identifier])
+
+
+def _npx_cache_dir() -> Path:
+    """Return npx's cache root, honouring an NPM_CONFIG_CACHE override."""
+    return Path(os.environ.get("NPM_CONFIG_CACHE") or Path.home() / ".npm") / "_npx"
+
+
+def _in_npx_cache(identifier: str, pkg: str) -> bool:
+    """Check whether npx already installed *pkg* recently.
+
+    npx keeps each package spec under ``_npx/<hash>``, where the hash is the
+    first 16 hex digits of the spec's sha512, so a stat() answers the question
+    without starting Node.
+    """
+    digest = hashlib.sha512(pkg.encode()).hexdigest()[:16]
+    entry = _npx_cache_dir() / digest
+    try:
+        if time.time() - entry.stat().st_mtime > _NPX_CACHE_MAX_AGE:
+            return False
+        return (entry / "node_modules" / identifier / "package.json").is_file()
+    except OSError:
+        return False
+
+
+def _verified_result(identifier: str) -> InstallResult:
+    return InstallResult(
+        success=True,
+        package_identifier=identifier,
+        install_method="npx",
+        message=f"Package {identifier} verified and cached by npx.",
+    )
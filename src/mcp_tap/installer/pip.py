@@ -2,51 +2,70 @@
 
 from __future__ import annotations
 
-import shutil
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+from mcp_tap._paths import which, which_async
+from mcp_tap.installer._batch import failed_result, install_each
 from mcp_tap.installer.subprocess import run_command
 from mcp_tap.models import InstallResult
 
+# uvx checks each run in their own ephemeral environment, so they can overlap.
+_MAX_CONCURRENT_UVX = 4
+
 
 @dataclass(frozen=True, slots=True)
 class PipInstaller:
     """Installs Python packages. Prefers uvx (zero-install) for MCP servers."""
 
     async def is_available(self) -> bool:
-        return shutil.which("uvx") is not None or shutil.which("pip") is not None
+        return await which_async("uvx") is not None or await which_async("pip") is not None
 
     async def install(self, identifier: str, version: str = "latest") -> InstallResult:
         """Install a Python package via uvx or pip."""
-        if shutil.which("uvx"):
-            pkg = f"{identifier}=={version}" if version != "latest" else identifier
+        pkg = _requirement(identifier, version)
+        if which("uvx"):
             returncode, stdout, stderr = await run_command(
                 ["uvx", pkg, "--help"],
                 timeout=60.0,
             )
             method = "uvx"
         else:
-            pkg = f"{identifier}=={version}" if version != "latest" else identifier
             returncode, stdout, stderr = await run_command(
                 ["pip", "install", pkg],
                 timeout=120.0,
             )
             method = "pip install"
 
-        if returncode == 0:
-            return InstallResult(
-                success=True,
-                package_identifier=identifier,
-                install_method=method,
-                message=f"Package {identifier} installed via {method}.",
+        return _install_result(identifier, method, returncode, stdout, stderr)
+
+    async def install_many(self, specs: Sequence[tuple[str, str]]) -> list[InstallResult]:
+        """Install several (identifier, version) packages; results in input order.
+
+        With pip, the whole set is resolved and installed by one process. pip
+        is all-or-nothing, so when the run fails every package gets the failed
+        result; install them one by one to tell which one broke. uvx cannot
+        batch; its checks run concurrently instead.
+        """
+        if not specs:
+            return []
+
+        if which("uvx"):
+            return await install_each(
+                self.install, specs, method="uvx", concurrency=_MAX_CONCURRENT_UVX
             )
-        return InstallResult(
-            success=False,
-            package_identifier=identifier,
-            install_method=method,
-            message=f"Failed to install {identifier}: {stderr or stdout}",
-            command_output=stderr or stdout,
-        )
+
+        try:
+            returncode, stdout, stderr = await run_command(
+                ["pip", "install", *(_requirement(ident, ver) for ident, ver in specs)],
+                timeout=120.0 * len(specs),
+            )
+        except Exception as exc:
+            return [failed_result(ident, "pip install", exc) for ident, _ver in specs]
+        return [
+            _install_result(ident, "pip install", returncode, stdout, stderr)
+            for ident, _ver in specs
+        ]
 
     async def uninstall(self, identifier: str) -> InstallResult:
         returncode, _stdout, stderr = await run_command(
@@ -61,6 +80,29 @@ class PipInstaller:
         )
 
     def build_server_command(self, identifier: str) -> tuple[str, list[str]]:
-        if shutil.which("uvx"):
+        if which("uvx"):
             return ("uvx", [identifier])
         return ("python", ["-m", identifier])
+
+
+def _requirement(identifier: str, version: str) -> str:
+    return f"{identifier}=={version}" if version != "latest" else identifier
+
+
+def _install_result(
+    identifier: str, method: str, returncode: int, stdout: str, stderr: str
+) -> InstallResult:
+    if returncode == 0:
+        return InstallResult(
+            success=True,
+            package_identifier=identifier,
+            install_method=method,
+            message=f"Package {identifier} installed via {method}.",
+        )
+    return InstallResult(
+        success=False,
+        package_identifier=identifier,
+        install_method=method,
+        message=f"Failed to install {identifier}: {stderr or stdout}",
+        command_output=stderr or stdout,
+    )
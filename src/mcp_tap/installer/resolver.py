@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
+
 from mcp_tap.errors import InstallerNotFoundError
 from mcp_tap.installer.base import PackageInstaller
 from mcp_tap.installer.docker import DockerInstaller
@@ -46,9 +49,48 @@ async def resolve_installer(registry_type: RegistryType | str) -> PackageInstall
     return installer
 
 
+async def resolve_installers(
+    registry_types: Iterable[RegistryType | str],
+) -> dict[RegistryType, PackageInstaller]:
+    """Resolve installers for several registry types at once.
+
+    Each distinct type is probed once, and the probes run concurrently
+    (installers check PATH off the event loop). Types that are unknown,
+    unsupported, or whose package manager is missing are left out;
+    resolve_installer() explains why for any single one.
+    """
+    types: list[RegistryType] = []
+    for raw in registry_types:
+        try:
+            rt = RegistryType(raw)
+        except ValueError:
+            continue
+        if rt not in types:
+            types.append(rt)
+
+    async def _probe(rt: RegistryType) -> PackageInstaller | None:
+        try:
+            return await resolve_installer(rt)
+        except InstallerNotFoundError:
+            return None
+
+    installers = await asyncio.gather(*(_probe(rt) for rt in types))
+    return {
+        rt: installer
+        for rt, installer in zip(types, installers, strict=True)
+        if installer is not None
+    }
+
+
 class DefaultInstallerResolver:
     """Adapter for InstallerResolverPort."""
 
     async def resolve_installer(self, registry_type: RegistryType | str) -> PackageInstaller:
         """Resolve the appropriate installer for a registry type."""
         return await resolve_installer(registry_type)
+
+    async def resolve_installers(
+        self, registry_types: Iterable[RegistryType | str]
+    ) -> dict[RegistryType, PackageInstaller]:
+        """Resolve installers for several registry types, probing them concurrently."""
+        return await resolve_installers(registry_types)
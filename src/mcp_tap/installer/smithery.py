@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import shutil
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+from mcp_tap._paths import which_async
+from mcp_tap.installer._batch import install_each
 from mcp_tap.installer.subprocess import run_command
 from mcp_tap.models import InstallResult
 
@@ -19,7 +21,7 @@ class SmitheryInstaller:
 
     async def is_available(self) -> bool:
         """Check if npx is installed (required to run @smithery/cli)."""
-        return shutil.which("npx") is not None
+        return await which_async("npx") is not None
 
     async def install(self, identifier: str, version: str = "latest") -> InstallResult:
         """Verify the Smithery server is accessible via @smithery/cli.
@@ -64,6 +66,20 @@ class SmitheryInstaller:
             command_output=stderr or stdout,
         )
 
+    async def install_many(self, specs: Sequence[tuple[str, str]]) -> list[InstallResult]:
+        """Install several Smithery servers, one at a time.
+
+        Each ``@smithery/cli install`` rewrites the same client config file,
+        so runs are not overlapped.
+
+        Args:
+            specs: (identifier, version) pairs; versions are ignored.
+
+        Returns:
+            One InstallResult per spec, in input order.
+        """
+        return await install_each(self.install, specs, method="smithery", concurrency=1)
+
     async def uninstall(self, identifier: str) -> InstallResult:
         """Smithery CLI does not support uninstall -- return a no-op result.
 
@@ -7,6 +7,10 @@ import os
 import signal
 
 _OUTPUT_LIMIT = 2000
+# Bytes kept per stream: enough for _OUTPUT_LIMIT whole UTF-8 characters. The
+# rest is read and dropped, so chatty installers cannot grow memory unbounded.
+_CAPTURE_LIMIT = (_OUTPUT_LIMIT + 1) * 4
+_READ_CHUNK = 4096
 
 
 async def run_command(
@@ -17,7 +21,8 @@ async def run_command(
     """Run a subprocess with timeout, return (returncode, stdout, stderr).
 
     Uses asyncio.create_subprocess_exec -- never shell=True.
-    Output is truncated to prevent context bloat.
+    Output is truncated to prevent context bloat, and only its head is ever
+    buffered: both pipes are drained to the end so the child never blocks.
     Uses start_new_session=True so child processes can be killed as a group.
     """
     proc = await asyncio.create_subprocess_exec(
@@ -28,10 +33,15 @@ async def run_command(
         start_new_session=True,
     )
     try:
-        stdout_bytes, stderr_bytes = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        stdout_bytes, stderr_bytes, _ = await asyncio.wait_for(
+            asyncio.gather(_read_capped(proc.stdout), _read_capped(proc.stderr), proc.wait()),
+            timeout=timeout,
+        )
     except TimeoutError:
         try:
-            os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+            # start_new_session makes the child its group leader, so its pid is
+            # the pgid: no getpgid() round trip that could race with its exit.
+            os.killpg(proc.pid, signal.SIGKILL)
         except (ProcessLookupError, OSError):
             proc.kill()
         await proc.wait()
@@ -42,3 +52,14 @@ async def run_command(
         stdout_bytes.decode(errors="replace")[:_OUTPUT_LIMIT],
         stderr_bytes.decode(errors="replace")[:_OUTPUT_LIMIT],
     )
+
+
+async def _read_capped(stream: asyncio.StreamReader | None) -> bytes:
+    """Read *stream* to EOF, keeping only its first _CAPTURE_LIMIT bytes."""
+    if stream is None:
+        return b""
+    buf = bytearray()
+    while chunk := await stream.read(_READ_CHUNK):
+        if len(buf) < _CAPTURE_LIMIT:
+            buf += chunk[: _CAPTURE_LIMIT - len(buf)]
+    return bytes(buf)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from mcp_tap.config.matching import (
+    build_installed_index,
     find_matching_installed_server,
     installed_http_url,
     is_locked_http_server,
@@ -37,11 +38,12 @@ def diff_lockfile(
     drift: list[DriftEntry] = []
     health_by_name = {h.name: h for h in (healths or [])}
     matched_installed_names: set[str] = set()
+    installed_index = build_installed_index(installed)
 
     # Check each locked server against installed state
     for name, locked in lockfile.servers.items():
         installed_server = find_matching_installed_server(
-            name, locked, installed, used_installed_names=matched_installed_names
+            name, locked, installed_index, used_installed_names=matched_installed_names
         )
         if installed_server is None:
             drift.append(
@@ -13,5 +13,7 @@ def compute_tools_hash(tools: list[str]) -> str | None:
     if not tools:
         return None
     joined = "|".join(sorted(tools))
-    digest = hashlib.sha256(joined.encode()).hexdigest()
+    # One C-level join and a single update() beat feeding names one by one;
+    # the hash is a drift fingerprint, not a security boundary.
+    digest = hashlib.sha256(joined.encode(), usedforsecurity=False).hexdigest()
     return f"sha256-{digest}"
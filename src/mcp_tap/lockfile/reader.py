@@ -10,27 +10,51 @@ from mcp_tap.models import LockedConfig, LockedServer, Lockfile
 
 _LOCKFILE_NAME = "mcp-tap.lock"
 
+# Parsed lockfiles keyed by path, tagged with the (mtime_ns, size, inode) they
+# were read at. The writer replaces the file atomically, which changes the inode.
+_parsed_cache: dict[str, tuple[tuple[int, int, int], Lockfile]] = {}
+
+
+def invalidate_lockfile_cache(path: Path | str | None = None) -> None:
+    """Drop the parsed lockfile cached for *path*, or every entry if omitted."""
+    if path is None:
+        _parsed_cache.clear()
+    else:
+        _parsed_cache.pop(str(path), None)
+
 
 def read_lockfile(project_path: Path | str) -> Lockfile | None:
     """Read the lockfile from a project directory.
 
-    Returns None if the file does not exist or is empty.
+    Returns None if the file does not exist or is empty. The parsed result is
+    reused until the file's mtime, size or inode changes; callers must not
+    mutate it.
 
     Raises:
         LockfileReadError: If the file contains invalid JSON or an
             unsupported lockfile version.
     """
     path = Path(project_path) / _LOCKFILE_NAME
-    if not path.exists():
-        return None
+    key = str(path)
     try:
-        text = path.read_text(encoding="utf-8")
-        if not text.strip():
+        st = path.stat()
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = _parsed_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        # Same fast path as config.reader.read_config: json.loads decodes the
+        # bytes itself, so no intermediate str or strip() copy is made.
+        raw = path.read_bytes()
+        if not raw or raw.isspace():
             return None
-        data = json.loads(text)
-        return parse_lockfile(data)
+        lockfile = parse_lockfile(json.loads(raw))
+    except FileNotFoundError:
+        _parsed_cache.pop(key, None)
+        return None
     except json.JSONDecodeError as exc:
         raise LockfileReadError(f"Invalid JSON in {path}: {exc}") from exc
+    _parsed_cache[key] = (stamp, lockfile)
+    return lockfile
 
 
 def parse_lockfile(data: dict) -> Lockfile:
@@ -15,7 +15,7 @@ from pathlib import Path
 
 from mcp_tap.errors import LockfileWriteError
 from mcp_tap.lockfile.hasher import compute_tools_hash
-from mcp_tap.lockfile.reader import read_lockfile
+from mcp_tap.lockfile.reader import invalidate_lockfile_cache, read_lockfile
 from mcp_tap.models import HttpServerConfig, LockedConfig, LockedServer, Lockfile, ServerConfig
 
 logger = logging.getLogger(__name__)
@@ -118,6 +118,7 @@ def write_lockfile(project_path: Path | str, lockfile: Lockfile) -> None:
             try:
                 data = _lockfile_to_dict(lockfile)
                 _atomic_write_lockfile(path, data)
+                invalidate_lockfile_cache(path)
             finally:
                 fcntl.flock(lock_fd, fcntl.LOCK_UN)
 
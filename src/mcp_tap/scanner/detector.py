@@ -810,6 +810,8 @@ def _match_env_patterns(
 
 # ─── Utility Helpers ─────────────────────────────────────────
 
+_PY_DEP_NAME_END_RE = re.compile(r"[><=!~;\[\s]")
+
 
 def _normalize_python_dep(raw: str) -> str:
     """Extract the bare package name from a pip requirement specifier.
@@ -820,7 +822,7 @@ def _normalize_python_dep(raw: str) -> str:
         ``django ~= 4.2`` → ``django``
     """
     # Strip version specifiers and extras
-    name = re.split(r"[><=!~;\[\s]", raw, maxsplit=1)[0]
+    name = _PY_DEP_NAME_END_RE.split(raw, maxsplit=1)[0]
     return name.strip().lower()
 
 
@@ -8,7 +8,7 @@ from pathlib import Path
 from mcp.server.fastmcp import Context
 
 from mcp_tap.config.detection import detect_clients, resolve_config_path
-from mcp_tap.config.matching import find_matching_locked_server
+from mcp_tap.config.matching import build_locked_index, find_matching_locked_server
 from mcp_tap.config.reader import parse_servers, read_config
 from mcp_tap.errors import McpTapError
 from mcp_tap.lockfile.reader import read_lockfile
@@ -122,7 +122,7 @@ async def list_installed(
         raw = read_config(Path(location.path))
         servers = parse_servers(raw, source_file=location.path)
         lockfile = read_lockfile(Path(project_path)) if project_path else None
-        locked_servers = lockfile.servers if lockfile else {}
+        locked_index = build_locked_index(lockfile.servers) if lockfile else None
         used_locked_names: set[str] = set()
 
         result: list[dict[str, object]] = []
@@ -132,8 +132,8 @@ async def list_installed(
                 "registry_type": s.registry_type,
                 "repository_url": s.repository_url,
             }
-            if locked_servers:
-                match = find_matching_locked_server(s, locked_servers, used_locked_names)
+            if locked_index is not None and locked_index.servers:
+                match = find_matching_locked_server(s, locked_index, used_locked_names)
                 if match is not None:
                     locked_name, locked = match
                     used_locked_names.add(locked_name)
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 
 from mcp.server.fastmcp import Context
 
 from mcp_tap.config.detection import resolve_config_locations
-from mcp_tap.config.matching import find_matching_installed_server
+from mcp_tap.config.matching import (
+    InstalledIndex,
+    build_installed_index,
+    find_matching_installed_server,
+)
 from mcp_tap.config.reader import parse_servers, read_config
 from mcp_tap.config.writer import write_server_config
 from mcp_tap.connection.base import ConnectionTesterPort
@@ -18,6 +23,7 @@ from mcp_tap.lockfile.reader import read_lockfile
 from mcp_tap.models import (
     ConfigLocation,
     InstalledServer,
+    InstallResult,
     LockedServer,
     Lockfile,
     RegistryType,
@@ -29,6 +35,9 @@ logger = logging.getLogger(__name__)
 
 _LOCKFILE_NAME = "mcp-tap.lock"
 
+# Registries whose install_many() beats installing one server at a time.
+_BATCH_REGISTRIES = frozenset({RegistryType.OCI, RegistryType.PYPI})
+
 
 async def restore(
     project_path: str,
@@ -94,14 +103,26 @@ async def restore(
         if dry_run:
             return _build_dry_run_result(lockfile, locations, lockfile_path)
 
-        installed_servers = _read_installed_servers(locations)
+        installed_index = build_installed_index(_read_installed_servers(locations))
+        existing_by_name = {
+            name: _find_existing_server(name, locked, installed_index)
+            for name, locked in lockfile.servers.items()
+        }
+        preinstalled = await _install_batches(
+            [
+                (name, locked)
+                for name, locked in lockfile.servers.items()
+                if existing_by_name[name] is None
+            ],
+            app.installer_resolver,
+        )
 
         # Restore each server
         results: list[dict[str, object]] = []
         all_env_keys: list[dict[str, object]] = []
 
         for name, locked in lockfile.servers.items():
-            existing = _find_existing_server(name, locked, installed_servers)
+            existing = existing_by_name[name]
             if existing is not None:
                 results.append(
                     {
@@ -126,6 +147,7 @@ async def restore(
                 ctx,
                 app.installer_resolver,
                 app.connection_tester,
+                install_result=preinstalled.get(name),
             )
             results.append(result)
 
@@ -183,10 +205,60 @@ def _read_installed_servers(locations: list[ConfigLocation]) -> list[InstalledSe
 def _find_existing_server(
     name: str,
     locked: LockedServer,
-    installed_servers: list[InstalledServer],
+    installed_index: InstalledIndex,
 ) -> InstalledServer | None:
     """Find an existing installed server matching this lockfile entry."""
-    return find_matching_installed_server(name, locked, installed_servers)
+    return find_matching_installed_server(name, locked, installed_index)
+
+
+async def _install_batches(
+    servers: list[tuple[str, LockedServer]],
+    installer_resolver: InstallerResolverPort,
+) -> dict[str, InstallResult]:
+    """Install servers that share a batch-friendly registry ahead of the restore loop.
+
+    The group installers are resolved in one resolve_installers() call. Docker
+    images are pulled concurrently and Python packages go through one pip run
+    (see the installers' install_many). Returns the successful install
+    results by server name. Anything else -- registries with fewer than two
+    servers or no available installer, failed installs, or a batch that
+    raised -- is left for each server to install itself, so one bad package
+    never fails the restore.
+    """
+    groups: dict[RegistryType, list[tuple[str, LockedServer]]] = {}
+    for name, locked in servers:
+        if locked.registry_type in _BATCH_REGISTRIES:
+            groups.setdefault(RegistryType(locked.registry_type), []).append((name, locked))
+    groups = {rt: group for rt, group in groups.items() if len(group) > 1}
+    if not groups:
+        return {}
+
+    try:
+        installers = await installer_resolver.resolve_installers(groups)
+    except Exception:
+        logger.debug("Resolving batch installers failed", exc_info=True)
+        return {}
+
+    async def _install_group(
+        rt: RegistryType, group: list[tuple[str, LockedServer]]
+    ) -> dict[str, InstallResult]:
+        installer = installers.get(rt)
+        if installer is None:
+            return {}
+        try:
+            results = await installer.install_many(
+                [(locked.package_identifier, locked.version) for _, locked in group]
+            )
+            paired = list(zip(group, results, strict=True))
+        except Exception:
+            logger.debug("Batch install for %s failed", rt, exc_info=True)
+            return {}
+        return {name: result for (name, _), result in paired if result.success}
+
+    installed: dict[str, InstallResult] = {}
+    for batch in await asyncio.gather(*(_install_group(rt, g) for rt, g in groups.items())):
+        installed.update(batch)
+    return installed
 
 
 async def _restore_server(
@@ -196,17 +268,22 @@ async def _restore_server(
     ctx: Context,
     installer_resolver: InstallerResolverPort,
     connection_tester: ConnectionTesterPort,
+    *,
+    install_result: InstallResult | None = None,
 ) -> dict[str, object]:
-    """Restore a single server from its locked entry."""
+    """Restore a single server from its locked entry.
+
+    *install_result*, when given, is the outcome of an install already done
+    for this server (see _install_batches), so the install step is skipped.
+    """
     try:
         await ctx.info(f"Restoring {name}...")
 
-        # Resolve installer
-        rt = RegistryType(locked.registry_type)
-        installer = await installer_resolver.resolve_installer(rt)
-
-        # Install the package at the locked version
-        install_result = await installer.install(locked.package_identifier, locked.version)
+        if install_result is None:
+            # Install the package at the locked version
+            rt = RegistryType(locked.registry_type)
+            installer = await installer_resolver.resolve_installer(rt)
+            install_result = await installer.install(locked.package_identifier, locked.version)
 
         if not install_result.success:
             return {
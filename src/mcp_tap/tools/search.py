@@ -217,7 +217,7 @@ async def search_servers(
         # Fetch maturity signals from GitHub
         if evaluate:
             results = await _apply_maturity(results, app.github_metadata)
-            runtime = github_runtime_status()
+            runtime = await github_runtime_status()
             degraded_count = _annotate_maturity_availability(results, runtime)
             if degraded_count > 0:
                 await ctx.info(_maturity_warning_message(degraded_count, runtime))
@@ -568,19 +568,12 @@ async def _apply_maturity(
     if not repo_urls:
         return results
 
-    # Fetch signals concurrently
-    async def _fetch_one(url: str) -> tuple[str, MaturitySignals | None]:
-        signals = await github_metadata.fetch_repo_metadata(url)
-        return url, signals
-
-    tasks = [_fetch_one(url) for url in repo_urls]
-    fetched = await asyncio.gather(*tasks, return_exceptions=True)
-
-    signals_map: dict[str, MaturitySignals | None] = {}
-    for item in fetched:
-        if isinstance(item, tuple):
-            url, signals = item
-            signals_map[url] = signals
+    # One batched lookup instead of a request per repository
+    try:
+        signals_map = await github_metadata.fetch_repos_metadata(list(repo_urls))
+    except Exception:
+        logger.debug("GitHub metadata batch fetch failed", exc_info=True)
+        signals_map = {}
 
     # Apply scores to results
     for result in results:
@@ -4,10 +4,48 @@ from __future__ import annotations
 
 import pytest
 
+from mcp_tap._paths import clear_which_cache
+from mcp_tap.config.detection import invalidate_exists_cache
 from mcp_tap.evaluation.github import clear_cache
+from mcp_tap.installer.npm import clear_verified_cache
+from mcp_tap.lockfile.reader import invalidate_lockfile_cache
 
 
 @pytest.fixture(autouse=True)
-def _clear_github_cache() -> None:
-    """Clear the GitHub API cache before each test to prevent cross-test pollution."""
+def _clear_github_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Clear the GitHub API cache before each test to prevent cross-test pollution.
+
+    The persistent disk tier is disabled so tests never touch ~/.cache.
+    """
+    monkeypatch.setattr("mcp_tap.evaluation.github._DISK_CACHE_DIR", None)
     clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_exists_cache() -> None:
+    """Clear the config existence cache so tests observe their own filesystem setup."""
+    invalidate_exists_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_which_cache() -> None:
+    """Drop cached PATH lookups so each test's shutil.which patch is honored."""
+    clear_which_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_npm_verified_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """Forget npx verifications so each test's run_command mock is exercised.
+
+    npx's cache is pointed at an empty directory so the real ~/.npm is never consulted.
+    """
+    monkeypatch.setenv("NPM_CONFIG_CACHE", str(tmp_path_factory.mktemp("npm-cache")))
+    clear_verified_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_lockfile_cache() -> None:
+    """Drop parsed lockfiles so a rewrite within one mtime tick is always re-read."""
+    invalidate_lockfile_cache()
@@ -9,7 +9,11 @@ from pathlib import Path
 import pytest
 
 from mcp_tap.config.reader import parse_servers, read_config
-from mcp_tap.config.writer import remove_server_config, write_server_config
+from mcp_tap.config.writer import (
+    remove_server_config,
+    write_server_config,
+    write_servers_batch,
+)
 from mcp_tap.errors import ConfigReadError, ConfigWriteError
 from mcp_tap.models import HttpServerConfig, MCPClient, ServerConfig
 
@@ -19,12 +23,36 @@ class TestReadConfig:
         result = read_config(tmp_path / "nonexistent.json")
         assert result == {"mcpServers": {}}
 
+    def test_nonexistent_parent_returns_empty(self, tmp_path: Path):
+        result = read_config(tmp_path / "missing-dir" / "config.json")
+        assert result == {"mcpServers": {}}
+
+    def test_single_open_without_exists_check(self, tmp_path: Path, monkeypatch):
+        f = tmp_path / "config.json"
+        f.write_text('{"mcpServers": {"a": {"command": "x"}}}')
+
+        def _fail(self: Path) -> bool:
+            raise AssertionError("read_config should not stat before reading")
+
+        monkeypatch.setattr(Path, "exists", _fail)
+        assert "a" in read_config(f)["mcpServers"]
+
     def test_empty_file_returns_empty(self, tmp_path: Path):
         f = tmp_path / "config.json"
         f.write_text("")
         result = read_config(f)
         assert result == {"mcpServers": {}}
 
+    def test_whitespace_only_file_returns_empty(self, tmp_path: Path):
+        f = tmp_path / "config.json"
+        f.write_text(" \n\t\n")
+        assert read_config(f) == {"mcpServers": {}}
+
+    def test_reads_utf8_content(self, tmp_path: Path):
+        f = tmp_path / "config.json"
+        f.write_bytes('{"mcpServers": {}, "note": "café"}'.encode())
+        assert read_config(f)["note"] == "café"
+
     def test_reads_valid_config(self, tmp_path: Path):
         f = tmp_path / "config.json"
         data = {
@@ -65,6 +93,18 @@ class TestParseServers:
         assert servers[1].name == "gh"
         assert servers[1].config.args == ["gh-mcp"]
 
+    def test_reuses_loaded_containers(self):
+        entry = {"command": "npx", "args": ["-y", "pg-mcp"], "env": {"DB": "url"}}
+        servers = parse_servers({"mcpServers": {"pg": entry}})
+        assert servers[0].config.args is entry["args"]
+        assert servers[0].config.env is entry["env"]
+
+    def test_copies_non_list_args(self):
+        raw = {"mcpServers": {"pg": {"command": "npx", "args": ("-y", "pg-mcp")}}}
+        servers = parse_servers(raw)
+        assert servers[0].config.args == ["-y", "pg-mcp"]
+        assert servers[0].config.env == {}
+
     def test_empty_servers(self):
         assert parse_servers({"mcpServers": {}}) == []
 
@@ -110,6 +150,49 @@ class TestWriteServerConfig:
         assert data["globalShortcut"] == "Ctrl+Space"
 
 
+class TestWriteServersBatch:
+    def test_writes_all_entries_in_one_replace(self, tmp_path: Path, monkeypatch):
+        from mcp_tap.config import writer
+
+        f = tmp_path / "config.json"
+        f.write_text(json.dumps({"mcpServers": {"keep": {"command": "k"}}}))
+        writes: list[Path] = []
+        original = writer._atomic_write
+        monkeypatch.setattr(
+            writer, "_atomic_write", lambda p, *a, **kw: (writes.append(p), original(p, *a, **kw))
+        )
+
+        write_servers_batch(
+            f,
+            {
+                "a": ServerConfig(command="npx", args=["a"]),
+                "b": HttpServerConfig(url="https://b.example", transport_type="http"),
+            },
+        )
+
+        data = json.loads(f.read_text())
+        assert list(data["mcpServers"]) == ["keep", "a", "b"]
+        assert data["mcpServers"]["b"] == {"type": "http", "url": "https://b.example"}
+        assert writes == [f]
+
+    def test_conflict_writes_nothing(self, tmp_path: Path):
+        f = tmp_path / "config.json"
+        original = json.dumps({"mcpServers": {"b": {"command": "old"}}})
+        f.write_text(original)
+
+        with pytest.raises(ConfigWriteError, match="'b' already exists"):
+            write_servers_batch(
+                f, {"a": ServerConfig(command="x", args=[]), "b": ServerConfig(command="y")}
+            )
+
+        assert f.read_text() == original
+
+    def test_empty_batch_is_noop(self, tmp_path: Path):
+        f = tmp_path / "config.json"
+        write_servers_batch(f, {})
+        assert not f.exists()
+
+
 class TestRemoveServerConfig:
     def test_removes_existing(self, tmp_path: Path):
         f = tmp_path / "config.json"
@@ -133,18 +216,40 @@ class TestRemoveServerConfig:
 class TestWriteServerConfigLocking:
     """Tests for in-process and cross-process file locking in config writer."""
 
-    def test_lock_file_created_during_write(self, tmp_path: Path):
-        """Should create a .lock file next to the config file during write."""
+    def test_no_lock_sidecar_left_after_write(self, tmp_path: Path):
+        """Should lock the config directory rather than a .lock sidecar file."""
         f = tmp_path / "config.json"
         config = ServerConfig(command="npx", args=["-y", "test"])
         write_server_config(f, "my-server", config)
+        remove_server_config(f, "my-server")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["config.json"]
 
-        # The lock file should have been created
-        lock_file = tmp_path / "config.lock"
-        assert lock_file.exists()
+    def test_write_blocks_while_directory_is_locked(self, tmp_path: Path):
+        """Should wait for another holder of the directory flock."""
+        import fcntl
+        import os
+
+        f = tmp_path / "config.json"
+        dir_fd = os.open(tmp_path, os.O_RDONLY)
+        fcntl.flock(dir_fd, fcntl.LOCK_EX)
+        writer = threading.Thread(
+            target=write_server_config, args=(f, "s", ServerConfig(command="x", args=[]))
+        )
+        try:
+            writer.start()
+            writer.join(timeout=0.2)
+            assert writer.is_alive()
+            assert not f.exists()
+        finally:
+            fcntl.flock(dir_fd, fcntl.LOCK_UN)
+            os.close(dir_fd)
+        writer.join(timeout=5)
+
+        assert "s" in json.loads(f.read_text())["mcpServers"]
 
     def test_unique_temp_files_no_fixed_tmp_suffix(self, tmp_path: Path):
-        """Should use tempfile.mkstemp() (unique names), not a fixed .tmp file."""
+        """Should write via O_EXCL temp files named by pid + counter, never a fixed .tmp."""
         f = tmp_path / "config.json"
 
         # Write two servers sequentially to verify no temp file collision
@@ -229,6 +334,74 @@ class TestWriteServerConfigLocking:
             assert f"existing-{i}" not in data["mcpServers"]
             assert f"new-{i}" in data["mcpServers"]
 
+    def test_path_lock_is_shared_across_threads(self, tmp_path: Path):
+        from mcp_tap.config.writer import _get_path_lock
+
+        f = tmp_path / "config.json"
+        locks: list[threading.Lock] = []
+        barrier = threading.Barrier(8)
+
+        def _grab() -> None:
+            barrier.wait()
+            locks.append(_get_path_lock(f))
+
+        threads = [threading.Thread(target=_grab) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert all(lock is locks[0] for lock in locks)
+        assert _get_path_lock(f) is locks[0]
+
+    def test_path_lock_key_normalizes_relative_paths(self, tmp_path: Path, monkeypatch):
+        from mcp_tap.config.writer import _get_path_lock
+
+        monkeypatch.chdir(tmp_path)
+        assert _get_path_lock(Path("config.json")) is _get_path_lock(tmp_path / "config.json")
+        assert _get_path_lock(Path("sub/../config.json")) is _get_path_lock(Path("config.json"))
+
+    def test_temp_file_skips_stale_leftover(self, tmp_path: Path, monkeypatch):
+        import itertools
+        import os
+
+        from mcp_tap.config import writer
+
+        f = tmp_path / "config.json"
+        stale = tmp_path / f".config_{os.getpid()}_0.tmp"
+        stale.write_text("stale")
+        monkeypatch.setattr(writer, "_tmp_counter", itertools.count())
+
+        write_server_config(f, "my-server", ServerConfig(command="npx", args=[]))
+
+        assert "my-server" in json.loads(f.read_text())["mcpServers"]
+        assert stale.read_text() == "stale"
+        assert list(tmp_path.glob("*.tmp")) == [stale]
+
+    def test_parent_directory_recreated_after_removal(self, tmp_path: Path):
+        import shutil
+
+        f = tmp_path / "client" / "config.json"
+        write_server_config(f, "one", ServerConfig(command="npx", args=[]))
+        shutil.rmtree(tmp_path / "client")
+
+        write_server_config(f, "two", ServerConfig(command="npx", args=[]))
+
+        assert list(json.loads(f.read_text())["mcpServers"]) == ["two"]
+
+    def test_parent_mkdir_skipped_once_ensured(self, tmp_path: Path, monkeypatch):
+        f = tmp_path / "config.json"
+        write_server_config(f, "one", ServerConfig(command="npx", args=[]))
+
+        def _fail(self: Path, *args: object, **kwargs: object) -> None:
+            raise AssertionError("parent directory should already be cached")
+
+        monkeypatch.setattr(Path, "mkdir", _fail)
+        write_server_config(f, "two", ServerConfig(command="npx", args=[]))
+        remove_server_config(f, "one")
+
+        assert list(json.loads(f.read_text())["mcpServers"]) == ["two"]
+
     def test_write_creates_parent_directories(self, tmp_path: Path):
         """Should create parent directories if they don't exist."""
         f = tmp_path / "subdir" / "deep" / "config.json"
@@ -239,6 +412,67 @@ class TestWriteServerConfigLocking:
         assert "my-server" in data["mcpServers"]
 
 
+# === Large-file splice ======================================================
+
+
+def _large_config() -> dict[str, object]:
+    history = {f"/proj/{i}": {"mcpServers": {"nested": {"command": "x"}}} for i in range(2000)}
+    return {"numStartups": 3, "projects": history, "mcpServers": {"a": {"command": "a"}}}
+
+
+class TestSpliceMcpServers:
+    def test_large_file_matches_full_serialization(self, tmp_path: Path):
+        f = tmp_path / ".claude.json"
+        f.write_text(json.dumps(_large_config(), indent=2, ensure_ascii=False) + "\n")
+
+        write_server_config(f, "b", ServerConfig(command="npx", args=["-y", "b"]))
+
+        expected = _large_config()
+        expected["mcpServers"]["b"] = {"command": "npx", "args": ["-y", "b"]}
+        assert f.read_text() == json.dumps(expected, indent=2, ensure_ascii=False) + "\n"
+
+    def test_large_file_read_once_per_write(self, tmp_path: Path, monkeypatch):
+        f = tmp_path / ".claude.json"
+        f.write_text(json.dumps(_large_config(), indent=2))
+        reads: list[Path] = []
+        real_read_bytes = Path.read_bytes
+        real_read_text = Path.read_text
+
+        def _read_bytes(self: Path) -> bytes:
+            reads.append(self)
+            return real_read_bytes(self)
+
+        def _read_text(self: Path, *args: object, **kwargs: object) -> str:
+            reads.append(self)
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_bytes", _read_bytes)
+        monkeypatch.setattr(Path, "read_text", _read_text)
+        write_server_config(f, "b", ServerConfig(command="npx", args=[]))
+        remove_server_config(f, "a")
+        monkeypatch.undo()
+
+        assert reads == [f, f]
+        assert list(json.loads(f.read_text())["mcpServers"]) == ["b"]
+
+    def test_nested_mcp_servers_untouched(self, tmp_path: Path):
+        f = tmp_path / ".claude.json"
+        f.write_text(json.dumps(_large_config()))
+
+        remove_server_config(f, "a")
+
+        data = json.loads(f.read_text())
+        assert data["mcpServers"] == {}
+        assert data["projects"]["/proj/0"]["mcpServers"] == {"nested": {"command": "x"}}
+
+    def test_missing_key_falls_back(self):
+        from mcp_tap.config.writer import _splice_mcp_servers
+
+        assert _splice_mcp_servers('{"projects": {"mcpServers": {}}}', {}) is None
+        assert _splice_mcp_servers('{"mcpServers": {}, "mcpServers": {}}', {}) is None
+        assert _splice_mcp_servers("[]", {}) is None
+
+
 # === Bug M2 — Async Config Reader Tests =====================================
 
 
@@ -4,12 +4,22 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from mcp_tap.connection.tester import test_server_connection as _test_server_conn
+from mcp_tap.connection.tester import test_server_connections as _test_server_conns
 from mcp_tap.models import ServerConfig
 
 # --- Helpers ---------------------------------------------------------------
 
 
+@pytest.fixture
+def _command_on_path():
+    """Keep stdio_client mocks reachable regardless of what is installed locally."""
+    with patch("mcp_tap.connection.tester._command_on_path", return_value=True):
+        yield
+
+
 def _server_config(
     command: str = "npx",
     args: list[str] | None = None,
@@ -21,6 +31,7 @@ def _server_config(
 # --- test_server_connection tests ------------------------------------------
 
 
+@pytest.mark.usefixtures("_command_on_path")
 class TestServerConnection:
     @patch("mcp_tap.connection.tester.stdio_client")
     async def test_happy_path(self, mock_stdio):
@@ -58,6 +69,51 @@ class TestServerConnection:
         assert result.server_name == "my-server"
         assert result.tools_discovered == ["tool_a", "tool_b"]
 
+    @staticmethod
+    def _wire_session(mock_stdio, mock_cs_cls, session):
+        session_cm = AsyncMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        stdio_cm = AsyncMock()
+        stdio_cm.__aenter__ = AsyncMock(return_value=(MagicMock(), MagicMock()))
+        stdio_cm.__aexit__ = AsyncMock(return_value=False)
+        mock_stdio.return_value = stdio_cm
+        mock_cs_cls.return_value = session_cm
+
+    @patch("mcp_tap.connection.tester.ClientSession")
+    @patch("mcp_tap.connection.tester.stdio_client")
+    async def test_ping_probe_skips_list_tools(self, mock_stdio, mock_cs_cls):
+        session = AsyncMock()
+        self._wire_session(mock_stdio, mock_cs_cls, session)
+
+        result = await _test_server_conn("my-server", _server_config(), discover_tools=False)
+
+        assert result.success is True
+        assert result.tools_discovered == []
+        session.send_ping.assert_awaited_once()
+        session.list_tools.assert_not_awaited()
+
+    @patch("mcp_tap.connection.tester.ClientSession")
+    @patch("mcp_tap.connection.tester.stdio_client")
+    async def test_ping_unsupported_falls_back_to_list_tools(self, mock_stdio, mock_cs_cls):
+        from mcp.shared.exceptions import McpError
+        from mcp.types import ErrorData
+
+        tool = MagicMock()
+        tool.name = "only_tool"
+        session = AsyncMock()
+        session.send_ping = AsyncMock(
+            side_effect=McpError(ErrorData(code=-32601, message="Method not found"))
+        )
+        session.list_tools = AsyncMock(return_value=MagicMock(tools=[tool]))
+        self._wire_session(mock_stdio, mock_cs_cls, session)
+
+        result = await _test_server_conn("my-server", _server_config(), discover_tools=False)
+
+        assert result.success is True
+        session.list_tools.assert_awaited_once()
+        assert result.tools_discovered == []
+
     async def test_timeout_error(self):
         """When the server doesn't respond in time, we get a timeout result."""
         with patch(
@@ -106,6 +162,7 @@ class TestServerConnection:
 # === Bug H4 — Connection Tester Improved Cleanup ===========================
 
 
+@pytest.mark.usefixtures("_command_on_path")
 class TestConnectionTesterCleanup:
     """Tests for _run_connection_test extraction and timeout cleanup (Bug H4)."""
 
@@ -149,3 +206,118 @@ class TestConnectionTesterCleanup:
             result = await _test_server_conn("timeout-val", _server_config(), timeout_seconds=42)
 
         assert "42s" in result.error
+
+
+# --- test_server_connections (batch) ----------------------------------------
+
+
+@pytest.mark.usefixtures("_command_on_path")
+class TestServerConnectionsBatch:
+    async def test_results_in_input_order_with_bounded_concurrency(self):
+        import asyncio
+
+        from mcp_tap.models import ConnectionTestResult
+
+        running = 0
+        peak = 0
+
+        async def _fake(name, params, *, timeout_seconds, discover_tools):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 if name != "s0" else 0.03)
+            running -= 1
+            return ConnectionTestResult(success=name != "s3", server_name=name)
+
+        items = [(f"s{i}", _server_config()) for i in range(6)]
+        with patch("mcp_tap.connection.tester.test_server_params", side_effect=_fake):
+            results = await _test_server_conns(items, concurrency=2)
+
+        assert [r.server_name for r in results] == [f"s{i}" for i in range(6)]
+        assert [r.success for r in results] == [True, True, True, False, True, True]
+        assert peak == 2
+
+    async def test_preflight_failures_skip_the_probe(self):
+        from mcp_tap.models import ConnectionTestResult
+
+        items = [("ok", _server_config()), ("blank", _server_config(command=""))]
+        with patch(
+            "mcp_tap.connection.tester.test_server_params",
+            new_callable=AsyncMock,
+            return_value=ConnectionTestResult(success=True, server_name="ok"),
+        ) as mock_probe:
+            results = await _test_server_conns(items)
+
+        assert mock_probe.await_count == 1
+        assert mock_probe.await_args.args[1].command == "npx"
+        assert [r.success for r in results] == [True, False]
+
+    async def test_adapter_forwards_options(self):
+        from mcp_tap.connection.tester import DefaultConnectionTester
+
+        with patch(
+            "mcp_tap.connection.tester.test_server_connections", new_callable=AsyncMock
+        ) as mock_batch:
+            mock_batch.return_value = []
+            await DefaultConnectionTester().test_server_connections(
+                [("a", _server_config())], concurrency=3, discover_tools=False
+            )
+
+        assert mock_batch.call_args.kwargs == {
+            "concurrency": 3,
+            "timeout_seconds": 15,
+            "discover_tools": False,
+        }
+
+
+# --- Command pre-flight ------------------------------------------------------
+
+
+class TestCommandPreflight:
+    async def test_missing_command_skips_spawn(self):
+        with patch("mcp_tap.connection.tester.stdio_client") as mock_stdio:
+            result = await _test_server_conn(
+                "ghost", ServerConfig(command="definitely-not-a-real-cmd-xyz", args=[])
+            )
+
+        mock_stdio.assert_not_called()
+        assert result.success is False
+        assert result.error.startswith("Command not found: definitely-not-a-real-cmd-xyz")
+
+    async def test_empty_command_rejected_without_spawn(self):
+        with patch("mcp_tap.connection.tester.stdio_client") as mock_stdio:
+            result = await _test_server_conn("blank", ServerConfig(command="  ", args=[]))
+
+        mock_stdio.assert_not_called()
+        assert result.success is False
+        assert "no command" in result.error
+
+    async def test_non_positive_timeout_rejected(self):
+        with patch("mcp_tap.connection.tester.asyncio.wait_for") as mock_wait:
+            result = await _test_server_conn(
+                "srv", ServerConfig(command="python", args=[]), timeout_seconds=0
+            )
+
+        mock_wait.assert_not_called()
+        assert result.success is False
+        assert "timeout_seconds must be > 0" in result.error
+
+    def test_hits_cached_misses_rechecked(self, tmp_path):
+        import os
+        import stat
+
+        from mcp_tap import _paths
+        from mcp_tap.connection import tester
+
+        config = ServerConfig(command="late-bin", args=[], env={"PATH": str(tmp_path)})
+        assert tester._command_on_path(config) is False
+
+        exe = tmp_path / "late-bin"
+        exe.write_text("#!/bin/sh\n")
+        exe.chmod(exe.stat().st_mode | stat.S_IXUSR)
+        assert tester._command_on_path(config) is True
+        assert _paths._which_cache[("late-bin", str(tmp_path))] == os.fspath(exe)
+
+        exe.unlink()
+        # Cached hit: a vanished binary is still reported by the spawn itself.
+        assert tester._command_on_path(config) is True
@@ -123,3 +123,164 @@ class TestResolveConfigLocations:
     def test_invalid_client_raises(self):
         with pytest.raises(ValueError):
             resolve_config_locations("not_a_client")
+
+
+# ═══════════════════════════════════════════════════════════════
+# User config path memoization
+# ═══════════════════════════════════════════════════════════════
+
+
+class TestUserConfigPathCache:
+    def test_user_config_paths_are_computed_once(self):
+        from mcp_tap.config import detection
+
+        detection._cursor_user_config.cache_clear()
+        with patch("mcp_tap.config.detection.Path.home") as mock_home:
+            mock_home.return_value = detection.Path("/fake-home")
+            first = detection._cursor_user_config()
+            second = detection._cursor_user_config()
+        detection._cursor_user_config.cache_clear()
+
+        assert first == detection.Path("/fake-home/.cursor/mcp.json")
+        assert second is first
+        mock_home.assert_called_once()
+
+
+class TestExistsCache:
+    def test_repeat_lookup_within_ttl_skips_stat(self, tmp_path):
+        from mcp_tap.config import detection
+
+        target = tmp_path / ".mcp.json"
+        assert detection._cached_exists(target) is False
+        target.write_text("{}")
+        # Still cached as missing until the TTL lapses or the entry is invalidated.
+        assert detection._cached_exists(target) is False
+
+        detection.invalidate_exists_cache(target)
+        assert detection._cached_exists(target) is True
+
+    def test_expired_entry_is_refreshed(self, tmp_path):
+        from mcp_tap.config import detection
+
+        target = tmp_path / ".mcp.json"
+        with patch("mcp_tap.config.detection.time.monotonic", return_value=100.0):
+            assert detection._cached_exists(target) is False
+        target.write_text("{}")
+        with patch("mcp_tap.config.detection.time.monotonic", return_value=103.0):
+            assert detection._cached_exists(target) is True
+
+    def test_atomic_write_invalidates_entry(self, tmp_path):
+        from mcp_tap.config.writer import write_server_config
+        from mcp_tap.models import ServerConfig
+
+        project = str(tmp_path)
+        before = resolve_config_path(MCPClient.CLAUDE_CODE, scope="project", project_path=project)
+        assert before.exists is False
+
+        write_server_config(before.path, "pg", ServerConfig(command="npx", args=["pg"]))
+
+        after = resolve_config_path(MCPClient.CLAUDE_CODE, scope="project", project_path=project)
+        assert after.exists is True
+
+
+class TestUserPathTable:
+    def test_detect_and_resolve_share_lookup_table(self, tmp_path):
+        from mcp_tap.config import detection
+
+        cursor = tmp_path / "cursor.json"
+        windsurf = tmp_path / "windsurf.json"
+        cursor.write_text("{}")
+        windsurf.write_text("{}")
+        table = {
+            MCPClient.CLAUDE_DESKTOP: lambda: None,
+            MCPClient.CLAUDE_CODE: lambda: tmp_path / "missing.json",
+            MCPClient.CURSOR: lambda: cursor,
+            MCPClient.WINDSURF: lambda: windsurf,
+        }
+        detection._resolve_path.cache_clear()
+        detection._user_config_paths.cache_clear()
+        with patch.dict(detection._USER_PATH_FNS, table):
+            detected = detection.detect_clients()
+            resolved = resolve_config_path(MCPClient.CLAUDE_CODE)
+            with pytest.raises(ClientNotFoundError, match="not supported"):
+                resolve_config_path(MCPClient.CLAUDE_DESKTOP)
+        detection._resolve_path.cache_clear()
+        detection._user_config_paths.cache_clear()
+
+        assert [loc.client for loc in detected] == [MCPClient.CURSOR, MCPClient.WINDSURF]
+        assert resolved.path == str(tmp_path / "missing.json")
+        assert resolved.exists is False
+
+
+class TestResolvePathCache:
+    def test_path_cached_but_existence_rechecked(self, tmp_path):
+        from mcp_tap.config import detection
+
+        detection._resolve_path.cache_clear()
+        project = str(tmp_path)
+        first = resolve_config_path("cursor", scope="project", project_path=project)
+        (tmp_path / ".cursor").mkdir()
+        (tmp_path / ".cursor" / "mcp.json").write_text("{}")
+        detection.invalidate_exists_cache()
+        second = resolve_config_path(MCPClient.CURSOR, scope="project", project_path=project)
+
+        assert first.exists is False
+        assert second.exists is True
+        assert second.path == first.path
+        info = detection._resolve_path.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_errors_are_not_cached(self):
+        from mcp_tap.config import detection
+
+        detection._resolve_path.cache_clear()
+        for _ in range(2):
+            with pytest.raises(ClientNotFoundError, match="project_path is required"):
+                resolve_config_path(MCPClient.CURSOR, scope="project")
+        assert detection._resolve_path.cache_info().currsize == 0
+
+    def test_user_paths_flattened_once(self, tmp_path):
+        from unittest.mock import MagicMock
+
+        from mcp_tap.config import detection
+
+        path_fn = MagicMock(return_value=tmp_path / "cursor.json")
+        detection._user_config_paths.cache_clear()
+        with patch.dict(detection._USER_PATH_FNS, {MCPClient.CURSOR: path_fn}):
+            detection.resolve_config_locations("all")
+            locations = detection.resolve_config_locations("all")
+        detection._user_config_paths.cache_clear()
+
+        path_fn.assert_called_once()
+        cursor = next(loc for loc in locations if loc.client == MCPClient.CURSOR)
+        assert cursor.path == str(tmp_path / "cursor.json")
+
+
+class TestStatTtlEnv:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("", 2.0), ("0.5", 0.5), ("0", 0.0), ("-1", 2.0), ("soon", 2.0)],
+    )
+    def test_parses_env_override(self, value, expected):
+        from mcp_tap.config.detection import _stat_ttl_from_env
+
+        assert _stat_ttl_from_env({"MCP_TAP_STAT_TTL": value}) == expected
+
+    def test_zero_ttl_disables_cache(self, tmp_path, monkeypatch):
+        from mcp_tap.config import detection
+
+        monkeypatch.setattr(detection, "_STAT_TTL_SECONDS", 0.0)
+        target = tmp_path / ".mcp.json"
+        assert detection._cached_exists(target) is False
+        target.write_text("{}")
+        assert detection._cached_exists(target) is True
+        assert str(target) not in detection._stat_cache
+
+    def test_missing_project_configs_are_negative_cached(self, tmp_path):
+        from mcp_tap.config import detection
+
+        with patch.object(detection.Path, "exists", autospec=True, return_value=False) as stat:
+            resolve_config_locations("all", scope="project", project_path=str(tmp_path))
+            resolve_config_locations("all", scope="project", project_path=str(tmp_path))
+
+        assert stat.call_count == len(detection._PROJECT_CONFIGS)
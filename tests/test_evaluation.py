@@ -14,12 +14,15 @@ from mcp_tap.evaluation.github import (
     _cache_get,
     _cache_set,
     _check_rate_limit,
+    _get_github_semaphore,
     _github_headers,
     _is_rate_limited,
     _parse_github_url,
     _resolve_github_token,
     clear_cache,
+    clear_disk_cache,
     fetch_repo_metadata,
+    fetch_repos_metadata,
     github_runtime_status,
 )
 from mcp_tap.evaluation.scorer import score_maturity
@@ -275,6 +278,18 @@ class TestGitHubCacheGet:
 
         assert result is None
 
+    def test_cache_evicts_least_recently_used_over_maxsize(self) -> None:
+        """Should evict the least recently read entry once the cap is exceeded."""
+        with patch("mcp_tap.evaluation.github._CACHE_MAXSIZE", 2):
+            _cache_set("a/a", MaturitySignals(stars=1))
+            _cache_set("b/b", MaturitySignals(stars=2))
+            _cache_get("a/a")
+            _cache_set("c/c", MaturitySignals(stars=3))
+
+        assert _cache_get("a/a") is not None
+        assert _cache_get("b/b") is None
+        assert _cache_get("c/c") is not None
+
 
 class TestGitHubCacheClear:
     """Tests for the clear_cache() function."""
@@ -336,6 +351,16 @@ class TestGitHubRateLimit:
 
         assert _is_rate_limited() is False
 
+    def test_malformed_headers_are_ignored(self) -> None:
+        """Should neither raise nor gate on non-numeric rate-limit headers."""
+        _check_rate_limit(httpx.Response(200, headers={"X-RateLimit-Remaining": "n/a"}))
+        assert _is_rate_limited() is False
+
+        resp = httpx.Response(
+            200, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "soon"}
+        )
+        _check_rate_limit(resp)
+
     def test_rate_limit_recovers_after_reset(self) -> None:
         """Should no longer be rate limited after reset time passes."""
         import mcp_tap.evaluation.github as gh_mod
@@ -381,6 +406,17 @@ class TestGitHubHeaders:
 
         assert headers["Accept"] == "application/vnd.github+json"
 
+    def test_headers_reused_until_token_changes(self) -> None:
+        """Should reuse the same dict for one token and rebuild when it changes."""
+        with patch.dict("os.environ", {"GITHUB_TOKEN": "ghp_one"}):
+            first = _github_headers()
+            second = _github_headers()
+        with patch.dict("os.environ", {"GITHUB_TOKEN": "ghp_two"}):
+            third = _github_headers()
+
+        assert first is second
+        assert third["Authorization"] == "Bearer ghp_two"
+
 
 class TestGitHubTokenResolution:
     """Tests for token resolution order and runtime state introspection."""
@@ -414,7 +450,7 @@ class TestGitHubTokenResolution:
         assert token == "ghp_cli_token"
         assert source == "gh_cli"
 
-    def test_runtime_status_reports_rate_limit_window(self) -> None:
+    async def test_runtime_status_reports_rate_limit_window(self) -> None:
         """Should expose active rate-limit state and reset seconds."""
         import mcp_tap.evaluation.github as gh_mod
 
@@ -422,9 +458,12 @@ class TestGitHubTokenResolution:
 
         with (
             patch.dict("os.environ", {}, clear=True),
-            patch("mcp_tap.evaluation.github._resolve_gh_cli_token", return_value=None),
+            patch(
+                "mcp_tap.evaluation.github._resolve_gh_cli_token_async",
+                AsyncMock(return_value=None),
+            ),
         ):
-            status = github_runtime_status()
+            status = await github_runtime_status()
 
         assert status["has_auth"] is False
         assert status["auth_source"] == "none"
@@ -432,6 +471,33 @@ class TestGitHubTokenResolution:
         assert isinstance(status["rate_limit_reset_seconds"], int)
         assert status["rate_limit_reset_seconds"] > 0
 
+    async def test_runtime_status_resolves_token_off_loop(self) -> None:
+        """A cold status check should use the async gh lookup, never the blocking one."""
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch(
+                "mcp_tap.evaluation.github._resolve_gh_cli_token_async",
+                AsyncMock(return_value="gho_status"),
+            ),
+            patch("mcp_tap.evaluation.github._resolve_gh_cli_token") as sync_gh,
+        ):
+            status = await github_runtime_status()
+
+        sync_gh.assert_not_called()
+        assert status["has_auth"] is True
+        assert status["auth_source"] == "gh_cli"
+
+    def test_rate_limit_warning_never_spawns_gh(self) -> None:
+        """The rate-limit hint should report the known token source without a lookup."""
+        resp = httpx.Response(403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"})
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch("mcp_tap.evaluation.github._resolve_gh_cli_token") as sync_gh,
+        ):
+            _check_rate_limit(resp)
+
+        sync_gh.assert_not_called()
+
 
 # ─── Cache integration with fetch_repo_metadata (Fix C2) ─────
 
@@ -524,3 +590,371 @@ class TestFetchRepoMetadataCache:
 
         assert result is not None
         client.get.assert_called_once()
+
+
+# ─── Batched lookups (GraphQL) ───────────────────────────────
+
+
+class TestFetchReposMetadataBatch:
+    """Tests for fetch_repos_metadata batching and REST fallback."""
+
+    async def test_token_batches_misses_into_one_graphql_post(self) -> None:
+        """Should fetch all uncached repos with a single aliased GraphQL request."""
+        _cache_set("cached/repo", MaturitySignals(stars=1))
+        payload = {
+            "data": {
+                "r0": {
+                    "stargazerCount": 500,
+                    "forkCount": 50,
+                    "issues": {"totalCount": 4},
+                    "pullRequests": {"totalCount": 2},
+                    "pushedAt": "2026-02-10T00:00:00Z",
+                    "isArchived": False,
+                    "licenseInfo": {"spdxId": "MIT"},
+                },
+                "r1": None,
+            }
+        }
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post = AsyncMock(return_value=_mock_github_response(payload))
+        urls = [
+            "https://github.com/cached/repo",
+            "https://github.com/a/one",
+            "https://github.com/b/missing",
+            "https://gitlab.com/c/other",
+        ]
+
+        with patch.dict("os.environ", {"GITHUB_TOKEN": "ghp_test"}):
+            result = await fetch_repos_metadata(urls, client)
+
+        client.post.assert_awaited_once()
+        client.get.assert_not_called()
+        body = client.post.await_args.kwargs["json"]
+        assert body["variables"] == {"o0": "a", "n0": "one", "o1": "b", "n1": "missing"}
+        assert result["https://github.com/cached/repo"].stars == 1
+        one = result["https://github.com/a/one"]
+        assert one.stars == 500
+        assert one.open_issues == 6
+        assert one.license == "MIT"
+        assert result["https://github.com/b/missing"] is None
+        assert result["https://gitlab.com/c/other"] is None
+        assert _cache_get("a/one") is not None
+
+    @pytest.mark.parametrize("payload", [["not", "an", "object"], {"data": ["r0"]}])
+    async def test_non_object_graphql_body_fails_batch(self, payload: object) -> None:
+        """A 200 body that is not a GraphQL result object should fail the batch quietly."""
+        import mcp_tap.evaluation.github as gh_mod
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post = AsyncMock(return_value=_mock_github_response(payload))
+        urls = ["https://github.com/a/one", "https://github.com/b/two"]
+
+        with patch.dict("os.environ", {"GITHUB_TOKEN": "ghp_test"}):
+            result = await fetch_repos_metadata(urls, client)
+
+        assert result == dict.fromkeys(urls)
+        assert {"a/one", "b/two"} <= set(gh_mod._neg_cache)
+
+    @pytest.mark.parametrize(
+        ("payload", "headers"),
+        [
+            ({"data": None, "errors": [{"type": "RATE_LIMITED", "message": "slow"}]}, {}),
+            ({"data": {"r0": None, "r1": None}}, {"X-RateLimit-Remaining": "0"}),
+        ],
+    )
+    async def test_rate_limited_graphql_batch_not_negative_cached(
+        self, payload: dict, headers: dict[str, str]
+    ) -> None:
+        """Rate-limit refusals reported in a 200 body should leave the repos retryable."""
+        import json
+
+        import mcp_tap.evaluation.github as gh_mod
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.post = AsyncMock(
+            return_value=httpx.Response(200, content=json.dumps(payload).encode(), headers=headers)
+        )
+        urls = ["https://github.com/a/one", "https://github.com/b/two"]
+
+        with patch.dict("os.environ", {"GITHUB_TOKEN": "ghp_test"}):
+            result = await fetch_repos_metadata(urls, client)
+
+        assert result == dict.fromkeys(urls)
+        assert not gh_mod._neg_cache
+
+    async def test_rest_batch_isolates_bad_bodies(self, tmp_path, monkeypatch) -> None:
+        """A non-JSON or non-object REST body should fail only its own repo."""
+        import mcp_tap.evaluation.github as gh_mod
+
+        monkeypatch.setattr(gh_mod, "_DISK_CACHE_DIR", tmp_path)
+        bodies = {
+            "/repos/good/repo": b'{"stargazers_count": 5}',
+            "/repos/html/repo": b"<html>",
+            "/repos/list/repo": b"[1, 2]",
+        }
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=bodies[request.url.path])
+
+        urls = [f"https://github.com/{path.split('/', 2)[2]}" for path in bodies]
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            with (
+                patch.dict("os.environ", {}, clear=True),
+                patch(
+                    "mcp_tap.evaluation.github._resolve_gh_cli_token_async",
+                    AsyncMock(return_value=None),
+                ),
+            ):
+                result = await fetch_repos_metadata(urls, client)
+
+        assert result[urls[0]].stars == 5
+        assert result[urls[1]] is None
+        assert result[urls[2]] is None
+        assert {"html/repo", "list/repo"} <= set(gh_mod._neg_cache)
+        assert list(gh_mod._disk_get_many(["good/repo"])) == ["good/repo"]
+
+    async def test_without_token_falls_back_to_rest(self) -> None:
+        """GraphQL requires auth, so unauthenticated batches use one REST GET per repo."""
+        data = {"stargazers_count": 7, "forks_count": 1, "open_issues_count": 0}
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_mock_github_response(data))
+
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch(
+                "mcp_tap.evaluation.github._resolve_gh_cli_token_async",
+                AsyncMock(return_value=None),
+            ),
+        ):
+            result = await fetch_repos_metadata(
+                ["https://github.com/a/one", "https://github.com/b/two"], client
+            )
+
+        client.post.assert_not_called()
+        assert client.get.await_count == 2
+        assert [s.stars for s in result.values()] == [7, 7]
+
+
+class TestTokenResolutionOffLoop:
+    """Tests for resolving the gh CLI token without blocking the event loop."""
+
+    async def test_fetch_path_uses_async_subprocess_once(self) -> None:
+        """Should spawn `gh auth token` via asyncio and memoize the result."""
+        proc = AsyncMock()
+        proc.communicate = AsyncMock(return_value=(b"gho_async\n", b""))
+        proc.returncode = 0
+        spawn = AsyncMock(return_value=proc)
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_mock_github_response({}, status_code=404))
+
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch("mcp_tap.evaluation.github.asyncio.create_subprocess_exec", spawn),
+            patch("mcp_tap.evaluation.github._resolve_gh_cli_token") as sync_gh,
+        ):
+            await fetch_repo_metadata("https://github.com/a/one", client)
+            await fetch_repo_metadata("https://github.com/b/two", client)
+            token, source = _resolve_github_token()
+
+        spawn.assert_awaited_once()
+        assert spawn.await_args.args[:3] == ("gh", "auth", "token")
+        sync_gh.assert_not_called()
+        assert (token, source) == ("gho_async", "gh_cli")
+
+    async def test_missing_gh_binary_resolves_to_no_token(self) -> None:
+        """Should treat a missing gh executable as no token."""
+        from mcp_tap.evaluation.github import _resolve_gh_cli_token_async
+
+        with patch(
+            "mcp_tap.evaluation.github.asyncio.create_subprocess_exec",
+            AsyncMock(side_effect=FileNotFoundError("gh")),
+        ):
+            assert await _resolve_gh_cli_token_async() is None
+
+
+class TestFetchCoalescing:
+    """Tests for sharing one request between concurrent fetches of a repo."""
+
+    async def test_concurrent_fetches_share_one_request(self) -> None:
+        """Concurrent callers for the same repo should trigger a single HTTP request."""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def _slow_get(*args: object, **kwargs: object) -> httpx.Response:
+            await release.wait()
+            return _mock_github_response({"stargazers_count": 9})
+
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(side_effect=_slow_get)
+
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            patch(
+                "mcp_tap.evaluation.github._resolve_gh_cli_token_async",
+                AsyncMock(return_value=None),
+            ),
+        ):
+            tasks = [
+                asyncio.create_task(fetch_repo_metadata("https://github.com/same/repo", client))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert client.get.await_count == 1
+        assert [r.stars for r in results] == [9, 9, 9]
+
+
+class TestGitHubDiskCache:
+    """Tests for the persistent disk tier under the in-memory cache."""
+
+    @pytest.fixture()
+    def disk_dir(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        cache_dir = tmp_path / "github"
+        monkeypatch.setattr("mcp_tap.evaluation.github._DISK_CACHE_DIR", cache_dir)
+        return cache_dir
+
+    async def test_entry_survives_memory_loss(self, disk_dir) -> None:
+        """Should read through to disk when the in-memory tier is cold (new process)."""
+        import mcp_tap.evaluation.github as gh_mod
+
+        gh_mod._disk_set_many({"owner/repo": MaturitySignals(stars=42, license="MIT")})
+        client = AsyncMock()
+
+        result = await fetch_repo_metadata("https://github.com/owner/repo", client)
+
+        assert result == MaturitySignals(stars=42, license="MIT")
+        assert "owner/repo" in gh_mod._cache
+        client.get.assert_not_awaited()
+
+    async def test_fetched_entry_is_written_through(self, disk_dir) -> None:
+        """A network fetch should persist its result for the next process."""
+        import mcp_tap.evaluation.github as gh_mod
+
+        client = AsyncMock()
+        client.get = AsyncMock(return_value=_mock_github_response({"stargazers_count": 7}))
+        with patch(
+            "mcp_tap.evaluation.github._resolve_gh_cli_token_async",
+            AsyncMock(return_value=None),
+        ):
+            await fetch_repo_metadata("https://github.com/new/repo", client)
+
+        age, signals = gh_mod._disk_get_many(["new/repo"])["new/repo"]
+        assert signals.stars == 7
+        assert age >= 0
+
+    def test_expired_disk_entry_is_ignored(self, disk_dir) -> None:
+        """Should treat a disk entry older than the TTL as a miss."""
+        import mcp_tap.evaluation.github as gh_mod
+
+        gh_mod._disk_set_many({"old/repo": MaturitySignals(stars=1)})
+
+        with patch("mcp_tap.evaluation.github.time.time", return_value=time.time() + 901):
+            assert gh_mod._disk_get_many(["old/repo"]) == {}
+
+    def test_expired_disk_entry_is_deleted_on_read(self, disk_dir) -> None:
+        """An expired entry should be removed from disk, not just skipped."""
+        import mcp_tap.evaluation.github as gh_mod
+
+        gh_mod._disk_set_many({"old/repo": MaturitySignals(stars=1)})
+        path = gh_mod._disk_cache_path("old/repo")
+
+        with patch("mcp_tap.evaluation.github.time.time", return_value=time.time() + 901):
+            gh_mod._disk_get_many(["old/repo"])
+
+        assert not path.exists()
+
+    def test_corrupt_disk_entry_is_ignored(self, disk_dir) -> None:
+        """Should fall back to a miss when the cache file cannot be parsed, and delete it."""
+        import mcp_tap.evaluation.github as gh_mod
+
+        gh_mod._disk_set_many({"bad/repo": MaturitySignals(stars=1), "ok/repo": MaturitySignals()})
+        bad_path = disk_dir / gh_mod._disk_cache_path("bad/repo").name
+        bad_path.write_text("{not json", "utf-8")
+
+        assert list(gh_mod._disk_get_many(["bad/repo", "ok/repo"])) == ["ok/repo"]
+        assert not bad_path.exists()
+
+    def test_write_prunes_expired_entries(self, disk_dir) -> None:
+        """Writing should delete entries older than the TTL even if never read again."""
+        import os
+
+        import mcp_tap.evaluation.github as gh_mod
+
+        gh_mod._disk_set_many({"stale/repo": MaturitySignals(stars=1)})
+        stale = gh_mod._disk_cache_path("stale/repo")
+        old = time.time() - 901
+        os.utime(stale, (old, old))
+
+        gh_mod._disk_set_many({"fresh/repo": MaturitySignals(stars=2)})
+
+        assert not stale.exists()
+        assert gh_mod._disk_cache_path("fresh/repo").exists()
+
+    def test_clear_cache_keeps_disk_entries(self, disk_dir) -> None:
+        """clear_cache() resets memory only; clear_disk_cache() purges the disk tier."""
+        import mcp_tap.evaluation.github as gh_mod
+
+        gh_mod._disk_set_many({"a/b": MaturitySignals(stars=1)})
+
+        clear_cache()
+        assert len(list(disk_dir.glob("*.json"))) == 1
+
+        clear_disk_cache()
+        assert list(disk_dir.glob("*.json")) == []
+
+
+class TestPerLoopConcurrencyPrimitives:
+    """Tests for loop-scoped GitHub request semaphores."""
+
+    def test_each_event_loop_gets_its_own_semaphore(self) -> None:
+        """Should reuse the semaphore within a loop and create a new one per loop."""
+        import asyncio
+
+        async def _grab() -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+            return _get_github_semaphore(), _get_github_semaphore()
+
+        first_a, first_b = asyncio.run(_grab())
+        second, _ = asyncio.run(_grab())
+
+        assert first_a is first_b
+        assert second is not first_a
+
+
+class TestNegativeCache:
+    """Tests for briefly remembering failed repo lookups."""
+
+    async def test_404_is_not_refetched_within_ttl(self) -> None:
+        """A missing repo should cost one request, not one per call."""
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_mock_github_response({}, status_code=404))
+
+        assert await fetch_repo_metadata("https://github.com/gone/repo", client) is None
+        assert await fetch_repo_metadata("https://github.com/gone/repo", client) is None
+
+        assert client.get.await_count == 1
+
+    async def test_404_refetched_after_negative_ttl(self) -> None:
+        """Should probe again once the negative entry expires."""
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_mock_github_response({}, status_code=404))
+
+        await fetch_repo_metadata("https://github.com/gone/repo", client)
+        later = time.monotonic() + 301
+        with patch("mcp_tap.evaluation.github.time.monotonic", return_value=later):
+            await fetch_repo_metadata("https://github.com/gone/repo", client)
+
+        assert client.get.await_count == 2
+
+    async def test_rate_limit_response_is_not_negative_cached(self) -> None:
+        """403/429 are transient and must not suppress later lookups."""
+        client = AsyncMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=_mock_github_response({}, status_code=403))
+
+        await fetch_repo_metadata("https://github.com/busy/repo", client)
+        await fetch_repo_metadata("https://github.com/busy/repo", client)
+
+        assert client.get.await_count == 2
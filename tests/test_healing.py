@@ -315,6 +315,41 @@ class TestClassifier:
         )
         assert diagnosis.category != ErrorCategory.MISSING_ENV_VAR
 
+    @pytest.mark.parametrize(
+        ("error_msg", "command"),
+        [
+            ("Command not found: uvx", "uvx"),
+            ("FileNotFoundError: [Errno 2] No such file or directory: 'docker'", "docker"),
+            ("'mcp-foo' executable not found", "mcp-foo"),
+            ("ENOENT", "unknown"),
+        ],
+    )
+    def test_command_name_extracted_from_each_message_shape(self, error_msg: str, command: str):
+        """Each supported 'not found' message shape should yield the command name."""
+        from mcp_tap.healing.classifier import classify_error
+
+        diagnosis = classify_error(_failed_connection(error_msg))
+
+        assert f"'{command}'" in diagnosis.explanation
+
+    def test_command_extraction_is_not_slowed_by_quote_runs(self):
+        """A long run of quotes must not make the command regex backtrack."""
+        from mcp_tap.healing.classifier import classify_error
+
+        diagnosis = classify_error(_failed_connection("ENOENT " + "'" * 5000))
+
+        assert diagnosis.category == ErrorCategory.COMMAND_NOT_FOUND
+        assert "'unknown'" in diagnosis.explanation
+
+    def test_env_var_name_reported_in_explanation(self):
+        """The env var name found in the message should appear in the explanation."""
+        from mcp_tap.healing.classifier import classify_error
+
+        diagnosis = classify_error(_failed_connection("Error: SLACK_BOT_TOKEN is not set"))
+
+        assert diagnosis.category == ErrorCategory.MISSING_ENV_VAR
+        assert "(SLACK_BOT_TOKEN)" in diagnosis.explanation
+
 
 # ═══════════════════════════════════════════════════════════════
 # 2. Fixer Tests
@@ -327,7 +362,7 @@ class TestFixer:
     # ── COMMAND_NOT_FOUND ─────────────────────────────────────
 
     @patch(
-        "mcp_tap.healing.fixer.shutil.which",
+        "mcp_tap._paths.shutil.which",
         return_value="/usr/local/bin/npx",
     )
     def test_command_not_found_resolves_path(self, _mock_which):
@@ -346,7 +381,25 @@ class TestFixer:
         assert fix.new_config is not None
         assert fix.new_config.command == "/usr/local/bin/npx"
 
-    @patch("mcp_tap.healing.fixer.shutil.which", return_value=None)
+    def test_runner_lookup_cached_but_misses_rechecked(self):
+        """Repeated fixes should reuse a found runner but re-check missing commands."""
+        from mcp_tap.healing.fixer import generate_fix
+
+        paths = {"npx": "/usr/local/bin/npx"}
+        diag = _diagnosis(category=ErrorCategory.COMMAND_NOT_FOUND)
+        config = _server_config(command="some-server")
+
+        with patch("mcp_tap._paths.shutil.which", side_effect=paths.get) as mock_which:
+            first = generate_fix(diag, config)
+            second = generate_fix(diag, config)
+
+        assert first == second
+        assert first.new_config is not None
+        assert first.new_config.command == "/usr/local/bin/npx"
+        looked_up = [c.args[0] for c in mock_which.call_args_list]
+        assert looked_up == ["some-server", "npx", "some-server"]
+
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
     def test_command_not_found_no_resolution(self, _mock_which):
         """Should require user action when command cannot be found."""
         from mcp_tap.healing.fixer import generate_fix
@@ -362,7 +415,7 @@ class TestFixer:
         assert fix.requires_user_action is True
 
     @patch(
-        "mcp_tap.healing.fixer.shutil.which",
+        "mcp_tap._paths.shutil.which",
         return_value="/usr/local/bin/npx",
     )
     def test_command_not_found_preserves_args(self, _mock_which):
@@ -509,7 +562,7 @@ class TestFixer:
             original_error=f"Error for {category}",
         )
         with patch(
-            "mcp_tap.healing.fixer.shutil.which",
+            "mcp_tap._paths.shutil.which",
             return_value="/usr/bin/npx",
         ):
             fix = generate_fix(diag, _server_config())
@@ -526,6 +579,12 @@ class TestFixer:
         with pytest.raises(AttributeError):
             fix.description = "changed"  # type: ignore[misc]
 
+    def test_every_category_but_unknown_has_a_strategy(self):
+        """Each known category should dispatch to its own fix builder."""
+        from mcp_tap.healing.fixer import _FIX_BUILDERS
+
+        assert set(_FIX_BUILDERS) == set(ErrorCategory) - {ErrorCategory.UNKNOWN}
+
 
 # ═══════════════════════════════════════════════════════════════
 # 3. Retry Loop Tests
@@ -966,6 +1025,7 @@ class TestRetryLoop:
         call_kwargs = [c.kwargs for c in mock_test_conn.call_args_list]
         timeouts = [kw["timeout_seconds"] for kw in call_kwargs]
         assert timeouts == [15, 30, 60]
+        assert all(kw["discover_tools"] is False for kw in call_kwargs)
 
     # ── Frozen models ─────────────────────────────────────────
 
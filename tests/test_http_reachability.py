@@ -142,4 +142,27 @@ class TestHttpReachabilityCheckerTimeout:
 
         await checker.check_reachability("srv", "https://example.com")
 
-        mock_http_client.head.assert_awaited_once_with("https://example.com", timeout=10.0)
+        mock_http_client.head.assert_awaited_once_with(
+            "https://example.com", timeout=10.0, follow_redirects=False
+        )
+
+
+class TestHttpReachabilityBatch:
+    """Tests for check_many."""
+
+    async def test_check_many_preserves_order(self, mock_http_client: MagicMock):
+        statuses = {"https://a.example": 200, "https://b.example": 503, "https://c.example": 401}
+
+        async def _head(url: str, **kwargs: object) -> httpx.Response:
+            return httpx.Response(status_code=statuses[url])
+
+        mock_http_client.head = AsyncMock(side_effect=_head)
+        checker = HttpReachabilityChecker(mock_http_client)
+
+        results = await checker.check_many(
+            [("a", "https://a.example"), ("b", "https://b.example"), ("c", "https://c.example")],
+            concurrency=2,
+        )
+
+        assert [r.server_name for r in results] == ["a", "b", "c"]
+        assert [r.success for r in results] == [True, False, True]
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
-
 import httpx
 
 from mcp_tap.inspector.extractor import extract_config_hints
-from mcp_tap.inspector.fetcher import _github_raw_url, _gitlab_raw_url, fetch_readme
+from mcp_tap.inspector.fetcher import (
+    _MAX_README_BYTES,
+    _github_raw_url,
+    _gitlab_raw_url,
+    fetch_readme,
+)
 
 # ─── Fetcher URL conversion ─────────────────────────────────
 
@@ -43,30 +46,43 @@ class TestGitLabRawUrl:
 # ─── Fetcher async ───────────────────────────────────────────
 
 
+def _client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 class TestFetchReadme:
     async def test_successful_fetch(self) -> None:
-        mock_response = httpx.Response(200, text="# My Server\nThis is a test.")
-        client = AsyncMock(spec=httpx.AsyncClient)
-        client.get = AsyncMock(return_value=mock_response)
+        requested: list[str] = []
 
-        result = await fetch_readme("https://github.com/owner/repo", client)
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return httpx.Response(200, text="# My Server\nThis is a test.")
+
+        async with _client(handler) as client:
+            result = await fetch_readme("https://github.com/owner/repo", client)
         assert result == "# My Server\nThis is a test."
+        assert requested == ["https://raw.githubusercontent.com/owner/repo/HEAD/README.md"]
 
     async def test_404_returns_none(self) -> None:
-        mock_response = httpx.Response(404)
-        client = AsyncMock(spec=httpx.AsyncClient)
-        client.get = AsyncMock(return_value=mock_response)
-
-        result = await fetch_readme("https://github.com/owner/repo", client)
+        async with _client(lambda request: httpx.Response(404)) as client:
+            result = await fetch_readme("https://github.com/owner/repo", client)
         assert result is None
 
     async def test_network_error_returns_none(self) -> None:
-        client = AsyncMock(spec=httpx.AsyncClient)
-        client.get = AsyncMock(side_effect=httpx.ConnectError("Connection failed"))
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection failed")
 
-        result = await fetch_readme("https://github.com/owner/repo", client)
+        async with _client(handler) as client:
+            result = await fetch_readme("https://github.com/owner/repo", client)
         assert result is None
 
+    async def test_large_readme_is_truncated(self) -> None:
+        body = "é" * _MAX_README_BYTES
+
+        async with _client(lambda request: httpx.Response(200, text=body)) as client:
+            result = await fetch_readme("https://github.com/owner/repo", client)
+        assert result == body[: _MAX_README_BYTES // 2]
+
 
 # ─── Extractor ───────────────────────────────────────────────
 
@@ -175,6 +191,25 @@ class TestExtractConfigHints:
         var_names = [ev.name for ev in hints.env_vars_mentioned]
         assert "MY_TOKEN" in var_names
 
+    def test_code_block_mention_wins_over_earlier_prose(self) -> None:
+        readme = (
+            "Set the API_TOKEN env var first.\n"
+            "Also export LOG_LEVEL_NAME as a variable.\n"
+            "```bash\nexport API_TOKEN=xyz  # required\n```\n"
+        )
+        hints = extract_config_hints(readme)
+        assert [(ev.name, ev.context) for ev in hints.env_vars_mentioned] == [
+            ("API_TOKEN", "export API_TOKEN=xyz  # required"),
+            ("LOG_LEVEL_NAME", "Also export LOG_LEVEL_NAME as a variable."),
+        ]
+        assert hints.env_vars_mentioned[0].is_required is True
+
+    def test_env_var_glued_to_lowercase_is_ignored(self) -> None:
+        readme = "```\nexport MY_TOKENvalue=abc API_KEY_ID=1\n```"
+        hints = extract_config_hints(readme)
+        var_names = [ev.name for ev in hints.env_vars_mentioned]
+        assert var_names == ["API_KEY_ID"]
+
 
 # ─── Edge cases ──────────────────────────────────────────────
 
@@ -200,3 +235,45 @@ class TestExtractorEdgeCases:
         readme = "Connect via SSE at port 3000."
         hints = extract_config_hints(readme)
         assert "sse" in hints.transport_hints
+
+    def test_json_config_spans_inner_object(self) -> None:
+        readme = (
+            '```json\n{"mcpServers": {"pg": {\n  "command": "npx",\n  "args": ["-y"]\n}}}\n```\n'
+        )
+        hints = extract_config_hints(readme)
+        assert hints.json_config_blocks == [
+            '{"mcpServers": {"pg": {\n  "command": "npx",\n  "args": ["-y"]\n}'
+        ]
+
+    def test_json_config_ignores_unclosed_braces(self) -> None:
+        readme = "```\n" + "{" * 5000 + '"command"\n```\n'
+        hints = extract_config_hints(readme)
+        assert hints.json_config_blocks == []
+
+    def test_env_vars_require_underscore(self) -> None:
+        readme = "Set the env variable API_KEY (not API, HTTP_ or X_Y) for the HTTPS endpoint."
+        hints = extract_config_hints(readme)
+        assert [h.name for h in hints.env_vars_mentioned] == ["API_KEY", "HTTP_"]
+
+    def test_install_commands_deduplicated_in_order(self) -> None:
+        readme = "```\nuvx b\nnpx -y a\n```\n```\nnpx -y a\nuvx b\npip install c\n```\n"
+        hints = extract_config_hints(readme)
+        assert hints.install_commands == ["uvx b", "npx -y a", "pip install c"]
+
+    def test_commands_match_any_case_and_keep_original_text(self) -> None:
+        readme = "```\nDocker Run -e GITHUB_TOKEN ghcr.io/x\nİ NPX -Y @scope/Server\n```\n"
+        hints = extract_config_hints(readme)
+        assert hints.install_commands == [
+            "Docker Run -e GITHUB_TOKEN ghcr.io/x",
+            "NPX -Y @scope/Server",
+        ]
+        assert hints.command_patterns == ["NPX -Y @scope/Server"]
+
+    def test_names_on_one_line_share_context(self) -> None:
+        readme = "Required env: FOO_ONE, FOO_TWO and FOO_THREE.\nAlso BAR_ONE here."
+        hints = extract_config_hints(readme)
+        assert [h.name for h in hints.env_vars_mentioned] == ["FOO_ONE", "FOO_TWO", "FOO_THREE"]
+        assert {h.context for h in hints.env_vars_mentioned} == {
+            "Required env: FOO_ONE, FOO_TWO and FOO_THREE."
+        }
+        assert all(h.is_required for h in hints.env_vars_mentioned)
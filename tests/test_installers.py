@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -10,7 +12,7 @@ from mcp_tap.errors import InstallerNotFoundError
 from mcp_tap.installer.docker import DockerInstaller
 from mcp_tap.installer.npm import NpmInstaller
 from mcp_tap.installer.pip import PipInstaller
-from mcp_tap.installer.resolver import resolve_installer
+from mcp_tap.installer.resolver import resolve_installer, resolve_installers
 from mcp_tap.models import RegistryType
 
 # ═══════════════════════════════════════════════════════════════════
@@ -25,14 +27,25 @@ class TestNpmInstaller:
         assert cmd == "npx"
         assert args == ["-y", "@modelcontextprotocol/server-github"]
 
-    @patch("mcp_tap.installer.npm.shutil.which", return_value="/usr/local/bin/npx")
+    @patch("mcp_tap._paths.shutil.which", return_value="/usr/local/bin/npx")
     async def test_is_available_true(self, _mock_which):
         assert await NpmInstaller().is_available() is True
 
-    @patch("mcp_tap.installer.npm.shutil.which", return_value=None)
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
     async def test_is_available_false(self, _mock_which):
         assert await NpmInstaller().is_available() is False
 
+    async def test_is_available_caches_hits_only(self):
+        with patch("mcp_tap._paths.shutil.which", return_value=None) as mock_which:
+            assert await NpmInstaller().is_available() is False
+            assert await NpmInstaller().is_available() is False
+        assert mock_which.call_count == 2
+
+        with patch("mcp_tap._paths.shutil.which", return_value="/bin/npx") as mock_which:
+            assert await NpmInstaller().is_available() is True
+            assert await NpmInstaller().is_available() is True
+        mock_which.assert_called_once_with("npx")
+
     @patch("mcp_tap.installer.npm.run_command", new_callable=AsyncMock)
     async def test_install_success(self, mock_run):
         mock_run.return_value = (0, "OK", "")
@@ -41,6 +54,36 @@ class TestNpmInstaller:
         assert result.install_method == "npx"
         assert "my-package" in result.message
 
+    @patch("mcp_tap.installer.npm.run_command", new_callable=AsyncMock)
+    async def test_install_skips_npx_when_package_is_cached(self, mock_run, tmp_path, monkeypatch):
+        monkeypatch.setenv("NPM_CONFIG_CACHE", str(tmp_path))
+        digest = hashlib.sha512(b"@scope/pkg@1.2.0").hexdigest()[:16]
+        pkg_dir = tmp_path / "_npx" / digest / "node_modules" / "@scope" / "pkg"
+        pkg_dir.mkdir(parents=True)
+        (pkg_dir / "package.json").write_text("{}")
+
+        result = await NpmInstaller().install("@scope/pkg", "1.2.0")
+
+        assert result.success is True
+        mock_run.assert_not_awaited()
+
+        # A different version has its own cache entry, so npx still runs.
+        mock_run.return_value = (0, "OK", "")
+        await NpmInstaller().install("@scope/pkg", "1.3.0")
+        mock_run.assert_awaited_once()
+
+    async def test_install_many_ordered_with_failures(self):
+        async def _npx(cmd: list[str], timeout: float) -> tuple[int, str, str]:
+            return (1, "", "404") if cmd[3] == "missing" else (0, "", "")
+
+        with patch("mcp_tap.installer.npm.run_command", side_effect=_npx):
+            results = await NpmInstaller().install_many([("missing", "latest"), ("ok", "latest")])
+
+        assert [(r.package_identifier, r.success) for r in results] == [
+            ("missing", False),
+            ("ok", True),
+        ]
+
     @patch("mcp_tap.installer.npm.run_command", new_callable=AsyncMock)
     async def test_install_failure(self, mock_run):
         mock_run.return_value = (1, "", "not found")
@@ -61,6 +104,23 @@ class TestNpmInstaller:
         result = await NpmInstaller().uninstall("my-package")
         assert result.success is True
 
+    async def test_verified_package_not_rechecked_until_uninstall(self):
+        with patch(
+            "mcp_tap.installer.npm.run_command",
+            new_callable=AsyncMock,
+            return_value=(0, "", ""),
+        ) as mock_run:
+            installer = NpmInstaller()
+            assert (await installer.install("pkg", "1.0")).success is True
+            assert (await installer.install("pkg", "1.0")).success is True
+            assert mock_run.await_count == 1
+
+            await installer.install("pkg", "2.0")
+            await installer.uninstall("pkg")
+            await installer.install("pkg", "1.0")
+
+        assert mock_run.await_count == 4
+
 
 # ═══════════════════════════════════════════════════════════════════
 # PipInstaller
@@ -69,32 +129,32 @@ class TestNpmInstaller:
 
 class TestPipInstaller:
     def test_build_server_command_with_uvx(self):
-        with patch("mcp_tap.installer.pip.shutil.which", return_value="/usr/bin/uvx"):
+        with patch("mcp_tap._paths.shutil.which", return_value="/usr/bin/uvx"):
             cmd, args = PipInstaller().build_server_command("mcp-server-git")
             assert cmd == "uvx"
             assert args == ["mcp-server-git"]
 
     def test_build_server_command_without_uvx(self):
-        with patch("mcp_tap.installer.pip.shutil.which", return_value=None):
+        with patch("mcp_tap._paths.shutil.which", return_value=None):
             cmd, args = PipInstaller().build_server_command("mcp-server-git")
             assert cmd == "python"
             assert args == ["-m", "mcp-server-git"]
 
-    @patch("mcp_tap.installer.pip.shutil.which")
+    @patch("mcp_tap._paths.shutil.which")
     async def test_is_available_uvx(self, mock_which):
         mock_which.side_effect = lambda x: "/usr/bin/uvx" if x == "uvx" else None
         assert await PipInstaller().is_available() is True
 
-    @patch("mcp_tap.installer.pip.shutil.which")
+    @patch("mcp_tap._paths.shutil.which")
     async def test_is_available_pip_only(self, mock_which):
         mock_which.side_effect = lambda x: "/usr/bin/pip" if x == "pip" else None
         assert await PipInstaller().is_available() is True
 
-    @patch("mcp_tap.installer.pip.shutil.which", return_value=None)
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
     async def test_is_available_neither(self, _mock):
         assert await PipInstaller().is_available() is False
 
-    @patch("mcp_tap.installer.pip.shutil.which", return_value="/usr/bin/uvx")
+    @patch("mcp_tap._paths.shutil.which", return_value="/usr/bin/uvx")
     @patch("mcp_tap.installer.pip.run_command", new_callable=AsyncMock)
     async def test_install_via_uvx(self, mock_run, _mock_which):
         mock_run.return_value = (0, "OK", "")
@@ -102,7 +162,7 @@ class TestPipInstaller:
         assert result.success is True
         assert result.install_method == "uvx"
 
-    @patch("mcp_tap.installer.pip.shutil.which", return_value=None)
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
     @patch("mcp_tap.installer.pip.run_command", new_callable=AsyncMock)
     async def test_install_via_pip(self, mock_run, _mock_which):
         mock_run.return_value = (0, "OK", "")
@@ -110,7 +170,7 @@ class TestPipInstaller:
         assert result.success is True
         assert result.install_method == "pip install"
 
-    @patch("mcp_tap.installer.pip.shutil.which", return_value="/usr/bin/uvx")
+    @patch("mcp_tap._paths.shutil.which", return_value="/usr/bin/uvx")
     @patch("mcp_tap.installer.pip.run_command", new_callable=AsyncMock)
     async def test_install_failure(self, mock_run, _mock_which):
         mock_run.return_value = (1, "", "error: not found")
@@ -123,6 +183,57 @@ class TestPipInstaller:
         result = await PipInstaller().uninstall("mcp-server-git")
         assert result.success is True
 
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
+    async def test_install_many_single_pip_run(self, _mock_which):
+        with patch(
+            "mcp_tap.installer.pip.run_command",
+            new_callable=AsyncMock,
+            return_value=(0, "", ""),
+        ) as mock_run:
+            results = await PipInstaller().install_many([("a", "1.0"), ("b", "latest")])
+
+        mock_run.assert_awaited_once()
+        assert mock_run.call_args[0][0] == ["pip", "install", "a==1.0", "b"]
+        assert [(r.package_identifier, r.success) for r in results] == [("a", True), ("b", True)]
+
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
+    async def test_install_many_failed_batch_fails_every_package(self, _mock_which):
+        with patch(
+            "mcp_tap.installer.pip.run_command",
+            new_callable=AsyncMock,
+            return_value=(1, "", "no match"),
+        ) as mock_run:
+            results = await PipInstaller().install_many([("good", "latest"), ("bad", "latest")])
+
+        mock_run.assert_awaited_once()
+        assert [r.success for r in results] == [False, False]
+        assert all("no match" in r.message for r in results)
+
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
+    async def test_install_many_pip_run_raising_is_reported(self, _mock_which):
+        with patch(
+            "mcp_tap.installer.pip.run_command",
+            new_callable=AsyncMock,
+            side_effect=PermissionError("denied"),
+        ):
+            results = await PipInstaller().install_many([("a", "latest"), ("b", "latest")])
+
+        assert [r.success for r in results] == [False, False]
+        assert "PermissionError" in results[0].message
+
+    @patch("mcp_tap._paths.shutil.which", return_value="/bin/uvx")
+    async def test_install_many_uvx_isolates_raising_package(self, _mock_which):
+        async def _uvx(cmd: list[str], timeout: float) -> tuple[int, str, str]:
+            if cmd[1] == "bad":
+                raise OSError("boom")
+            return (0, "", "")
+
+        with patch("mcp_tap.installer.pip.run_command", side_effect=_uvx):
+            results = await PipInstaller().install_many([("bad", "latest"), ("good", "latest")])
+
+        assert [r.success for r in results] == [False, True]
+        assert results[0].install_method == "uvx"
+
 
 # ═══════════════════════════════════════════════════════════════════
 # DockerInstaller
@@ -135,11 +246,11 @@ class TestDockerInstaller:
         assert cmd == "docker"
         assert args == ["run", "-i", "--rm", "mcp/git-server"]
 
-    @patch("mcp_tap.installer.docker.shutil.which", return_value="/usr/bin/docker")
+    @patch("mcp_tap._paths.shutil.which", return_value="/usr/bin/docker")
     async def test_is_available_true(self, _mock):
         assert await DockerInstaller().is_available() is True
 
-    @patch("mcp_tap.installer.docker.shutil.which", return_value=None)
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
     async def test_is_available_false(self, _mock):
         assert await DockerInstaller().is_available() is False
 
@@ -158,6 +269,37 @@ class TestDockerInstaller:
         result = await DockerInstaller().install("bad/image")
         assert result.success is False
 
+    async def test_install_many_bounded_and_ordered(self):
+        running = peak = 0
+
+        async def _pull(cmd: list[str], timeout: float) -> tuple[int, str, str]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return (1 if cmd[2].startswith("bad") else 0, "", "")
+
+        specs = [("a", "1"), ("bad", "2"), ("c", "latest"), ("d", "4")]
+        with patch("mcp_tap.installer.docker.run_command", side_effect=_pull):
+            results = await DockerInstaller().install_many(specs, concurrency=2)
+
+        assert [r.package_identifier for r in results] == ["a", "bad", "c", "d"]
+        assert [r.success for r in results] == [True, False, True, True]
+        assert peak == 2
+
+    async def test_install_many_isolates_raising_pull(self):
+        async def _pull(cmd: list[str], timeout: float) -> tuple[int, str, str]:
+            if cmd[2].startswith("bad"):
+                raise PermissionError("docker.sock")
+            return (0, "", "")
+
+        with patch("mcp_tap.installer.docker.run_command", side_effect=_pull):
+            results = await DockerInstaller().install_many([("bad", "1"), ("ok", "1")])
+
+        assert [r.success for r in results] == [False, True]
+        assert "PermissionError" in results[0].message
+
     @patch("mcp_tap.installer.docker.run_command", new_callable=AsyncMock)
     async def test_uninstall(self, mock_run):
         mock_run.return_value = (0, "", "")
@@ -172,28 +314,28 @@ class TestDockerInstaller:
 
 
 class TestResolveInstaller:
-    @patch("mcp_tap.installer.npm.shutil.which", return_value="/usr/bin/npx")
+    @patch("mcp_tap._paths.shutil.which", return_value="/usr/bin/npx")
     async def test_resolve_npm(self, _mock):
         installer = await resolve_installer(RegistryType.NPM)
         assert isinstance(installer, NpmInstaller)
 
-    @patch("mcp_tap.installer.pip.shutil.which")
+    @patch("mcp_tap._paths.shutil.which")
     async def test_resolve_pypi(self, mock_which):
         mock_which.side_effect = lambda x: "/usr/bin/uvx" if x == "uvx" else None
         installer = await resolve_installer(RegistryType.PYPI)
         assert isinstance(installer, PipInstaller)
 
-    @patch("mcp_tap.installer.docker.shutil.which", return_value="/usr/bin/docker")
+    @patch("mcp_tap._paths.shutil.which", return_value="/usr/bin/docker")
     async def test_resolve_oci(self, _mock):
         installer = await resolve_installer(RegistryType.OCI)
         assert isinstance(installer, DockerInstaller)
 
-    @patch("mcp_tap.installer.npm.shutil.which", return_value="/usr/bin/npx")
+    @patch("mcp_tap._paths.shutil.which", return_value="/usr/bin/npx")
     async def test_resolve_from_string(self, _mock):
         installer = await resolve_installer("npm")
         assert isinstance(installer, NpmInstaller)
 
-    @patch("mcp_tap.installer.npm.shutil.which", return_value=None)
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
     async def test_unavailable_package_manager(self, _mock):
         with pytest.raises(InstallerNotFoundError, match="not installed"):
             await resolve_installer(RegistryType.NPM)
@@ -201,3 +343,21 @@ class TestResolveInstaller:
     async def test_unsupported_registry_type(self):
         with pytest.raises((InstallerNotFoundError, ValueError)):
             await resolve_installer("unknown_registry")
+
+    async def test_resolve_installers_batch(self):
+        available = {"npx": "/usr/bin/npx"}
+        with patch("shutil.which", side_effect=available.get) as mock_which:
+            installers = await resolve_installers(
+                [RegistryType.NPM, "npm", RegistryType.OCI, RegistryType.SMITHERY]
+            )
+
+        assert set(installers) == {RegistryType.NPM, RegistryType.SMITHERY}
+        assert isinstance(installers[RegistryType.NPM], NpmInstaller)
+        # NPM and SMITHERY each check npx once; the duplicate "npm" adds no probe.
+        assert [c.args[0] for c in mock_which.call_args_list].count("npx") == 2
+
+    async def test_resolve_installers_skips_unknown_types(self):
+        with patch("shutil.which", return_value="/usr/bin/npx"):
+            installers = await resolve_installers(["unknown_registry", RegistryType.NPM])
+
+        assert list(installers) == [RegistryType.NPM]
@@ -70,6 +70,13 @@ class TestReadLockfile:
         (tmp_path / "mcp-tap.lock").write_text("   \n  \n  ")
         assert read_lockfile(tmp_path) is None
 
+    def test_non_ascii_values_decoded(self, tmp_path: Path) -> None:
+        data = {"lockfile_version": 1, "generated_by": "mcp-tap ✓", "servers": {}}
+        (tmp_path / "mcp-tap.lock").write_text(json.dumps(data, ensure_ascii=False), "utf-8")
+        lockfile = read_lockfile(tmp_path)
+        assert lockfile is not None
+        assert lockfile.generated_by == "mcp-tap ✓"
+
     def test_invalid_json_raises(self, tmp_path: Path) -> None:
         (tmp_path / "mcp-tap.lock").write_text("{invalid json")
         with pytest.raises(LockfileReadError, match="Invalid JSON"):
@@ -147,6 +154,32 @@ class TestReadLockfile:
         assert srv.tools_hash is None
         assert srv.verified_healthy is False
 
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path) -> None:
+        (tmp_path / "mcp-tap.lock").write_text(json.dumps({"lockfile_version": 1, "servers": {}}))
+        first = read_lockfile(tmp_path)
+        assert read_lockfile(tmp_path) is first
+
+    def test_rewritten_file_is_reparsed(self, tmp_path: Path) -> None:
+        lock_path = tmp_path / "mcp-tap.lock"
+        lock_path.write_text(json.dumps({"lockfile_version": 1, "servers": {}}))
+        assert read_lockfile(tmp_path).servers == {}
+
+        data = {"lockfile_version": 1, "servers": {"pg": {"package_identifier": "pg"}}}
+        lock_path.write_text(json.dumps(data))
+        assert list(read_lockfile(tmp_path).servers) == ["pg"]
+
+        lock_path.unlink()
+        assert read_lockfile(tmp_path) is None
+
+    def test_write_lockfile_invalidates_cached_read(self, tmp_path: Path) -> None:
+        write_lockfile(tmp_path, Lockfile(servers={}))
+        assert read_lockfile(tmp_path).servers == {}
+
+        add_server_to_lockfile(
+            tmp_path, "pg", "pg-pkg", "npm", "1.0.0", ServerConfig(command="npx", args=["pg"])
+        )
+        assert list(read_lockfile(tmp_path).servers) == ["pg"]
+
 
 class TestParseLockfile:
     def test_version_zero_raises(self) -> None:
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from mcp_tap.config.matching import (
+    build_installed_index,
+    build_locked_index,
     find_matching_installed_server,
     find_matching_locked_server,
     installed_matches_package_identifier,
@@ -106,6 +108,41 @@ class TestFindMatchingInstalledServer:
         assert match is not None
         assert match.name == "pg-backup"
 
+    def test_index_reused_across_lockfile_entries(self) -> None:
+        installed = [
+            _installed_stdio("pg", ["-y", "@mcp/server-postgres"]),
+            _installed_http("acme", "https://mcp.acme.dev"),
+            InstalledServer(
+                name="gh",
+                config=ServerConfig(command="github-mcp", args=[]),
+                source_file="/tmp/config.json",
+            ),
+        ]
+        index = build_installed_index(installed)
+        used: set[str] = set()
+
+        for locked_name, pkg, expected in [
+            ("postgres-mcp", "@mcp/server-postgres", "pg"),
+            ("remote", "https://mcp.acme.dev", "acme"),
+            ("github", "github-mcp", "gh"),
+            ("postgres-2", "@mcp/server-postgres", None),
+        ]:
+            _, locked = _locked(locked_name, pkg)
+            match = find_matching_installed_server(locked_name, locked, index, used)
+            assert (match.name if match else None) == expected
+            if match is not None:
+                used.add(match.name)
+
+    def test_index_falls_back_to_locked_args_url(self) -> None:
+        _, locked = _locked(
+            "remote", "@acme/remote-proxy", args=["-y", "mcp-remote", "https://mcp.acme.dev"]
+        )
+        index = build_installed_index([_installed_http("acme", "https://mcp.acme.dev")])
+
+        match = find_matching_installed_server("remote", locked, index)
+        assert match is not None
+        assert match.name == "acme"
+
 
 class TestFindMatchingLockedServer:
     def test_matches_by_name(self) -> None:
@@ -123,3 +160,44 @@ class TestFindMatchingLockedServer:
         match = find_matching_locked_server(installed, {locked_name: locked})
         assert match is not None
         assert match[0] == "postgres-mcp"
+
+    def test_matches_http_url_in_locked_args(self) -> None:
+        locked_name, locked = _locked(
+            "remote", "@acme/remote-proxy", args=["-y", "mcp-remote", "https://mcp.acme.dev"]
+        )
+        other_name, other = _locked("pg", "@mcp/server-postgres")
+        installed = _installed_http("acme", "https://mcp.acme.dev")
+
+        match = find_matching_locked_server(installed, {other_name: other, locked_name: locked})
+        assert match is not None
+        assert match[0] == "remote"
+
+    def test_stdio_without_url_skips_locked_url_lookup(self) -> None:
+        locked_name, locked = _locked("remote", "https://mcp.acme.dev")
+        installed = _installed_stdio("pg", ["-y", "@mcp/server-postgres"])
+
+        assert find_matching_locked_server(installed, {locked_name: locked}) is None
+
+    def test_locked_index_prefers_earliest_entry_across_buckets(self) -> None:
+        by_url_name, by_url = _locked(
+            "remote-proxy", "@acme/proxy", args=["-y", "mcp-remote", "https://mcp.acme.dev"]
+        )
+        by_pkg_name, by_pkg = _locked("remote", "https://mcp.acme.dev")
+        index = build_locked_index({by_url_name: by_url, by_pkg_name: by_pkg})
+        installed = _installed_http("acme", "https://mcp.acme.dev")
+
+        first = find_matching_locked_server(installed, index)
+        second = find_matching_locked_server(installed, index, {"remote-proxy"})
+
+        assert first is not None and first[0] == "remote-proxy"
+        assert second is not None and second[0] == "remote"
+
+    def test_locked_index_url_identifier_needs_canonical_url(self) -> None:
+        locked_name, locked = _locked("remote", "https://b.example")
+        index = build_locked_index({locked_name: locked})
+        # Only the first URL arg is the server's canonical URL.
+        installed = _installed_stdio(
+            "proxy", ["mcp-remote", "https://a.example", "https://b.example"]
+        )
+
+        assert find_matching_locked_server(installed, index) is None
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import asdict
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -9,11 +12,15 @@ import pytest
 from mcp_tap.benchmark.production_feedback import (
     FeedbackEvent,
     ShownRecommendation,
+    _event_to_dict,
+    _now_iso,
     append_event,
+    append_events,
     build_production_report,
     emit_recommendation_decision,
     emit_recommendations_shown,
     load_feedback_events,
+    project_fingerprint,
     validate_event,
 )
 
@@ -75,6 +82,32 @@ class TestEventValidation:
         with pytest.raises(ValueError, match="requires recommendations"):
             validate_event(event)
 
+    def test_shown_ranks_may_arrive_out_of_order(self) -> None:
+        event = _shown_event(
+            query_id="q1",
+            release_version="0.6.7",
+            recs=(("datadog", 2), ("sentry", 1), ("vercel", 3)),
+        )
+        validate_event(event)
+
+    def test_shown_ranks_must_be_contiguous(self) -> None:
+        event = _shown_event(
+            query_id="q1",
+            release_version="0.6.7",
+            recs=(("sentry", 1), ("datadog", 3)),
+        )
+        with pytest.raises(ValueError, match="contiguous"):
+            validate_event(event)
+
+    def test_shown_ranks_must_be_positive(self) -> None:
+        event = _shown_event(
+            query_id="q1",
+            release_version="0.6.7",
+            recs=(("sentry", 0), ("datadog", 1)),
+        )
+        with pytest.raises(ValueError, match="must be > 0"):
+            validate_event(event)
+
     def test_decision_requires_server_name(self) -> None:
         event = FeedbackEvent(
             event_type="recommendation_accepted",
@@ -90,6 +123,51 @@ class TestEventValidation:
             validate_event(event)
 
 
+class TestProjectFingerprint:
+    def test_fingerprint_is_stable_and_hides_path(self, tmp_path: Path) -> None:
+        project = str(tmp_path / "project-a")
+        fingerprint = project_fingerprint(project)
+        assert fingerprint == project_fingerprint(project)
+        assert len(fingerprint) == 16
+        assert "project-a" not in fingerprint
+
+    def test_same_resolved_path_shares_fingerprint(self, tmp_path: Path) -> None:
+        direct = str(tmp_path / "project-a")
+        indirect = str(tmp_path / "other" / ".." / "project-a")
+        assert project_fingerprint(direct) == project_fingerprint(indirect)
+
+
+class TestTimestamps:
+    def test_now_iso_is_parseable_utc_with_microseconds(self) -> None:
+        before = datetime.now(UTC)
+        stamp = _now_iso()
+        after = datetime.now(UTC)
+
+        parsed = datetime.fromisoformat(stamp)
+        assert stamp.endswith("+00:00")
+        assert len(stamp.split(".")[1]) == len("000000+00:00")
+        assert before - timedelta(seconds=1) <= parsed <= after + timedelta(seconds=1)
+
+
+class TestEventSerialization:
+    def test_event_to_dict_matches_asdict(self) -> None:
+        event = FeedbackEvent(
+            event_type="recommendations_shown",
+            event_id="evt-1",
+            timestamp="2026-02-24T00:00:00+00:00",
+            release_version="0.6.7",
+            query_id="q1",
+            project_fingerprint="abc123abc123abcd",
+            client="claude_code",
+            recommendations=(
+                ShownRecommendation(server_name="sentry", rank=1, source="registry"),
+                ShownRecommendation(server_name="vercel", rank=2, intent_gate_applied=True),
+            ),
+            metadata={"surface": "scan"},
+        )
+        assert json.dumps(_event_to_dict(event)) == json.dumps(asdict(event))
+
+
 class TestEventEmission:
     def test_append_event_requires_opt_in(self, tmp_path: Path) -> None:
         path = tmp_path / "events.jsonl"
@@ -109,6 +187,49 @@ class TestEventEmission:
         assert persisted is False
         assert not path.exists()
 
+    def test_append_events_writes_batch_in_order(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        env = {
+            "MCP_TAP_TELEMETRY_OPT_IN": "true",
+            "MCP_TAP_TELEMETRY_FILE": str(path),
+        }
+        batch = [
+            _shown_event(query_id="q1", release_version="0.6.7", recs=(("sentry", 1),)),
+            _decision_event(
+                event_type="recommendation_accepted",
+                query_id="q1",
+                server_name="sentry",
+                release_version="0.6.7",
+                rank=1,
+            ),
+        ]
+
+        assert append_events(batch, env=env) == 2
+
+        events = load_feedback_events(path)
+        assert [e.event_type for e in events] == [
+            "recommendations_shown",
+            "recommendation_accepted",
+        ]
+
+    def test_append_events_rejects_invalid_batch_without_writing(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        env = {
+            "MCP_TAP_TELEMETRY_OPT_IN": "true",
+            "MCP_TAP_TELEMETRY_FILE": str(path),
+        }
+        valid = _shown_event(query_id="q1", release_version="0.6.7", recs=(("sentry", 1),))
+        invalid = _decision_event(
+            event_type="recommendation_accepted",
+            query_id="q1",
+            server_name="",
+            release_version="0.6.7",
+        )
+
+        with pytest.raises(ValueError, match="requires server_name"):
+            append_events([valid, invalid], env=env)
+        assert not path.exists()
+
     def test_emit_shown_and_decision_persist_when_enabled(self, tmp_path: Path) -> None:
         path = tmp_path / "events.jsonl"
         env = {
@@ -142,6 +263,34 @@ class TestEventEmission:
         assert events[1].query_id == query_id
 
 
+class TestLoadFeedbackEvents:
+    def test_strict_mode_reports_line_number(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        path.write_text('{"event_type": "recommendations_shown"}\n\nnot json\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="line 1"):
+            load_feedback_events(path)
+
+    def test_non_strict_mode_skips_invalid_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "events.jsonl"
+        env = {
+            "MCP_TAP_TELEMETRY_OPT_IN": "true",
+            "MCP_TAP_TELEMETRY_FILE": str(path),
+        }
+        append_event(
+            _shown_event(query_id="q1", release_version="0.6.7", recs=(("sentry", 1),)),
+            env=env,
+        )
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write("\nnot json\n[1, 2]\n")
+
+        events = load_feedback_events(path, strict=False)
+
+        assert [e.query_id for e in events] == ["q1"]
+
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        assert load_feedback_events(tmp_path / "missing.jsonl") == []
+
+
 class TestProductionReport:
     def test_report_metrics_and_version_drift_detection(self) -> None:
         events = [
@@ -217,3 +366,26 @@ class TestProductionReport:
         assert report.release_trends[1].acceptance_at_k == 0.5
         assert report.status == "fail"
         assert report.failures
+
+    def test_queries_without_decisions_count_toward_version_totals(self) -> None:
+        events = [
+            _shown_event(query_id="q1", release_version="0.6.6", recs=(("sentry", 1),)),
+            _decision_event(
+                event_type="recommendation_accepted",
+                query_id="q1",
+                server_name="sentry",
+                release_version="0.6.6",
+                rank=1,
+            ),
+            _shown_event(query_id="q2", release_version="0.6.6", recs=(("sentry", 1),)),
+            _shown_event(query_id="q3", release_version="0.6.10", recs=(("sentry", 1),)),
+        ]
+
+        report = build_production_report(events, top_k=1)
+
+        assert report.query_count == 3
+        assert report.acceptance_at_k == 0.3333
+        assert [t.release_version for t in report.release_trends] == ["0.6.6", "0.6.10"]
+        assert [t.query_count for t in report.release_trends] == [2, 1]
+        assert report.release_trends[0].acceptance_at_k == 0.5
+        assert report.release_trends[1].acceptance_at_k == 0.0
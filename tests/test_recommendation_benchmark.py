@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 from mcp_tap.benchmark.recommendation import (
     BenchmarkCase,
+    CaseResult,
     build_report,
     default_dataset_path,
     evaluate_case,
@@ -46,6 +48,24 @@ class TestEvaluateCase:
         assert result.accepted_top_1 is True
         assert result.hit_count == 2
 
+    def test_case_precomputes_expected_set(self) -> None:
+        case = BenchmarkCase(
+            name="set",
+            project_path="a",
+            client=MCPClient.CLAUDE_CODE,
+            expected_servers=("postgres-mcp", "redis-mcp", "postgres-mcp"),
+            top_k=2,
+        )
+
+        assert case.expected_set == frozenset({"postgres-mcp", "redis-mcp"})
+        assert case == BenchmarkCase(
+            name="set",
+            project_path="a",
+            client=MCPClient.CLAUDE_CODE,
+            expected_servers=("postgres-mcp", "redis-mcp", "postgres-mcp"),
+            top_k=2,
+        )
+
     def test_empty_expected_with_no_recommendations_scores_perfect(self) -> None:
         case = BenchmarkCase(
             name="empty-expected",
@@ -108,6 +128,35 @@ class TestBuildReport:
         assert report.passed is False
         assert report.failures
 
+    def test_report_aggregates_acceptance_and_coverage(self) -> None:
+        def _case(name: str, expected: tuple[str, ...], actual: list[str]) -> CaseResult:
+            return evaluate_case(
+                actual,
+                BenchmarkCase(
+                    name=name,
+                    project_path=name,
+                    client=MCPClient.CLAUDE_CODE,
+                    expected_servers=expected,
+                    top_k=2,
+                ),
+            )
+
+        report = build_report(
+            dataset="test",
+            case_results=[
+                _case("hit", ("a",), ["a", "b"]),
+                _case("second", ("b",), ["a", "b"]),
+                _case("miss", ("c",), ["a", "b"]),
+                _case("none-expected", (), []),
+            ],
+            min_precision=0.0,
+            min_acceptance=0.0,
+        )
+
+        assert report.precision_at_k == 0.5
+        assert report.acceptance_rate == 0.3333
+        assert report.coverage_at_k == 0.6667
+
 
 class TestRunBenchmark:
     @patch("mcp_tap.benchmark.recommendation.scan_project")
@@ -157,6 +206,67 @@ class TestRunBenchmark:
         assert report.precision_at_k == 1.0
         assert report.acceptance_rate == 1.0
 
+    @patch("mcp_tap.benchmark.recommendation.scan_project")
+    async def test_concurrent_scans_keep_dataset_order(
+        self, mock_scan: AsyncMock, tmp_path: Path
+    ) -> None:
+        names = ["slow", "medium", "fast"]
+        data = {
+            "name": "ordering",
+            "top_k": 1,
+            "cases": [
+                {"name": name, "project_path": name, "expected_servers": [f"{name}-mcp"]}
+                for name in names
+            ],
+        }
+        dataset_path = tmp_path / "dataset.json"
+        dataset_path.write_text(json.dumps(data), encoding="utf-8")
+        delays = {"slow": 0.03, "medium": 0.02, "fast": 0.0}
+
+        async def _scan_side_effect(path: str, client: MCPClient | None = None) -> ProjectProfile:
+            name = Path(path).name
+            await asyncio.sleep(delays[name])
+            return _profile(path, [f"{name}-mcp"])
+
+        mock_scan.side_effect = _scan_side_effect
+
+        report = await run_benchmark(dataset_path=dataset_path, project_root=tmp_path)
+
+        assert [case.name for case in report.cases] == names
+        assert [case.actual_top_k for case in report.cases] == [
+            ("slow-mcp",),
+            ("medium-mcp",),
+            ("fast-mcp",),
+        ]
+
+    @patch("mcp_tap.benchmark.recommendation.scan_project")
+    async def test_cases_sharing_a_project_scan_it_once(
+        self, mock_scan: AsyncMock, tmp_path: Path
+    ) -> None:
+        data = {
+            "name": "shared",
+            "cases": [
+                {"name": "top-1", "project_path": "proj", "top_k": 1, "expected_servers": ["a"]},
+                {"name": "top-2", "project_path": "proj", "top_k": 2, "expected_servers": ["a"]},
+                {
+                    "name": "other-client",
+                    "project_path": "proj",
+                    "client": "cursor",
+                    "expected_servers": ["a"],
+                },
+            ],
+        }
+        dataset_path = tmp_path / "dataset.json"
+        dataset_path.write_text(json.dumps(data), encoding="utf-8")
+        mock_scan.return_value = _profile(str(tmp_path / "proj"), ["a", "b"])
+
+        report = await run_benchmark(dataset_path=dataset_path, project_root=tmp_path)
+
+        assert report.case_count == 3
+        assert mock_scan.await_count == 2
+        scanned_clients = {call.kwargs["client"] for call in mock_scan.await_args_list}
+        assert scanned_clients == {MCPClient.CLAUDE_CODE, MCPClient.CURSOR}
+
 
 class TestDatasetLoading:
     def test_default_dataset_exists_and_loads(self) -> None:
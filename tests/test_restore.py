@@ -5,6 +5,8 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from mcp_tap.errors import InstallerNotFoundError, LockfileReadError, McpTapError
+from mcp_tap.installer.docker import DockerInstaller
+from mcp_tap.installer.pip import PipInstaller
 from mcp_tap.models import (
     ConfigLocation,
     ConnectionTestResult,
@@ -15,6 +17,7 @@ from mcp_tap.models import (
     LockedServer,
     Lockfile,
     MCPClient,
+    RegistryType,
     ServerConfig,
 )
 from mcp_tap.server import AppContext
@@ -850,6 +853,162 @@ class TestMultipleServers:
         assert result["restored"] == 0
         assert result["failed"] == 2
 
+    @patch(_P_WRITE_CONFIG)
+    @patch(_P_RESOLVE_LOCATIONS)
+    @patch(_P_READ_LOCKFILE)
+    async def test_docker_images_pulled_together(
+        self,
+        mock_read: MagicMock,
+        mock_resolve_loc: MagicMock,
+        mock_write: MagicMock,
+    ) -> None:
+        """Several image servers should be pulled up front, once each."""
+        mock_read.return_value = _lockfile_with_servers(
+            a=_locked_server(package_identifier="ghcr.io/a", registry_type="oci"),
+            b=_locked_server(package_identifier="ghcr.io/b", registry_type="oci"),
+            c=_locked_server(),
+        )
+        mock_resolve_loc.return_value = [_fake_location()]
+        npm_installer = _mock_installer()
+
+        installer_resolver = AsyncMock()
+        installer_resolver.resolve_installer = AsyncMock(return_value=npm_installer)
+        installer_resolver.resolve_installers = AsyncMock(
+            return_value={RegistryType.OCI: DockerInstaller()}
+        )
+        connection_tester = AsyncMock()
+        connection_tester.test_server_connection = AsyncMock(return_value=_connection_result())
+        ctx = _make_ctx(
+            installer_resolver=installer_resolver,
+            connection_tester=connection_tester,
+        )
+
+        with patch(
+            "mcp_tap.installer.docker.run_command",
+            new_callable=AsyncMock,
+            return_value=(0, "", ""),
+        ) as mock_run:
+            result = await restore("/my/project", ctx)
+
+        assert result["restored"] == 3
+        assert sorted(call.args[0][2] for call in mock_run.call_args_list) == [
+            "ghcr.io/a:1.0.0",
+            "ghcr.io/b:1.0.0",
+        ]
+        npm_installer.install.assert_awaited_once_with("test-pkg", "1.0.0")
+
+    @patch(_P_WRITE_CONFIG)
+    @patch(_P_RESOLVE_LOCATIONS)
+    @patch(_P_READ_LOCKFILE)
+    async def test_python_packages_installed_in_one_pip_run(
+        self,
+        mock_read: MagicMock,
+        mock_resolve_loc: MagicMock,
+        mock_write: MagicMock,
+    ) -> None:
+        """Several PyPI servers should share a single pip install."""
+        mock_read.return_value = _lockfile_with_servers(
+            a=_locked_server(package_identifier="mcp-a", registry_type="pypi"),
+            b=_locked_server(package_identifier="mcp-b", registry_type="pypi"),
+        )
+        mock_resolve_loc.return_value = [_fake_location()]
+        installer_resolver = AsyncMock()
+        installer_resolver.resolve_installers = AsyncMock(
+            return_value={RegistryType.PYPI: PipInstaller()}
+        )
+        connection_tester = AsyncMock()
+        connection_tester.test_server_connection = AsyncMock(return_value=_connection_result())
+        ctx = _make_ctx(
+            installer_resolver=installer_resolver,
+            connection_tester=connection_tester,
+        )
+
+        with (
+            patch("mcp_tap._paths.shutil.which", return_value=None),
+            patch(
+                "mcp_tap.installer.pip.run_command",
+                new_callable=AsyncMock,
+                return_value=(0, "", ""),
+            ) as mock_run,
+        ):
+            result = await restore("/my/project", ctx)
+
+        assert result["restored"] == 2
+        mock_run.assert_awaited_once()
+        assert mock_run.call_args[0][0] == ["pip", "install", "mcp-a==1.0.0", "mcp-b==1.0.0"]
+        installer_resolver.resolve_installers.assert_awaited_once()
+        assert list(installer_resolver.resolve_installers.call_args.args[0]) == [RegistryType.PYPI]
+
+    @patch(_P_WRITE_CONFIG)
+    @patch(_P_RESOLVE_LOCATIONS)
+    @patch(_P_READ_LOCKFILE)
+    async def test_raising_batch_falls_back_to_per_server_install(
+        self,
+        mock_read: MagicMock,
+        mock_resolve_loc: MagicMock,
+        mock_write: MagicMock,
+    ) -> None:
+        """A batch that raises should not fail the restore; each server installs itself."""
+        mock_read.return_value = _lockfile_with_servers(
+            a=_locked_server(package_identifier="ghcr.io/a", registry_type="oci"),
+            b=_locked_server(package_identifier="ghcr.io/b", registry_type="oci"),
+        )
+        mock_resolve_loc.return_value = [_fake_location()]
+        installer = _mock_installer()
+        installer.install_many = AsyncMock(side_effect=PermissionError("docker.sock"))
+        installer_resolver = AsyncMock()
+        installer_resolver.resolve_installer = AsyncMock(return_value=installer)
+        installer_resolver.resolve_installers = AsyncMock(
+            return_value={RegistryType.OCI: installer}
+        )
+        connection_tester = AsyncMock()
+        connection_tester.test_server_connection = AsyncMock(return_value=_connection_result())
+        ctx = _make_ctx(
+            installer_resolver=installer_resolver,
+            connection_tester=connection_tester,
+        )
+
+        result = await restore("/my/project", ctx)
+
+        assert result["restored"] == 2
+        assert installer.install.await_count == 2
+
+    @patch(_P_WRITE_CONFIG)
+    @patch(_P_RESOLVE_LOCATIONS)
+    @patch(_P_READ_LOCKFILE)
+    async def test_failed_batch_entry_is_reinstalled_alone(
+        self,
+        mock_read: MagicMock,
+        mock_resolve_loc: MagicMock,
+        mock_write: MagicMock,
+    ) -> None:
+        """Only the servers whose batch install failed go through install() again."""
+        mock_read.return_value = _lockfile_with_servers(
+            a=_locked_server(package_identifier="mcp-a", registry_type="pypi"),
+            b=_locked_server(package_identifier="mcp-b", registry_type="pypi"),
+        )
+        mock_resolve_loc.return_value = [_fake_location()]
+        installer = _mock_installer(_install_result(success=False))
+        installer.install_many = AsyncMock(
+            return_value=[_install_result(), _install_result(success=False)]
+        )
+        installer_resolver = AsyncMock()
+        installer_resolver.resolve_installer = AsyncMock(return_value=installer)
+        installer_resolver.resolve_installers = AsyncMock(
+            return_value={RegistryType.PYPI: installer}
+        )
+        connection_tester = AsyncMock()
+        connection_tester.test_server_connection = AsyncMock(return_value=_connection_result())
+        ctx = _make_ctx(
+            installer_resolver=installer_resolver,
+            connection_tester=connection_tester,
+        )
+
+        result = await restore("/my/project", ctx)
+
+        assert result["restored"] == 1
+        installer.install.assert_awaited_once_with("mcp-b", "1.0.0")
+
 
 # === Validation failure =====================================================
 
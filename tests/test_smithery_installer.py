@@ -14,13 +14,13 @@ from mcp_tap.installer.smithery import SmitheryInstaller
 class TestSmitheryInstallerAvailability:
     """Tests for SmitheryInstaller.is_available."""
 
-    @patch("mcp_tap.installer.smithery.shutil.which", return_value="/usr/local/bin/npx")
+    @patch("mcp_tap._paths.shutil.which", return_value="/usr/local/bin/npx")
     async def test_is_available_when_npx_found(self, _mock_which):
         """Should return True when npx is found on PATH."""
         installer = SmitheryInstaller()
         assert await installer.is_available() is True
 
-    @patch("mcp_tap.installer.smithery.shutil.which", return_value=None)
+    @patch("mcp_tap._paths.shutil.which", return_value=None)
     async def test_not_available_when_npx_missing(self, _mock_which):
         """Should return False when npx is not found on PATH."""
         installer = SmitheryInstaller()
@@ -2,11 +2,50 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import signal
+import sys
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from mcp_tap.installer.subprocess import run_command
 
+
+def _fake_proc(stdout: bytes, stderr: bytes, *, returncode: int | None = 0) -> MagicMock:
+    """Build a finished process whose pipes hold *stdout* and *stderr*."""
+    proc = MagicMock()
+    proc.returncode = returncode
+    proc.wait = AsyncMock(return_value=returncode)
+    proc.stdout = asyncio.StreamReader()
+    proc.stdout.feed_data(stdout)
+    proc.stdout.feed_eof()
+    proc.stderr = asyncio.StreamReader()
+    proc.stderr.feed_data(stderr)
+    proc.stderr.feed_eof()
+    return proc
+
+
+def _hung_proc(*, pid: int) -> MagicMock:
+    """Build a process whose pipes never reach EOF."""
+    proc = MagicMock()
+    proc.pid = pid
+    proc.wait = AsyncMock()
+    proc.stdout = asyncio.StreamReader()
+    proc.stderr = asyncio.StreamReader()
+    return proc
+
+
+async def _expire(aw: asyncio.Future[object], timeout: float) -> object:
+    """Stand-in for asyncio.wait_for whose deadline has already passed."""
+    aw.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await aw
+    raise TimeoutError
+
+
 # === Normal execution ========================================================
 
 
@@ -15,9 +54,7 @@ class TestRunCommandNormal:
 
     async def test_returns_exit_code_stdout_stderr(self):
         """Should return (returncode, stdout, stderr) on normal completion."""
-        proc = AsyncMock()
-        proc.returncode = 0
-        proc.communicate = AsyncMock(return_value=(b"hello", b""))
+        proc = _fake_proc(b"hello", b"", returncode=0)
 
         with patch(
             "mcp_tap.installer.subprocess.asyncio.create_subprocess_exec",
@@ -31,9 +68,7 @@ class TestRunCommandNormal:
 
     async def test_start_new_session_is_passed(self):
         """Should pass start_new_session=True to create_subprocess_exec."""
-        proc = AsyncMock()
-        proc.returncode = 0
-        proc.communicate = AsyncMock(return_value=(b"ok", b""))
+        proc = _fake_proc(b"ok", b"", returncode=0)
 
         with patch(
             "mcp_tap.installer.subprocess.asyncio.create_subprocess_exec",
@@ -46,9 +81,7 @@ class TestRunCommandNormal:
 
     async def test_nonzero_exit_code_returned(self):
         """Should return the actual nonzero exit code from the process."""
-        proc = AsyncMock()
-        proc.returncode = 42
-        proc.communicate = AsyncMock(return_value=(b"", b"error"))
+        proc = _fake_proc(b"", b"error", returncode=42)
 
         with patch(
             "mcp_tap.installer.subprocess.asyncio.create_subprocess_exec",
@@ -61,9 +94,7 @@ class TestRunCommandNormal:
 
     async def test_none_returncode_treated_as_zero(self):
         """Should treat None returncode as 0 (proc.returncode or 0)."""
-        proc = AsyncMock()
-        proc.returncode = None
-        proc.communicate = AsyncMock(return_value=(b"ok", b""))
+        proc = _fake_proc(b"ok", b"", returncode=None)
 
         with patch(
             "mcp_tap.installer.subprocess.asyncio.create_subprocess_exec",
@@ -76,9 +107,7 @@ class TestRunCommandNormal:
     async def test_output_truncated_to_limit(self):
         """Should truncate stdout and stderr to _OUTPUT_LIMIT (2000) chars."""
         big_output = b"x" * 5000
-        proc = AsyncMock()
-        proc.returncode = 0
-        proc.communicate = AsyncMock(return_value=(big_output, big_output))
+        proc = _fake_proc(big_output, big_output, returncode=0)
 
         with patch(
             "mcp_tap.installer.subprocess.asyncio.create_subprocess_exec",
@@ -89,11 +118,32 @@ class TestRunCommandNormal:
         assert len(out) == 2000
         assert len(err) == 2000
 
+    async def test_large_output_drained_but_not_kept(self):
+        """Output far past the limit should be read to EOF without being buffered."""
+        proc = _fake_proc(b"y" * 1_000_000, b"", returncode=0)
+
+        with patch(
+            "mcp_tap.installer.subprocess.asyncio.create_subprocess_exec",
+            return_value=proc,
+        ):
+            _, out, _ = await run_command(["chatty"])
+
+        assert out == "y" * 2000
+        assert proc.stdout.at_eof()
+
+    async def test_real_process_with_output_past_pipe_buffer(self):
+        """A child writing more than a pipe holds should still finish."""
+        code, out, err = await run_command(
+            [sys.executable, "-c", "import sys; sys.stdout.write('z' * 500_000); sys.exit(3)"]
+        )
+
+        assert code == 3
+        assert out == "z" * 2000
+        assert err == ""
+
     async def test_env_passed_to_subprocess(self):
         """Should pass env dict to create_subprocess_exec."""
-        proc = AsyncMock()
-        proc.returncode = 0
-        proc.communicate = AsyncMock(return_value=(b"", b""))
+        proc = _fake_proc(b"", b"", returncode=0)
         custom_env = {"PATH": "/usr/bin", "MY_VAR": "value"}
 
         with patch(
@@ -108,9 +158,7 @@ class TestRunCommandNormal:
     async def test_decode_errors_replaced(self):
         """Should decode with errors='replace' for invalid UTF-8."""
         bad_bytes = b"hello \xff world"
-        proc = AsyncMock()
-        proc.returncode = 0
-        proc.communicate = AsyncMock(return_value=(bad_bytes, b""))
+        proc = _fake_proc(bad_bytes, b"", returncode=0)
 
         with patch(
             "mcp_tap.installer.subprocess.asyncio.create_subprocess_exec",
@@ -129,13 +177,14 @@ class TestRunCommandNormal:
 class TestRunCommandTimeout:
     """Tests for timeout behavior and process group killing."""
 
+    @pytest.fixture(autouse=True)
+    def _expired_deadline(self) -> Iterator[None]:
+        with patch("mcp_tap.installer.subprocess.asyncio.wait_for", side_effect=_expire):
+            yield
+
     async def test_timeout_returns_negative_one_with_message(self):
         """Should return (-1, '', timeout message) when command times out."""
-        proc = AsyncMock()
-        proc.pid = 12345
-        proc.communicate = AsyncMock(side_effect=TimeoutError)
-        proc.wait = AsyncMock()
-        proc.kill = MagicMock()
+        proc = _hung_proc(pid=12345)
 
         with (
             patch(
@@ -143,7 +192,6 @@ class TestRunCommandTimeout:
                 return_value=proc,
             ),
             patch("mcp_tap.installer.subprocess.os.killpg"),
-            patch("mcp_tap.installer.subprocess.os.getpgid", return_value=12345),
         ):
             code, out, err = await run_command(["slow"], timeout=5.0)
 
@@ -153,11 +201,7 @@ class TestRunCommandTimeout:
 
     async def test_timeout_calls_killpg_with_sigkill(self):
         """Should call os.killpg with SIGKILL on timeout."""
-        proc = AsyncMock()
-        proc.pid = 99
-        proc.communicate = AsyncMock(side_effect=TimeoutError)
-        proc.wait = AsyncMock()
-        proc.kill = MagicMock()
+        proc = _hung_proc(pid=99)
 
         with (
             patch(
@@ -165,19 +209,14 @@ class TestRunCommandTimeout:
                 return_value=proc,
             ),
             patch("mcp_tap.installer.subprocess.os.killpg") as mock_killpg,
-            patch("mcp_tap.installer.subprocess.os.getpgid", return_value=999),
         ):
             await run_command(["slow"], timeout=1.0)
 
-        mock_killpg.assert_called_once_with(999, signal.SIGKILL)
+        mock_killpg.assert_called_once_with(99, signal.SIGKILL)
 
     async def test_timeout_falls_back_to_proc_kill_on_process_lookup_error(self):
         """Should fall back to proc.kill() when killpg raises ProcessLookupError."""
-        proc = AsyncMock()
-        proc.pid = 99
-        proc.communicate = AsyncMock(side_effect=TimeoutError)
-        proc.wait = AsyncMock()
-        proc.kill = MagicMock()
+        proc = _hung_proc(pid=99)
 
         with (
             patch(
@@ -188,7 +227,6 @@ class TestRunCommandTimeout:
                 "mcp_tap.installer.subprocess.os.killpg",
                 side_effect=ProcessLookupError("No such process"),
             ),
-            patch("mcp_tap.installer.subprocess.os.getpgid", return_value=999),
         ):
             code, _, _err = await run_command(["slow"], timeout=1.0)
 
@@ -197,11 +235,7 @@ class TestRunCommandTimeout:
 
     async def test_timeout_falls_back_to_proc_kill_on_oserror(self):
         """Should fall back to proc.kill() when killpg raises OSError."""
-        proc = AsyncMock()
-        proc.pid = 99
-        proc.communicate = AsyncMock(side_effect=TimeoutError)
-        proc.wait = AsyncMock()
-        proc.kill = MagicMock()
+        proc = _hung_proc(pid=99)
 
         with (
             patch(
@@ -212,7 +246,6 @@ class TestRunCommandTimeout:
                 "mcp_tap.installer.subprocess.os.killpg",
                 side_effect=OSError("Operation not permitted"),
             ),
-            patch("mcp_tap.installer.subprocess.os.getpgid", return_value=999),
         ):
             code, _, _err = await run_command(["slow"], timeout=1.0)
 
@@ -221,11 +254,7 @@ class TestRunCommandTimeout:
 
     async def test_timeout_calls_proc_wait_after_kill(self):
         """Should call proc.wait() after killing process on timeout."""
-        proc = AsyncMock()
-        proc.pid = 99
-        proc.communicate = AsyncMock(side_effect=TimeoutError)
-        proc.wait = AsyncMock()
-        proc.kill = MagicMock()
+        proc = _hung_proc(pid=99)
 
         with (
             patch(
@@ -233,7 +262,6 @@ class TestRunCommandTimeout:
                 return_value=proc,
             ),
             patch("mcp_tap.installer.subprocess.os.killpg"),
-            patch("mcp_tap.installer.subprocess.os.getpgid", return_value=999),
         ):
             await run_command(["slow"], timeout=1.0)
 
@@ -241,11 +269,7 @@ class TestRunCommandTimeout:
 
     async def test_timeout_message_includes_duration(self):
         """Should include the actual timeout duration in the error message."""
-        proc = AsyncMock()
-        proc.pid = 99
-        proc.communicate = AsyncMock(side_effect=TimeoutError)
-        proc.wait = AsyncMock()
-        proc.kill = MagicMock()
+        proc = _hung_proc(pid=99)
 
         with (
             patch(
@@ -253,8 +277,18 @@ class TestRunCommandTimeout:
                 return_value=proc,
             ),
             patch("mcp_tap.installer.subprocess.os.killpg"),
-            patch("mcp_tap.installer.subprocess.os.getpgid", return_value=999),
         ):
             _, _, err = await run_command(["slow"], timeout=30.0)
 
         assert "30.0s" in err
+
+
+class TestRunCommandRealTimeout:
+    """Timeout against a real process group."""
+
+    async def test_timeout_kills_whole_group(self):
+        """A child that spawned its own children should still be killed on timeout."""
+        code, _, err = await run_command(["sh", "-c", "sleep 30 & sleep 30"], timeout=0.2)
+
+        assert code == -1
+        assert "timed out after 0.2s" in err
@@ -44,8 +44,8 @@ def _make_ctx() -> MagicMock:
     app = MagicMock(spec=AppContext)
     app.registry = MagicMock()
     app.github_metadata = MagicMock()
-    # Default: fetch_repo_metadata returns None (no maturity data)
-    app.github_metadata.fetch_repo_metadata = AsyncMock(return_value=None)
+    # Default: no maturity data for any repository
+    app.github_metadata.fetch_repos_metadata = AsyncMock(return_value={})
     ctx.request_context.lifespan_context = app
     return ctx
 
@@ -779,12 +779,13 @@ class TestSearchMaturityDegradation:
                 )
             ]
         )
-        ctx.request_context.lifespan_context.github_metadata.fetch_repo_metadata = AsyncMock(
-            return_value=None
+        ctx.request_context.lifespan_context.github_metadata.fetch_repos_metadata = AsyncMock(
+            return_value={"https://github.com/example/server": None}
         )
 
         with patch(
             "mcp_tap.tools.search.github_runtime_status",
+            new_callable=AsyncMock,
             return_value={
                 "has_auth": False,
                 "auth_source": "none",
@@ -826,12 +827,17 @@ class TestSearchMaturityDegradation:
                 )
             ]
         )
-        ctx.request_context.lifespan_context.github_metadata.fetch_repo_metadata = AsyncMock(
-            return_value=MaturitySignals(stars=10, last_commit_date="2026-02-20T00:00:00Z")
+        ctx.request_context.lifespan_context.github_metadata.fetch_repos_metadata = AsyncMock(
+            return_value={
+                "https://github.com/example/server": MaturitySignals(
+                    stars=10, last_commit_date="2026-02-20T00:00:00Z"
+                )
+            }
         )
 
         with patch(
             "mcp_tap.tools.search.github_runtime_status",
+            new_callable=AsyncMock,
             return_value={
                 "has_auth": True,
                 "auth_source": "env",
@@ -5,6 +5,8 @@ from __future__ import annotations
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as distribution_version
 
+import pytest
+
 import mcp_tap
 
 
@@ -21,3 +23,24 @@ class TestRuntimeVersion:
         monkeypatch.setattr(mcp_tap, "_distribution_version", _raise_package_not_found)
 
         assert mcp_tap._resolve_version() == mcp_tap._LOCAL_VERSION_FALLBACK
+
+    def test_version_is_resolved_lazily_and_cached(self, monkeypatch):
+        # Resolve first so monkeypatch has a value to put back; deleting a
+        # missing key records no undo and the fake version would stay cached.
+        _ = mcp_tap.__version__
+        monkeypatch.delitem(vars(mcp_tap), "__version__")
+        calls: list[str] = []
+
+        def _fake_version(name: str) -> str:
+            calls.append(name)
+            return "9.9.9"
+
+        monkeypatch.setattr(mcp_tap, "_distribution_version", _fake_version)
+
+        assert mcp_tap.__version__ == "9.9.9"
+        assert mcp_tap.__version__ == "9.9.9"
+        assert calls == ["mcp-tap"]
+
+    def test_unknown_module_attribute_raises(self):
+        with pytest.raises(AttributeError, match="no_such_attribute"):
+            _ = mcp_tap.no_such_attribute